@@ -0,0 +1,105 @@
+"""
+Compact response mode (``?compact=1``).
+
+Full responses repeat each champion's display name and Data Dragon image
+URL in every row. In compact mode, champions are referenced by their
+integer catalog id (see GET /api/meta/champions, which the frontend
+fetches once and caches):
+
+- a row carrying ``image_url`` (recommendation, champion list, synergy,
+  matchup and pattern rows) loses its name field and the fields the
+  dictionary already has (image URL, primary role, tags), and gains
+  ``champion_id``;
+- champion-keyed maps (team pick/ban counts, player pools, win deltas) are
+  re-keyed by id.
+
+Champions outside the catalog keep their name (and URL) so nothing is lost.
+Responses are transformed once when built; cached endpoints store the
+compact body under its own query-string key.
+"""
+from typing import Any
+
+from draftmind.config import CHAMPION_IMAGE_URL, DATA_DRAGON_VERSION
+from draftmind.core.champion_catalog import CATALOG
+
+# Field holding the champion name in a row, in order of precedence
+NAME_FIELDS = ("champion_name", "champion", "name")
+
+# Row fields the champion dictionary already carries
+CATALOG_FIELDS = frozenset({"image_url", "primary_role", "tags"})
+
+# Maps keyed by champion name; player_pools is keyed by player, then champion
+CHAMPION_KEYED_FIELDS = frozenset({
+    "champion_picks", "champion_bans_by", "champion_bans_against",
+    "first_pick_blue", "first_pick_red", "first_ban_blue", "first_ban_red",
+    "win_deltas",
+})
+NESTED_CHAMPION_KEYED_FIELDS = frozenset({"player_pools"})
+
+
+def _id_of(name: str) -> int | None:
+    entry = CATALOG.get(name)
+    return entry.id if entry is not None and entry.name == name else None
+
+
+def _rekey(mapping: dict) -> dict:
+    out = {}
+    for name, value in mapping.items():
+        champion_id = _id_of(name)
+        out[name if champion_id is None else str(champion_id)] = compact_payload(value)
+    return out
+
+
+def _compact_row(row: dict) -> dict:
+    field = next((f for f in NAME_FIELDS if isinstance(row.get(f), str)), None)
+    champion_id = _id_of(row[field]) if field else None
+    out = {}
+    for key, value in row.items():
+        if champion_id is not None and (key == field or key in CATALOG_FIELDS):
+            continue
+        out[key] = compact_payload(value)
+    if champion_id is not None:
+        out["champion_id"] = champion_id
+    return out
+
+
+def compact_payload(payload: Any) -> Any:
+    """Replace champion names and image URLs with catalog ids, recursively."""
+    if isinstance(payload, list):
+        return [compact_payload(item) for item in payload]
+    if not isinstance(payload, dict):
+        return payload
+    if "image_url" in payload:
+        return _compact_row(payload)
+    out = {}
+    for key, value in payload.items():
+        if key in CHAMPION_KEYED_FIELDS and isinstance(value, dict):
+            out[key] = _rekey(value)
+        elif key in NESTED_CHAMPION_KEYED_FIELDS and isinstance(value, dict):
+            out[key] = {k: _rekey(v) if isinstance(v, dict) else v for k, v in value.items()}
+        else:
+            out[key] = compact_payload(value)
+    return out
+
+
+def maybe_compact(payload: Any, compact: bool) -> Any:
+    return compact_payload(payload) if compact else payload
+
+
+def champion_dictionary() -> dict:
+    """Every catalog champion by id: name, Data Dragon key, image URL, role and tags."""
+    return {
+        "data_dragon_version": DATA_DRAGON_VERSION,
+        "image_url_template": CHAMPION_IMAGE_URL,
+        "champions": [
+            {
+                "id": e.id,
+                "name": e.name,
+                "key": e.key,
+                "image_url": e.image_url,
+                "primary_role": e.primary_role,
+                "tags": list(e.tags),
+            }
+            for e in CATALOG
+        ],
+    }
@@ -0,0 +1,115 @@
+"""
+Response compression (brotli or gzip) above a size threshold.
+
+CompressionMiddleware compresses complete JSON/text responses whose body
+is at least COMPRESSION_MIN_BYTES, choosing brotli when the client accepts
+it and the Brotli package is installed, gzip otherwise. Responses that
+already carry a Content-Encoding (the pre-compressed bodies of the
+response cache) and streamed responses (TTS audio) pass through
+untouched.
+
+Dynamic responses use fast settings (brotli quality 4, gzip level 6);
+bodies compressed once and cached use compress(..., cached=True) for a
+better ratio.
+"""
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from draftmind.config import COMPRESSION_MIN_BYTES
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+# (brotli quality, gzip level) for per-request and cached bodies
+DYNAMIC_LEVELS = (4, 6)
+CACHED_LEVELS = (9, 9)
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Codings named in an Accept-Encoding header, minus those with q=0."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if coding.strip():
+            accepted.add(coding.strip())
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    accepted = accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    quality, level = CACHED_LEVELS if cached else DYNAMIC_LEVELS
+    if encoding == "br":
+        return brotli.compress(body, quality=quality)
+    return gzip.compress(body, compresslevel=level)
+
+
+class CompressionMiddleware:
+    """Brotli/gzip-compress complete responses of at least ``minimum_size`` bytes."""
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                content_type = headers.get("content-type", "")
+                passthrough = ("content-encoding" in headers
+                               or not content_type.startswith(COMPRESSIBLE_TYPES))
+                if passthrough:
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if start_message is not None:
+                initial, start_message = start_message, None
+                if message.get("more_body", False) or len(body) < self.minimum_size:
+                    # Streaming or small: send as is
+                    passthrough = True
+                    await send(initial)
+                    await send(message)
+                    return
+                body = compress(body, encoding)
+                headers = MutableHeaders(raw=initial["headers"])
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+                await send(initial)
+                await send({**message, "body": body})
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
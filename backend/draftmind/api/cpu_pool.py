@@ -0,0 +1,136 @@
+"""
+Process pool for CPU-bound engine calls (recommend, simulate, batch predictions).
+
+Async handlers hand work to forked worker processes so scoring runs on every
+core instead of contending for one GIL. Workers are forked at startup, after
+data and model are loaded and before any request thread exists, so they share
+that memory copy-on-write. When the data generation changes (hot reload) the
+pool is replaced so workers never serve stale data. Forking again from a
+server with live request threads could copy a lock some thread holds, so the
+replacement is started through a forkserver and each of its workers loads the
+data itself. Under the pre-fork server the data never changes inside a worker:
+a reload replaces the whole worker, and its successor forks a fresh pool at
+startup. With CPU_POOL_WORKERS=0 (or no fork support) work runs on the
+regular request thread pool instead.
+"""
+import asyncio
+import functools
+import gc
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from starlette.concurrency import run_in_threadpool
+from draftmind.config import CPU_POOL_WORKERS
+from draftmind.data.data_loader import data_store
+from draftmind.metrics import collect_spans, record_span
+from draftmind.serve import prefork_parent
+
+
+def _worker_init():
+    """Keep XGBoost single-threaded inside pool workers."""
+    from draftmind.engine.win_predictor import win_predictor
+    if win_predictor.ready and win_predictor.model is not None:
+        win_predictor.model.set_params(n_jobs=1)
+
+
+def _fresh_worker_init():
+    """Initializer for forkserver workers, which start without the parent's data."""
+    from draftmind.main import load_runtime
+    load_runtime()
+    _worker_init()
+
+
+def _noop() -> None:
+    return None
+
+
+def _call_with_spans(fn: Callable, args: tuple, kwargs: dict) -> tuple[Any, list]:
+    """Run in a worker; hand recorded spans back so the parent's metrics see them."""
+    with collect_spans() as spans:
+        result = fn(*args, **kwargs)
+    return result, spans
+
+
+class CPUPool:
+    """Lazily (re)created fork-based process pool tied to the data generation."""
+
+    def __init__(self, workers: int = CPU_POOL_WORKERS):
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._generation = -1
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0 and "fork" in multiprocessing.get_all_start_methods()
+
+    def _spawn(self) -> ProcessPoolExecutor:
+        # Move long-lived objects out of the GC's reach so collections in the
+        # children don't touch (and un-share) the inherited pages.
+        gc.collect()
+        gc.freeze()
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_worker_init,
+        )
+        # Fork every worker up front rather than on first request
+        for f in [executor.submit(_noop) for _ in range(self.workers)]:
+            f.result()
+        self._generation = data_store.generation
+        return executor
+
+    def _respawn(self) -> ProcessPoolExecutor | None:
+        """A pool for the new generation, without forking this (threaded) process."""
+        self._generation = data_store.generation
+        if "forkserver" not in multiprocessing.get_all_start_methods():
+            return None  # fall back to the request thread pool
+        # Workers start on first submit, so loading their data never blocks the event loop
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_fresh_worker_init,
+        )
+
+    def start(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._spawn()
+
+    def _current(self) -> ProcessPoolExecutor | None:
+        if self._executor is None or self._generation == data_store.generation:
+            return self._executor
+        if prefork_parent() is not None:
+            # Worker replacement rebuilds the pool; don't fork from a threaded worker
+            return self._executor
+        with self._lock:
+            if self._executor is not None and self._generation != data_store.generation:
+                old = self._executor
+                self._executor = self._respawn()
+                old.shutdown(wait=False)
+        return self._executor
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run ``fn(*args, **kwargs)`` off the event loop and await the result."""
+        executor = self._current()
+        if executor is None:
+            return await run_in_threadpool(fn, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        result, spans = await loop.run_in_executor(
+            executor, functools.partial(_call_with_spans, fn, args, kwargs))
+        for stage, seconds in spans:
+            record_span(stage, seconds)
+        return result
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+cpu_pool = CPUPool()
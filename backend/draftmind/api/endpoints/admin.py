@@ -0,0 +1,76 @@
+"""Admin endpoints: data hot-reload, profiling. Gated by the ADMIN_TOKEN shared secret."""
+import os
+import signal
+import time
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+from draftmind.config import ADMIN_TOKEN
+from draftmind.data.data_loader import data_store
+from draftmind.profiling import ProfilerBusy, sample_stacks
+from draftmind.serve import prefork_parent
+
+
+def require_admin(x_admin_token: str = Header("", description="Admin shared secret")):
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Admin endpoints are disabled")
+    if x_admin_token != ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.post("/reload")
+def reload_data():
+    """Rebuild the data snapshot from PROCESSED_DIR and swap it in atomically.
+
+    Under the pre-fork server (draftmind.serve) a reload here would only
+    refresh the one worker that took the request, so instead the parent is
+    sent SIGHUP and replaces every worker with one forked from the reloaded
+    snapshot. That returns ``{"scheduled": true}`` with the generation still
+    being served; poll /api/meta until its ``data_version`` changes.
+    """
+    parent = prefork_parent()
+    if parent is not None:
+        os.kill(parent, signal.SIGHUP)
+        return {
+            "scheduled": True,
+            "generation": data_store.generation,
+            "data_version": data_store.data_version,
+        }
+    start = time.perf_counter()
+    try:
+        snapshot = data_store.load()
+    except ValueError as e:
+        # Manifest mismatch or unparsable file; the current snapshot keeps serving
+        raise HTTPException(status_code=409, detail=str(e))
+    return {
+        "generation": snapshot.generation,
+        "data_version": snapshot.data_version,
+        "data_loaded": snapshot.loaded,
+        "series_count": snapshot.total_series,
+        "game_count": snapshot.total_games,
+        "champion_count": snapshot.total_champions,
+        "team_count": len(snapshot.team_profiles),
+        "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(10, gt=0, le=120),
+    interval_ms: float = Query(5, ge=1, le=100),
+    include_idle: bool = Query(False),
+):
+    """Sample live traffic in this worker; return flamegraph-compatible collapsed stacks."""
+    try:
+        collapsed = await run_in_threadpool(
+            sample_stacks, seconds, interval_ms / 1000, include_idle)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    filename = f"draftmind-{int(time.time())}.collapsed"
+    return PlainTextResponse(collapsed, headers={
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    })
@@ -1,7 +1,9 @@
 """Analysis endpoints: matchups and pattern detection."""
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
+from draftmind.api.compact import maybe_compact
+from draftmind.api.response_cache import cached_json_response
+from draftmind.core.champion_catalog import CATALOG
 from draftmind.data.data_loader import data_store
-from draftmind.data.champion_metadata import get_champion_image_url
 from draftmind.engine.pattern_detector import detect_patterns
 
 router = APIRouter(prefix="/api/analysis", tags=["analysis"])
@@ -9,9 +11,15 @@ router = APIRouter(prefix="/api/analysis", tags=["analysis"])
 
 @router.get("/matchup")
 def get_matchup(
+    request: Request,
     team1: str = Query(..., description="First team ID"),
     team2: str = Query(..., description="Second team ID"),
+    compact: bool = Query(False, description="Reference champions by id (see /api/meta/champions)"),
 ):
+    return cached_json_response(request, lambda: maybe_compact(_build_matchup(team1, team2), compact))
+
+
+def _build_matchup(team1: str, team2: str) -> dict:
     t1 = data_store.team_profiles.get(team1)
     t2 = data_store.team_profiles.get(team2)
 
@@ -49,10 +57,10 @@ def get_matchup(
             "win_rate": t2["win_rate"],
         },
         "shared_priority_picks": [
-            {"champion": c, "image_url": get_champion_image_url(c)} for c in shared_picks
+            {"champion": c, "image_url": CATALOG.image_url(c)} for c in shared_picks
         ],
         "shared_priority_bans": [
-            {"champion": c, "image_url": get_champion_image_url(c)} for c in shared_bans
+            {"champion": c, "image_url": CATALOG.image_url(c)} for c in shared_bans
         ],
         "ban_recommendations_vs_team1": ban_recs_vs_t1,
         "ban_recommendations_vs_team2": ban_recs_vs_t2,
@@ -60,8 +68,15 @@ def get_matchup(
 
 
 @router.get("/patterns/{team_id}")
-def get_patterns(team_id: str):
-    result = detect_patterns(team_id)
-    if not result:
-        raise HTTPException(status_code=404, detail=f"Team '{team_id}' not found")
-    return result
+def get_patterns(
+    request: Request,
+    team_id: str,
+    compact: bool = Query(False, description="Reference champions by id (see /api/meta/champions)"),
+):
+    def build():
+        result = detect_patterns(team_id)
+        if not result:
+            raise HTTPException(status_code=404, detail=f"Team '{team_id}' not found")
+        return maybe_compact(result, compact)
+
+    return cached_json_response(request, build)
@@ -1,22 +1,77 @@
 """Champion data endpoints."""
-from fastapi import APIRouter, Query, HTTPException
-from draftmind.engine.statistics import get_champion_list, get_champion_detail
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from draftmind.api.compact import maybe_compact
+from draftmind.api.patch_filter import patch_filter
+from draftmind.api.response_cache import cached_json_response
+from draftmind.data.data_loader import data_store
+from draftmind.engine.statistics import (
+    get_champion_list, get_champion_detail, get_champion_players, get_champion_matchups,
+)
 
 router = APIRouter(prefix="/api/champions", tags=["champions"])
 
 
 @router.get("")
 def list_champions(
+    request: Request,
     sort: str = Query("presence", description="Sort by: presence, win_rate, pick_rate, ban_rate, games_played, name"),
     limit: int = Query(50, ge=1, le=200),
     role: str = Query("", description="Filter by role: top, jungle, mid, bot, support"),
+    after: str = Query("", description="Cursor: name of the last champion on the previous page"),
+    compact: bool = Query(False, description="Reference champions by id (see /api/meta/champions)"),
+    window: dict = Depends(patch_filter),
 ):
-    return get_champion_list(sort_by=sort, limit=limit, role=role)
+    with data_store.window(**window):
+        return cached_json_response(request, lambda: maybe_compact(
+            get_champion_list(sort_by=sort, limit=limit, role=role, after=after), compact))
 
 
 @router.get("/{name}")
-def get_champion(name: str):
-    result = get_champion_detail(name)
-    if not result:
-        raise HTTPException(status_code=404, detail=f"Champion '{name}' not found")
-    return result
+def get_champion(
+    request: Request,
+    name: str,
+    min_games: int = Query(2, ge=1, description="Minimum games for a synergy/counter pair to be listed"),
+    prior_games: float = Query(0, ge=0, le=1000, description="Shrink pair win rates toward 50% by this many pseudo-games"),
+    compact: bool = Query(False, description="Reference champions by id (see /api/meta/champions)"),
+):
+    def build():
+        result = get_champion_detail(name, min_games=min_games, prior_games=prior_games)
+        if not result:
+            raise HTTPException(status_code=404, detail=f"Champion '{name}' not found")
+        return maybe_compact(result, compact)
+
+    return cached_json_response(request, build)
+
+
+@router.get("/{name}/players")
+def get_champion_player_list(
+    request: Request,
+    name: str,
+    limit: int = Query(20, ge=1, le=100),
+    compact: bool = Query(False, description="Reference champions by id (see /api/meta/champions)"),
+):
+    def build():
+        result = get_champion_players(name, limit=limit)
+        if not result:
+            raise HTTPException(status_code=404, detail=f"Champion '{name}' not found")
+        return maybe_compact(result, compact)
+
+    return cached_json_response(request, build)
+
+
+@router.get("/{name}/matchups")
+def get_champion_matchup_list(
+    request: Request,
+    name: str,
+    role: str = Query("", description="Lane: top, jungle, mid, bot, support (default: most played)"),
+    min_games: int = Query(2, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    compact: bool = Query(False, description="Reference champions by id (see /api/meta/champions)"),
+):
+    def build():
+        result = get_champion_matchups(name, role=role, min_games=min_games, limit=limit)
+        if not result:
+            raise HTTPException(status_code=404, detail=f"Champion '{name}' not found")
+        return maybe_compact(result, compact)
+
+    return cached_json_response(request, build)
@@ -1,16 +1,56 @@
 """Draft recommendation and simulation endpoints."""
-from fastapi import APIRouter
+import asyncio
+
+import numpy as np
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+from draftmind.api.compact import maybe_compact
+from draftmind.api.cpu_pool import cpu_pool
+from draftmind.api.patch_filter import patch_filter
+from draftmind.api.endpoints.admin import require_admin
+from draftmind.api.serialization import FastJSONResponse
 from draftmind.models.schemas import (
     DraftRecommendRequest, DraftRecommendResponse,
     DraftSimulateRequest, DraftSimulateResponse,
+    DraftWinCurveRequest, DraftWinCurveResponse,
+    DraftMonteCarloRequest, DraftOpponentPredictRequest,
+)
+from draftmind.engine.draft_simulator import (
+    MIN_CHUNK_ROLLOUTS, run_rollouts, simulate_completions, summarize_rollouts,
 )
-from draftmind.engine.recommendation import recommend, simulate_draft
+from draftmind.engine.opponent_model import predict_opponent_action
+from draftmind.engine.recommendation import recommend, simulate_draft, win_curve
+from draftmind.profiling import ProfilerBusy, profile_call
 
 router = APIRouter(prefix="/api/draft", tags=["draft"])
 
 
+async def _run(fn, profile: bool, admin_token: str, **kwargs) -> dict:
+    """Run an engine call on the CPU pool, or inline under cProfile when asked.
+
+    Profiling needs the admin token and runs on the request thread pool so the
+    stats describe this call, not pool overhead. One profiled call runs at a
+    time per worker; a concurrent one gets 409.
+    """
+    if not profile:
+        return await cpu_pool.run(fn, **kwargs)
+    require_admin(admin_token)
+    try:
+        result, stats = await run_in_threadpool(profile_call, fn, **kwargs)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {**result, "profile": stats}
+
+
 @router.post("/recommend")
-def draft_recommend(req: DraftRecommendRequest):
+async def draft_recommend(
+    req: DraftRecommendRequest,
+    profile: bool = Query(False, description="Return cProfile stats for this call (admin)"),
+    compact: bool = Query(False, description="Reference champions by id (see /api/meta/champions)"),
+    decayed: bool = Query(False, description="Score meta and team fit on recency-weighted stats"),
+    window: dict = Depends(patch_filter),
+    x_admin_token: str = Header(""),
+):
     current = [
         {
             "sequence_number": a.sequence_number,
@@ -21,21 +61,107 @@ def draft_recommend(req: DraftRecommendRequest):
         for a in req.current_actions
     ]
 
-    result = recommend(
+    result = await _run(
+        recommend, profile, x_admin_token,
         current_actions=current,
         blue_team_id=req.blue_team_id,
         red_team_id=req.red_team_id,
         next_sequence=req.next_action_sequence,
+        include_win_delta=req.include_win_delta,
+        decayed=decayed,
+        **window,
     )
-    return result
+    return FastJSONResponse(maybe_compact(result, compact))
 
 
 @router.post("/simulate")
-def draft_simulate(req: DraftSimulateRequest):
-    result = simulate_draft(
+async def draft_simulate(
+    req: DraftSimulateRequest,
+    profile: bool = Query(False, description="Return cProfile stats for this call (admin)"),
+    window: dict = Depends(patch_filter),
+    x_admin_token: str = Header(""),
+):
+    result = await _run(
+        simulate_draft, profile, x_admin_token,
         blue_picks=req.blue_picks,
         red_picks=req.red_picks,
         blue_team_id=req.blue_team_id,
         red_team_id=req.red_team_id,
+        **window,
     )
-    return result
+    return FastJSONResponse(result)
+
+
+@router.post("/win-curve", response_model=DraftWinCurveResponse)
+async def draft_win_curve(req: DraftWinCurveRequest):
+    """Blue win probability after every pick, from one batched model call."""
+    actions = [
+        {
+            "sequence_number": a.sequence_number,
+            "action_type": a.action_type,
+            "team_side": a.team_side,
+            "champion_name": a.champion_name,
+        }
+        for a in req.actions
+    ]
+    result = await cpu_pool.run(
+        win_curve,
+        actions=actions,
+        blue_team_id=req.blue_team_id,
+        red_team_id=req.red_team_id,
+    )
+    return FastJSONResponse(result)
+
+
+@router.post("/monte-carlo")
+async def draft_monte_carlo(req: DraftMonteCarloRequest):
+    """Sample completions of a partial draft: win-probability distribution and likely enemy comps.
+
+    With the CPU pool enabled, large runs are split into one chunk per worker
+    (independent seed streams) and merged.
+    """
+    current = [
+        {
+            "sequence_number": a.sequence_number,
+            "action_type": a.action_type,
+            "team_side": a.team_side,
+            "champion_name": a.champion_name,
+        }
+        for a in req.current_actions
+    ]
+    chunks = min(cpu_pool.workers if cpu_pool.enabled else 1,
+                 req.rollouts // MIN_CHUNK_ROLLOUTS)
+    if chunks <= 1:
+        return FastJSONResponse(await cpu_pool.run(
+            simulate_completions, current, req.blue_team_id, req.red_team_id,
+            req.team_side, req.rollouts, req.seed))
+
+    sizes = [len(part) for part in np.array_split(np.arange(req.rollouts), chunks)]
+    seeds = np.random.SeedSequence(req.seed).spawn(chunks)
+    results = await asyncio.gather(*[
+        cpu_pool.run(run_rollouts, current, req.blue_team_id, req.red_team_id, size, seed)
+        for size, seed in zip(sizes, seeds)
+    ])
+    return FastJSONResponse(
+        await run_in_threadpool(summarize_rollouts, list(results), req.team_side))
+
+
+@router.post("/predict-opponent")
+async def draft_predict_opponent(
+    req: DraftOpponentPredictRequest,
+    compact: bool = Query(False, description="Reference champions by id (see /api/meta/champions)"),
+):
+    """Most likely champions for the opponent's next ban or pick at its draft slot."""
+    current = [
+        {
+            "sequence_number": a.sequence_number,
+            "action_type": a.action_type,
+            "team_side": a.team_side,
+            "champion_name": a.champion_name,
+        }
+        for a in req.current_actions
+    ]
+    result = await cpu_pool.run(
+        predict_opponent_action, current, req.blue_team_id, req.red_team_id,
+        req.team_side, req.top_k)
+    return FastJSONResponse(maybe_compact(result, compact))
@@ -1,7 +1,11 @@
 """Health and metadata endpoints."""
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+from draftmind.api.compact import champion_dictionary
+from draftmind.api.response_cache import cached_json_response
 from draftmind.config import VERSION
 from draftmind.data.data_loader import data_store
+from draftmind.metrics import render_prometheus
 
 router = APIRouter()
 
@@ -20,12 +24,33 @@ def health():
 
 @router.get("/api/meta")
 def meta():
-    date_range = data_store.get_date_range()
+    """Dataset summary (prebuilt per snapshot from the manifest)."""
+    return data_store.snapshot.meta
+
+
+def _patch_breakdown() -> dict:
+    snapshot = data_store.snapshot
     return {
-        "total_series": data_store.total_series,
-        "total_games": data_store.total_games,
-        "total_champions": data_store.total_champions,
-        "total_teams": len(data_store.team_profiles),
-        "total_players": len(data_store.player_pools),
-        "date_range": list(date_range),
+        "data_version": snapshot.data_version,
+        "date_range": list(snapshot.date_range),
+        "patches": snapshot.manifest.get("patches", []),
+        "tournaments": snapshot.manifest.get("tournaments", []),
     }
+
+
+@router.get("/api/meta/patches")
+def patches(request: Request):
+    """Games and series per patch and per tournament, with first/last game dates."""
+    return cached_json_response(request, _patch_breakdown)
+
+
+@router.get("/api/meta/champions")
+def champions_dictionary(request: Request):
+    """Champion id -> name, Data Dragon key and image URL, for compact responses."""
+    return cached_json_response(request, champion_dictionary)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Request and engine-stage latency histograms (Prometheus text format)."""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
@@ -1,5 +1,7 @@
 """Team data endpoints."""
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
+from draftmind.api.compact import maybe_compact
+from draftmind.api.response_cache import cached_json_response
 from draftmind.engine.statistics import get_team_list, get_team_detail
 
 router = APIRouter(prefix="/api/teams", tags=["teams"])
@@ -7,15 +9,26 @@ router = APIRouter(prefix="/api/teams", tags=["teams"])
 
 @router.get("")
 def list_teams(
+    request: Request,
     search: str = Query("", description="Search by team name"),
     limit: int = Query(20, ge=1, le=100),
+    after: str = Query("", description="Cursor: team_id of the last team on the previous page"),
+    compact: bool = Query(False, description="Reference champions by id (see /api/meta/champions)"),
 ):
-    return get_team_list(search=search, limit=limit)
+    return cached_json_response(request, lambda: maybe_compact(
+        get_team_list(search=search, limit=limit, after=after), compact))
 
 
 @router.get("/{team_id}")
-def get_team(team_id: str):
-    result = get_team_detail(team_id)
-    if not result:
-        raise HTTPException(status_code=404, detail=f"Team '{team_id}' not found")
-    return result
+def get_team(
+    request: Request,
+    team_id: str,
+    compact: bool = Query(False, description="Reference champions by id (see /api/meta/champions)"),
+):
+    def build():
+        result = get_team_detail(team_id)
+        if not result:
+            raise HTTPException(status_code=404, detail=f"Team '{team_id}' not found")
+        return maybe_compact(result, compact)
+
+    return cached_json_response(request, build)
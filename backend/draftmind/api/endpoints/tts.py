@@ -8,6 +8,7 @@ from pydantic import BaseModel
 
 from draftmind.models.schemas import NarrationRequest
 from draftmind.engine.narrator import generate_narration
+from draftmind.metrics import span
 
 router = APIRouter(prefix="/api/draft", tags=["draft"])
 
@@ -30,9 +31,10 @@ async def _generate_audio_bytes(text: str, tone: str) -> bytes:
 
     communicate = edge_tts.Communicate(text, VOICE, rate=rate, pitch=pitch)
     buf = io.BytesIO()
-    async for chunk in communicate.stream():
-        if chunk["type"] == "audio":
-            buf.write(chunk["data"])
+    with span("tts.synthesis"):
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                buf.write(chunk["data"])
     return buf.getvalue()
 
 
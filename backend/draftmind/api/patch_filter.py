@@ -0,0 +1,22 @@
+"""
+``?patch=`` / ``?since=`` query parameters (patch-range statistics).
+
+Endpoints that accept them declare ``window: dict = Depends(patch_filter)``
+and either pass ``**window`` to a @windowed engine entry point or wrap
+their work in ``with data_store.window(**window)``. The filter is resolved
+here first so a bad value is a 400 before any work is scheduled.
+"""
+from fastapi import HTTPException, Query
+
+from draftmind.data.data_loader import data_store
+
+
+def patch_filter(
+    patch: str = Query("", description="Only games on this patch (see /api/meta/patches)"),
+    since: str = Query("", description="Only games from this patch (e.g. 14.5) or date (YYYY-MM-DD) on"),
+) -> dict:
+    try:
+        data_store.snapshot.windowed(patch, since)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"patch": patch, "since": since}
@@ -0,0 +1,105 @@
+"""
+Response cache for read-only analytics endpoints.
+
+Responses that are pure functions of the loaded DataStore are serialized
+(and brotli/gzip-compressed) once, then served as raw bytes with an ETag. Entries
+are keyed by path, query params and data version (the manifest's hash of
+the processed files), so loading new data invalidates everything at once
+while reloading identical files keeps the cache warm.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from draftmind.api.compression import brotli, choose_encoding, compress
+from draftmind.api.serialization import dumps
+from draftmind.config import COMPRESSION_MIN_BYTES, RESPONSE_CACHE_MAX_ENTRIES
+from draftmind.data.data_loader import data_store
+
+
+class CachedBody:
+    """Pre-encoded response body, plus its compressed forms when large enough."""
+
+    __slots__ = ("body", "encoded", "etag")
+
+    def __init__(self, payload: Any):
+        self.body = dumps(payload)
+        self.encoded: dict[str, bytes] = {}
+        if len(self.body) >= COMPRESSION_MIN_BYTES:
+            self.encoded["gzip"] = compress(self.body, "gzip", cached=True)
+            if brotli is not None:
+                self.encoded["br"] = compress(self.body, "br", cached=True)
+        digest = hashlib.blake2b(self.body, digest_size=12).hexdigest()
+        self.etag = f'W/"{digest}"'
+
+
+class ResponseCache:
+    """Thread-safe LRU of CachedBody entries for the current data version."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, CachedBody] = OrderedDict()
+        self._data_version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: tuple, builder: Callable[[], Any]) -> CachedBody:
+        data_version = data_store.data_version
+        full_key = (data_version,) + key
+        with self._lock:
+            if data_version != self._data_version:
+                self._entries.clear()
+                self._data_version = data_version
+            entry = self._entries.get(full_key)
+            if entry is not None:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return entry
+
+        # Build outside the lock; a concurrent miss just builds twice
+        entry = CachedBody(builder())
+        with self._lock:
+            self.misses += 1
+            if data_version == self._data_version:
+                self._entries[full_key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or etag[2:] in candidates
+
+
+def cached_json_response(request: Request, builder: Callable[[], Any]) -> Response:
+    """Serve a JSON payload from the response cache, building it on a miss.
+
+    ``builder`` may raise HTTPException (e.g. 404); errors are never cached.
+    """
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+    entry = response_cache.get_or_build(key, builder)
+
+    headers = {"ETag": entry.etag, "Vary": "Accept-Encoding"}
+    if _etag_matches(request.headers.get("if-none-match", ""), entry.etag):
+        return Response(status_code=304, headers=headers)
+
+    if entry.encoded:
+        encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+            return Response(content=entry.encoded[encoding], media_type="application/json",
+                            headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
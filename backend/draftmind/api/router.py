@@ -1,6 +1,6 @@
 """Top-level API router. Mounts all endpoint sub-routers."""
 from fastapi import APIRouter
-from draftmind.api.endpoints import health, champions, teams, draft, analysis, narrator, tts
+from draftmind.api.endpoints import health, champions, teams, draft, analysis, narrator, tts, admin
 
 api_router = APIRouter()
 
@@ -11,3 +11,4 @@ api_router.include_router(draft.router)
 api_router.include_router(analysis.router)
 api_router.include_router(narrator.router)
 api_router.include_router(tts.router)
+api_router.include_router(admin.router)
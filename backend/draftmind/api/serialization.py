@@ -0,0 +1,37 @@
+"""
+Fast JSON encoding for API responses.
+
+FastAPI's default path runs every returned dict through jsonable_encoder (a
+recursive copy) and then stdlib json.dumps. Engine payloads are already
+plain dicts, lists, strings and numbers (plus the odd numpy scalar), so
+dumps() hands them straight to orjson, which serializes numpy values
+natively. FastJSONResponse is the app's default response class; endpoints
+with large payloads return it directly so jsonable_encoder is skipped.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(payload: Any) -> bytes:
+    """Compact UTF-8 JSON bytes (non-finite floats become null)."""
+    return orjson.dumps(payload, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
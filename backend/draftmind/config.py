@@ -12,9 +12,27 @@ MODEL_DIR = DATA_DIR / "models"
 
 GRID_API_KEY = os.getenv("GRID_API_KEY", "")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
-CENTRAL_DATA_URL = "https://api-op.grid.gg/central-data/graphql"
-SERIES_STATE_URL = "https://api-op.grid.gg/live-data-feed/series-state/graphql"
-FILE_DOWNLOAD_URL = "https://api.grid.gg/file-download"
+# Shared secret for /admin endpoints; admin routes are disabled when empty
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+# GRID endpoints. GRID_BASE_URL points all three at one host with GRID's path
+# layout, e.g. the local stand-in (python -m scripts.grid_standin) at
+# http://127.0.0.1:8765; the per-URL variables override individual endpoints.
+GRID_BASE_URL = os.getenv("GRID_BASE_URL", "").rstrip("/")
+CENTRAL_DATA_URL = os.getenv(
+    "GRID_CENTRAL_DATA_URL",
+    f"{GRID_BASE_URL}/central-data/graphql" if GRID_BASE_URL
+    else "https://api-op.grid.gg/central-data/graphql")
+SERIES_STATE_URL = os.getenv(
+    "GRID_SERIES_STATE_URL",
+    f"{GRID_BASE_URL}/live-data-feed/series-state/graphql" if GRID_BASE_URL
+    else "https://api-op.grid.gg/live-data-feed/series-state/graphql")
+FILE_DOWNLOAD_URL = os.getenv(
+    "GRID_FILE_DOWNLOAD_URL",
+    f"{GRID_BASE_URL}/file-download" if GRID_BASE_URL else "https://api.grid.gg/file-download")
+# Client-side pacing for GRID's rate limits (20 req/min on Central Data);
+# set to 0 against the stand-in to measure the server-side limits instead
+GRID_PAGE_DELAY_SECONDS = float(os.getenv("GRID_PAGE_DELAY_SECONDS", "3"))
+GRID_DOWNLOAD_DELAY_SECONDS = float(os.getenv("GRID_DOWNLOAD_DELAY_SECONDS", "1"))
 
 LOL_TITLE_ID = "3"
 
@@ -27,4 +45,23 @@ DATA_DRAGON_VERSION = "14.1.1"
 DATA_DRAGON_BASE = f"https://ddragon.leagueoflegends.com/cdn/{DATA_DRAGON_VERSION}"
 CHAMPION_IMAGE_URL = f"{DATA_DRAGON_BASE}/img/champion/{{champion_key}}.png"
 
+# Half-life of the recency-weighted (decayed) statistics, in days
+DECAY_HALF_LIFE_DAYS = float(os.getenv("DECAY_HALF_LIFE_DAYS", "30"))
+
+# Responses smaller than this are sent uncompressed
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+# Max pre-serialized responses kept per data generation
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+
+# Serving: pre-forked server processes, and per-process CPU pool size for
+# heavy endpoints (0 = run them on the request thread pool instead). The pool
+# is opt-in: draftmind.serve already runs one process per core, so it only
+# pays off with fewer server processes than cores (e.g. WEB_CONCURRENCY=1).
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "0")) or (os.cpu_count() or 1)
+CPU_POOL_WORKERS = int(os.getenv("CPU_POOL_WORKERS", "0"))
+
+# Add a Server-Timing header with per-stage durations to every response
+SERVER_TIMING = os.getenv("SERVER_TIMING", "").lower() in ("1", "true", "yes")
+
 VERSION = "1.0.0"
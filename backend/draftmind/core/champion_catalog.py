@@ -0,0 +1,144 @@
+"""
+Compiled champion catalog shared by every engine.
+
+Champion knowledge is maintained in three hand-edited tables: traits
+(champion_roles.CHAMPIONS), Data Dragon keys
+(champion_metadata.CHAMPION_KEYS) and name aliases
+(champion_roles.NAME_ALIASES). This module compiles them once, at import,
+into one slotted ChampionEntry per champion with an integer id, a
+preformatted image URL, its aliases, and trait ids ready for array
+indexing. Every spelling variant (alias, case, punctuation) maps to its
+entry in a single dict, so a lookup never scans or formats strings.
+"""
+from draftmind.config import CHAMPION_IMAGE_URL, DATA_DRAGON_BASE
+from draftmind.core.champion_roles import CHAMPIONS, NAME_ALIASES, ROLES, ChampionMeta
+from draftmind.data.champion_metadata import CHAMPION_KEYS, get_champion_image_url
+
+DAMAGE_TYPES = ("physical", "magic", "mixed")
+SCALINGS = ("early", "mid", "late")
+# Bound on remembered URLs for names outside the catalog (raw user input)
+_URL_MEMO_LIMIT = 4096
+
+
+def _strip(name: str) -> str:
+    return name.replace("'", "").replace(" ", "").replace(".", "")
+
+
+def _fallback_key(name: str) -> str:
+    return name.replace(" ", "").replace("'", "")
+
+
+class ChampionEntry:
+    """One champion: identity, Data Dragon key and URLs, aliases and traits.
+
+    Trait attributes mirror ChampionMeta; ``has_traits`` is False for
+    champions that only have a Data Dragon key.
+    """
+
+    __slots__ = (
+        "id", "name", "key", "image_url", "splash_url", "aliases", "has_traits",
+        "primary_role", "secondary_role", "tags", "damage_type", "cc_score",
+        "scaling", "is_engage", "role_id", "damage_id", "scaling_id",
+    )
+
+    def __init__(self, champion_id: int, name: str, key: str, aliases: tuple[str, ...],
+                 meta: ChampionMeta | None):
+        self.id = champion_id
+        self.name = name
+        self.key = key
+        self.image_url = CHAMPION_IMAGE_URL.format(champion_key=key)
+        self.splash_url = f"{DATA_DRAGON_BASE}/img/champion/splash/{key}_0.jpg"
+        self.aliases = aliases
+        self.has_traits = meta is not None
+        self.primary_role = meta.primary_role if meta else "unknown"
+        self.secondary_role = meta.secondary_role if meta else ""
+        self.tags = tuple(meta.tags) if meta else ()
+        self.damage_type = meta.damage_type if meta else ""
+        self.cc_score = meta.cc_score if meta else 0
+        self.scaling = meta.scaling if meta else ""
+        self.is_engage = meta.is_engage if meta else False
+        self.role_id = ROLES.index(self.primary_role) if self.primary_role in ROLES else -1
+        self.damage_id = DAMAGE_TYPES.index(self.damage_type) if meta else -1
+        self.scaling_id = SCALINGS.index(self.scaling) if meta else -1
+
+
+class ChampionCatalog:
+    """All known champions, indexed by id (sorted name order) and by every name variant."""
+
+    __slots__ = ("entries", "names", "engage", "_by_name", "_exact", "_stripped", "_lower",
+                 "_urls")
+
+    def __init__(self, traits: dict[str, ChampionMeta], keys: dict[str, str],
+                 aliases: dict[str, str]):
+        self.names = sorted(set(traits) | set(keys))
+        by_alias: dict[str, list[str]] = {}
+        for alias, canonical in aliases.items():
+            if alias != canonical:
+                by_alias.setdefault(canonical, []).append(alias)
+        self.entries = [
+            ChampionEntry(i, name, keys.get(name, _fallback_key(name)),
+                          tuple(by_alias.get(name, ())), traits.get(name))
+            for i, name in enumerate(self.names)
+        ]
+        self.engage = frozenset(e.name for e in self.entries if e.is_engage)
+
+        # Entry lookup: exact name, then case-insensitive (first name wins)
+        self._by_name: dict[str, ChampionEntry] = {}
+        for e in self.entries:
+            self._by_name.setdefault(e.name.lower(), e)
+        self._by_name.update({e.name: e for e in self.entries})
+
+        # Canonical-name resolution for raw GRID / user input, in the order
+        # normalize_champion_name has always applied: known name or alias,
+        # punctuation-insensitive alias, case-insensitive known name
+        self._exact = {**aliases, **{name: name for name in traits}}
+        self._stripped: dict[str, str] = {}
+        for alias, canonical in aliases.items():
+            self._stripped.setdefault(_strip(alias), canonical)
+        self._lower: dict[str, str] = {}
+        for name in traits:
+            self._lower.setdefault(name.lower(), name)
+        self._urls = {e.name: e.image_url for e in self.entries}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def get(self, name: str) -> ChampionEntry | None:
+        """Entry for a champion name (exact, then case-insensitive)."""
+        entry = self._by_name.get(name)
+        if entry is None:
+            entry = self._by_name.get(name.lower())
+        return entry
+
+    def meta(self, name: str) -> ChampionEntry | None:
+        """Entry only if the champion has traits (drop-in for get_champion_meta)."""
+        entry = self.get(name)
+        return entry if entry is not None and entry.has_traits else None
+
+    def id_of(self, name: str) -> int | None:
+        entry = self.get(name)
+        return entry.id if entry is not None else None
+
+    def image_url(self, name: str) -> str:
+        """Data Dragon image URL; unknown names are formatted once and remembered."""
+        url = self._urls.get(name)
+        if url is None:
+            url = get_champion_image_url(name)
+            if len(self._urls) < _URL_MEMO_LIMIT:
+                self._urls[name] = url
+        return url
+
+    def resolve(self, name: str) -> str:
+        """Canonical champion name for raw input; unknown names are returned as-is."""
+        canonical = self._exact.get(name)
+        if canonical is None:
+            canonical = self._stripped.get(_strip(name))
+        if canonical is None:
+            canonical = self._lower.get(name.lower(), name)
+        return canonical
+
+
+CATALOG = ChampionCatalog(CHAMPIONS, CHAMPION_KEYS, NAME_ALIASES)
@@ -4,6 +4,10 @@ Covers all champions commonly seen in pro play (~170).
 Source: Riot Data Dragon + community wiki, current as of patch 14.x.
 """
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import permutations
+
+ROLES = ("top", "jungle", "mid", "bot", "support")
 
 
 @dataclass
@@ -204,11 +208,9 @@ def get_champion_meta(name: str) -> ChampionMeta | None:
     """Get metadata for a champion by name. Tries exact match, then case-insensitive."""
     if name in CHAMPIONS:
         return CHAMPIONS[name]
-    name_lower = name.lower()
-    for k, v in CHAMPIONS.items():
-        if k.lower() == name_lower:
-            return v
-    return None
+    from draftmind.core.champion_catalog import CATALOG
+    entry = CATALOG.meta(name)
+    return CHAMPIONS[entry.name] if entry is not None else None
 
 
 def get_champions_by_role(role: str) -> list[ChampionMeta]:
@@ -218,7 +220,10 @@ def get_champions_by_role(role: str) -> list[ChampionMeta]:
 
 
 def get_engage_champions() -> list[str]:
-    """Get names of all champions that can initiate teamfights."""
+    """Get names of all champions that can initiate teamfights.
+
+    Builds a new list per call; hot paths use champion_catalog.CATALOG.engage.
+    """
     return [c.name for c in CHAMPIONS.values() if c.is_engage]
 
 
@@ -269,6 +274,32 @@ def has_role_coverage(champion_names: list[str]) -> dict[str, bool]:
     }
 
 
+@lru_cache(maxsize=4096)
+def _assign_roles(names: tuple[str, ...]) -> tuple[str, ...]:
+    fit = []
+    for name in names:
+        meta = get_champion_meta(name)
+        fit.append({meta.primary_role: 2, meta.secondary_role: 1} if meta else {})
+    best, best_score = None, -1
+    for roles in permutations(ROLES, len(names)):
+        score = sum(f.get(r, 0) for f, r in zip(fit, roles))
+        if score > best_score:
+            best, best_score = roles, score
+    return best
+
+
+def assign_roles(champion_names: list[str]) -> dict[str, str]:
+    """Most plausible lane for each champion on one team (at most 5).
+
+    Picks the role permutation that best matches primary (2 points) and
+    secondary (1 point) roles; ties keep the earliest permutation.
+    """
+    names = tuple(champion_names[:len(ROLES)])
+    if not names:
+        return {}
+    return dict(zip(names, _assign_roles(names)))
+
+
 # Name normalization: GRID data may use slightly different names
 # Map common variations to canonical names
 NAME_ALIASES = {
@@ -301,19 +332,8 @@ def normalize_champion_name(name: str) -> str:
     """Normalize a champion name from GRID data to canonical form."""
     if name in CHAMPIONS:
         return name
-    if name in NAME_ALIASES:
-        return NAME_ALIASES[name]
-    # Try stripping spaces/punctuation for matching
-    stripped = name.replace("'", "").replace(" ", "").replace(".", "")
-    for alias, canonical in NAME_ALIASES.items():
-        if alias.replace("'", "").replace(" ", "").replace(".", "") == stripped:
-            return canonical
-    # Case-insensitive search
-    name_lower = name.lower()
-    for k in CHAMPIONS:
-        if k.lower() == name_lower:
-            return k
-    return name  # Return as-is if no match
+    from draftmind.core.champion_catalog import CATALOG
+    return CATALOG.resolve(name)
 
 
 ALL_CHAMPION_NAMES = set(CHAMPIONS.keys())
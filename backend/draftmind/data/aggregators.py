@@ -0,0 +1,681 @@
+"""
+Statistics aggregators that fold games in one at a time.
+
+Every processed statistics file has an aggregator here holding its raw
+counts. ``update(game)`` adds one draft_database game, ``result()`` builds
+the file's contents and ``state()`` / ``from_state()`` save and restore the
+counts as plain JSON. compute_statistics.py folds the whole draft database
+through fresh aggregators; update_statistics.py restores saved state and
+folds in only the games appended to the game log since its last run, so
+both paths write the same files.
+
+State keeps insertion order through a save/load cycle, so outputs whose
+ordering depends on first appearance (tie-breaks in sorted pick lists,
+role order in lane_matchups.json) come out the same either way.
+"""
+from draftmind.config import DECAY_HALF_LIFE_DAYS
+from draftmind.core.champion_roles import assign_roles
+from draftmind.core.draft_rules import DRAFT_SEQUENCE
+from draftmind.data.decayed_stats import DecayedStats
+from draftmind.data.pair_store import LaneMatchupStore, PairStore
+from draftmind.data.patch_stats import (
+    CHAMPION_COUNT_COLUMNS, PAIR_COUNT_COLUMNS, TEAM_COUNT_COLUMNS, UNKNOWN_PATCH,
+    champion_stats_row, encode_partitions, encode_sparse, patch_order,
+)
+
+# Per-pair sums kept by the lane matchup index (a's stat minus b's, per minute)
+LANE_DIFF_KEYS = ("gold_per_min_diff", "cs_per_min_diff", "damage_per_min_diff")
+
+# Pseudo-actions of the per-sequence league distribution mixed into each team's row
+SEQUENCE_PRIOR_STRENGTH = 10.0
+# Pseudo-actions of the overall pick/ban share mixed into each per-sequence league row
+SEQUENCE_GLOBAL_STRENGTH = 20.0
+
+# Results per team kept for recent_results (and in saved state)
+RECENT_RESULTS = 20
+
+
+def _cell(table: dict, a: str, b: str, default) -> dict:
+    """table[a][b], created from default() on first use."""
+    row = table.get(a)
+    if row is None:
+        row = table[a] = {}
+    cell = row.get(b)
+    if cell is None:
+        cell = row[b] = default()
+    return cell
+
+
+def _win_loss() -> dict:
+    return {"games": 0, "wins": 0}
+
+
+def _bump(counts: dict, key: str, n: int = 1):
+    counts[key] = counts.get(key, 0) + n
+
+
+def _by_count(counts: dict) -> dict:
+    return dict(sorted(counts.items(), key=lambda x: -x[1]))
+
+
+def _by_games(counts: dict) -> dict:
+    return dict(sorted({k: dict(v) for k, v in counts.items()}.items(),
+                       key=lambda x: -x[1]["games"]))
+
+
+def _team_won(game: dict, team_id: str) -> bool:
+    """Whether the team that took a draft action won (red unless it is the blue team)."""
+    if team_id == game["blue_team"]["team_id"]:
+        return game["blue_team"]["won"]
+    return game["red_team"]["won"]
+
+
+class Aggregator:
+    """Counts for one output file. Subclasses list their JSON state in ``_fields``."""
+
+    _fields: tuple[str, ...] = ()
+
+    def update(self, game: dict) -> None:
+        raise NotImplementedError
+
+    def result(self):
+        raise NotImplementedError
+
+    def state(self) -> dict:
+        return {name: getattr(self, name) for name in self._fields}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "Aggregator":
+        agg = cls()
+        for name in cls._fields:
+            if name in state:
+                setattr(agg, name, state[name])
+        return agg
+
+    def stale(self) -> bool:
+        """True if these counts were built under settings that have since changed."""
+        return False
+
+    @classmethod
+    def fold(cls, games, *args) -> "Aggregator":
+        agg = cls(*args)
+        for game in games:
+            agg.update(game)
+        return agg
+
+
+class ChampionCounts(Aggregator):
+    """Per-champion CHAMPION_COUNT_COLUMNS -> champion_stats.json."""
+
+    _fields = ("stats", "total_games")
+
+    def __init__(self):
+        self.stats: dict[str, dict] = {}
+        self.total_games = 0
+
+    def update(self, game: dict):
+        stats = self.stats
+        self.total_games += 1
+
+        # Process draft actions
+        for da in game["draft_actions"]:
+            champ = da["champion_name"]
+            s = stats.get(champ)
+            if s is None:
+                s = stats[champ] = dict.fromkeys(CHAMPION_COUNT_COLUMNS, 0)
+
+            if da["action_type"] == "ban":
+                s["total_bans"] += 1
+            elif da["action_type"] == "pick":
+                s["total_picks"] += 1
+                if da["team_side"] == "blue":
+                    s["blue_picks"] += 1
+                else:
+                    s["red_picks"] += 1
+
+        # Process player stats for picked champions
+        for side_key in ("blue_team", "red_team"):
+            team = game[side_key]
+            team_won = team["won"]
+
+            for player in team["players"]:
+                s = stats.get(player["champion_name"])
+                if s is None:
+                    continue
+                s["total_games"] += 1
+
+                if team_won:
+                    s["total_wins"] += 1
+                    if team["side"] == "blue":
+                        s["blue_wins"] += 1
+                    else:
+                        s["red_wins"] += 1
+
+                s["kills_sum"] += player.get("kills", 0)
+                s["deaths_sum"] += player.get("deaths", 0)
+                s["assists_sum"] += player.get("assists", 0)
+                s["damage_sum"] += player.get("damage_dealt", 0)
+                s["gold_sum"] += player.get("gold_earned", 0)
+                s["vision_sum"] += player.get("vision_score", 0)
+                s["cs_sum"] += player.get("cs", 0)
+
+    def result(self) -> dict:
+        return {champ: champion_stats_row(champ, s, self.total_games)
+                for champ, s in self.stats.items()}
+
+
+class PairCounts(Aggregator):
+    """Nested {a: {b: {"games", "wins"}}} synergy and counter counts -> champion_pairs.json."""
+
+    _fields = ("synergy", "counter")
+
+    def __init__(self):
+        self.synergy: dict[str, dict] = {}  # teammates in the same game
+        self.counter: dict[str, dict] = {}  # opponents in the same game
+
+    def update(self, game: dict):
+        blue_champs = [p["champion_name"] for p in game["blue_team"]["players"]]
+        red_champs = [p["champion_name"] for p in game["red_team"]["players"]]
+        blue_won = game["blue_team"]["won"]
+
+        # Synergies (same team)
+        for champs, won in ((blue_champs, blue_won), (red_champs, not blue_won)):
+            for i, c1 in enumerate(champs):
+                for c2 in champs[i + 1:]:
+                    ab = _cell(self.synergy, c1, c2, _win_loss)
+                    ba = _cell(self.synergy, c2, c1, _win_loss)
+                    ab["games"] += 1
+                    ba["games"] += 1
+                    if won:
+                        ab["wins"] += 1
+                        ba["wins"] += 1
+
+        # Counters (opposing teams) - from blue perspective
+        for c1 in blue_champs:
+            for c2 in red_champs:
+                ab = _cell(self.counter, c1, c2, _win_loss)
+                ba = _cell(self.counter, c2, c1, _win_loss)
+                ab["games"] += 1
+                ba["games"] += 1
+                if blue_won:
+                    ab["wins"] += 1
+                else:
+                    ba["wins"] += 1
+
+    def result(self) -> dict:
+        # Raw counts for every observed pair; consumers apply thresholds at query time
+        return PairStore.from_counts(self.synergy, self.counter).to_json()
+
+
+class TeamCounts(Aggregator):
+    """Per-team TEAM_COUNT_COLUMNS and {team: {champion: {games, wins}}} picks,
+    counted as TeamProfiles does (patch_stats.json partitions)."""
+
+    _fields = ("totals", "picks")
+
+    def __init__(self):
+        self.totals: dict[str, dict] = {}
+        self.picks: dict[str, dict] = {}
+
+    def update(self, game: dict):
+        for team_data in (game["blue_team"], game["red_team"]):
+            t = self.totals.get(team_data["team_id"])
+            if t is None:
+                t = self.totals[team_data["team_id"]] = dict.fromkeys(TEAM_COUNT_COLUMNS, 0)
+            won = team_data["won"]
+            side = "blue" if team_data["side"] == "blue" else "red"
+            t["total_games"] += 1
+            t[f"{side}_games"] += 1
+            if won:
+                t["total_wins"] += 1
+                t[f"{side}_wins"] += 1
+        for da in game["draft_actions"]:
+            if da["action_type"] != "pick":
+                continue
+            cell = _cell(self.picks, da["team_id"], da["champion_name"], _win_loss)
+            cell["games"] += 1
+            if _team_won(game, da["team_id"]):
+                cell["wins"] += 1
+
+
+def _new_team(tid: str) -> dict:
+    return {
+        "team_id": tid,
+        "team_name": "",
+        "total_games": 0,
+        "total_wins": 0,
+        "blue_games": 0,
+        "blue_wins": 0,
+        "red_games": 0,
+        "red_wins": 0,
+        "champion_picks": {},
+        "champion_bans_by": {},
+        "champion_bans_against": {},
+        "first_pick_blue": {},
+        "first_ban_blue": {},
+        "first_ban_red": {},
+        "player_pools": {},
+        "recent_results": [],
+        "series_ids": [],
+    }
+
+
+class TeamProfiles(Aggregator):
+    """Per-team records and draft patterns -> team_profiles.json."""
+
+    _fields = ("teams",)
+
+    def __init__(self):
+        self.teams: dict[str, dict] = {}
+
+    def _team(self, tid: str) -> dict:
+        t = self.teams.get(tid)
+        if t is None:
+            t = self.teams[tid] = _new_team(tid)
+        return t
+
+    def update(self, game: dict):
+        blue_team = game["blue_team"]
+        red_team = game["red_team"]
+
+        for team_data in (blue_team, red_team):
+            won = team_data["won"]
+            t = self._team(team_data["team_id"])
+
+            t["team_name"] = team_data["team_name"]
+            t["total_games"] += 1
+            if game["series_id"] not in t["series_ids"]:
+                t["series_ids"].append(game["series_id"])
+
+            if won:
+                t["total_wins"] += 1
+            if team_data["side"] == "blue":
+                t["blue_games"] += 1
+                if won:
+                    t["blue_wins"] += 1
+            else:
+                t["red_games"] += 1
+                if won:
+                    t["red_wins"] += 1
+
+            t["recent_results"].append("W" if won else "L")
+            del t["recent_results"][:-RECENT_RESULTS]
+
+            # Player pools
+            for player in team_data["players"]:
+                cell = _cell(t["player_pools"], player["player_name"],
+                             player["champion_name"], _win_loss)
+                cell["games"] += 1
+                if won:
+                    cell["wins"] += 1
+
+        # Draft patterns per team
+        for da in game["draft_actions"]:
+            tid = da["team_id"]
+            champ = da["champion_name"]
+            side = da["team_side"]
+            t = self._team(tid)
+
+            if da["action_type"] == "ban":
+                _bump(t["champion_bans_by"], champ)
+                # Determine opponent
+                opp_tid = (blue_team["team_id"] if tid == red_team["team_id"]
+                           else red_team["team_id"])
+                _bump(self._team(opp_tid)["champion_bans_against"], champ)
+
+                # First ban tracking
+                if da["sequence_number"] == 1 and side == "blue":
+                    _bump(t["first_ban_blue"], champ)
+                elif da["sequence_number"] == 2 and side == "red":
+                    _bump(t["first_ban_red"], champ)
+
+            elif da["action_type"] == "pick":
+                cell = t["champion_picks"].setdefault(champ, _win_loss())
+                cell["games"] += 1
+                if _team_won(game, tid):
+                    cell["wins"] += 1
+
+                # First pick tracking (sequence 7 = blue first pick)
+                if da["sequence_number"] == 7 and side == "blue":
+                    _bump(t["first_pick_blue"], champ)
+
+    def result(self) -> dict:
+        result = {}
+        for tid, t in self.teams.items():
+            total = t["total_games"] or 1
+            result[tid] = {
+                "team_id": tid,
+                "team_name": t["team_name"],
+                "total_games": t["total_games"],
+                "total_wins": t["total_wins"],
+                "win_rate": round(t["total_wins"] / total * 100, 1),
+                "blue_games": t["blue_games"],
+                "blue_wins": t["blue_wins"],
+                "blue_win_rate": round(t["blue_wins"] / max(t["blue_games"], 1) * 100, 1),
+                "red_games": t["red_games"],
+                "red_wins": t["red_wins"],
+                "red_win_rate": round(t["red_wins"] / max(t["red_games"], 1) * 100, 1),
+                "series_count": len(t["series_ids"]),
+                "champion_picks": _by_games(t["champion_picks"]),
+                "champion_bans_by": _by_count(t["champion_bans_by"]),
+                "champion_bans_against": _by_count(t["champion_bans_against"]),
+                "first_pick_blue": _by_count(t["first_pick_blue"]),
+                "first_ban_blue": _by_count(t["first_ban_blue"]),
+                "first_ban_red": _by_count(t["first_ban_red"]),
+                "player_pools": {pname: _by_games(champs)
+                                 for pname, champs in t["player_pools"].items()},
+                "recent_results": t["recent_results"][-RECENT_RESULTS:],
+            }
+        return result
+
+
+class PlayerPools(Aggregator):
+    """Per-player champion pools -> player_pools.json."""
+
+    _fields = ("players",)
+
+    def __init__(self):
+        self.players: dict[str, dict] = {}
+
+    def update(self, game: dict):
+        for side_key in ("blue_team", "red_team"):
+            team = game[side_key]
+            won = team["won"]
+
+            for player in team["players"]:
+                pid = player["player_id"]
+                p = self.players.get(pid)
+                if p is None:
+                    p = self.players[pid] = {"player_id": pid, "player_name": "", "team_id": "",
+                                             "team_name": "", "total_games": 0, "champions": {}}
+                p["player_name"] = player["player_name"]
+                p["team_id"] = team["team_id"]
+                p["team_name"] = team["team_name"]
+                p["total_games"] += 1
+
+                c = p["champions"].get(player["champion_name"])
+                if c is None:
+                    c = p["champions"][player["champion_name"]] = {
+                        "games": 0, "wins": 0, "kills_sum": 0, "deaths_sum": 0, "assists_sum": 0,
+                    }
+                c["games"] += 1
+                if won:
+                    c["wins"] += 1
+                c["kills_sum"] += player.get("kills", 0)
+                c["deaths_sum"] += player.get("deaths", 0)
+                c["assists_sum"] += player.get("assists", 0)
+
+    def result(self) -> dict:
+        result = {}
+        for pid, p in self.players.items():
+            champs = {}
+            for champ, data in p["champions"].items():
+                games = data["games"] or 1
+                champs[champ] = {
+                    "games": data["games"],
+                    "wins": data["wins"],
+                    "win_rate": round(data["wins"] / games * 100, 1),
+                    "avg_kills": round(data["kills_sum"] / games, 1),
+                    "avg_deaths": round(data["deaths_sum"] / games, 1),
+                    "avg_assists": round(data["assists_sum"] / games, 1),
+                }
+            result[pid] = {
+                "player_id": pid,
+                "player_name": p["player_name"],
+                "team_id": p["team_id"],
+                "team_name": p["team_name"],
+                "total_games": p["total_games"],
+                "unique_champions": len(champs),
+                "champions": dict(sorted(champs.items(), key=lambda x: -x[1]["games"])),
+            }
+        return result
+
+
+class SequencePriorCounts(Aggregator):
+    """Draft-slot counts -> sequence_priors.json.
+
+    P(c | team, seq) = count / (n + k) + k / (n + k) * P(c | seq)
+
+    The league distribution for each sequence number is smoothed toward the
+    overall pick (or ban) share, and each team's row toward the league row.
+    Team rows are stored as a CSR matrix (row = team_index * 20 + seq - 1)
+    holding only the count / (n + k) terms, plus a per-row ``backoff`` weight
+    k / (n + k) for the dense league rows. The side is fixed by the sequence
+    number, so it needs no dimension of its own.
+    """
+
+    _fields = ("seq_counts", "team_counts", "action_counts")
+
+    def __init__(self):
+        self.seq_counts: dict[str, dict] = {}  # seq -> champ -> n
+        self.team_counts: dict[str, dict] = {}  # team -> seq -> champ -> n
+        self.action_counts: dict[str, dict] = {"pick": {}, "ban": {}}
+
+    def update(self, game: dict):
+        n_seq = len(DRAFT_SEQUENCE)
+        for da in game["draft_actions"]:
+            seq = da["sequence_number"]
+            if not 1 <= seq <= n_seq:
+                continue
+            champ = da["champion_name"]
+            _bump(self.seq_counts.setdefault(str(seq), {}), champ)
+            _bump(_cell(self.team_counts, da["team_id"], str(seq), dict), champ)
+            _bump(self.action_counts[da["action_type"]], champ)
+
+    def result(self) -> dict:
+        action_counts = self.action_counts
+        champions = sorted(set(action_counts["pick"]) | set(action_counts["ban"]))
+        index = {c: i for i, c in enumerate(champions)}
+
+        league = []
+        for seq, action, _ in DRAFT_SEQUENCE:
+            share = action_counts[action]
+            share_total = sum(share.values()) or 1
+            counts = self.seq_counts.get(str(seq), {})
+            total = sum(counts.values())
+            league.append([
+                round((counts.get(c, 0) + SEQUENCE_GLOBAL_STRENGTH * share.get(c, 0) / share_total)
+                      / (total + SEQUENCE_GLOBAL_STRENGTH), 6)
+                for c in champions
+            ])
+
+        teams = sorted(self.team_counts)
+        indptr, indices, probs, backoff, samples = [0], [], [], [], []
+        for tid in teams:
+            for seq in range(1, len(DRAFT_SEQUENCE) + 1):
+                counts = self.team_counts[tid].get(str(seq), {})
+                total = sum(counts.values())
+                denom = total + SEQUENCE_PRIOR_STRENGTH
+                for champ in sorted(counts, key=index.__getitem__):
+                    indices.append(index[champ])
+                    probs.append(round(counts[champ] / denom, 6))
+                indptr.append(len(indices))
+                backoff.append(round(SEQUENCE_PRIOR_STRENGTH / denom, 6))
+                samples.append(total)
+
+        return {
+            "prior_strength": SEQUENCE_PRIOR_STRENGTH,
+            "champions": champions,
+            "league": league,
+            "teams": teams,
+            "indptr": indptr,
+            "indices": indices,
+            "probs": probs,
+            "backoff": backoff,
+            "samples": samples,
+        }
+
+
+def _per_minute(player: dict, minutes: float) -> tuple[float, float, float]:
+    """(gold, CS, damage) per minute from a parsed player record."""
+    if minutes <= 0:
+        return (player.get("gold_per_minute", 0), 0.0, player.get("damage_per_minute", 0))
+    return (
+        player.get("gold_per_minute") or player.get("gold_earned", 0) / minutes,
+        player.get("cs", 0) / minutes,
+        player.get("damage_per_minute") or player.get("damage_dealt", 0) / minutes,
+    )
+
+
+def _lane_entry() -> dict:
+    return {"games": 0, "wins": 0, **{k: 0.0 for k in LANE_DIFF_KEYS}}
+
+
+class LaneMatchupCounts(Aggregator):
+    """Per-role head-to-head results and stat differentials -> lane_matchups.json.
+
+    Player records carry no position, so each side's lanes come from
+    assign_roles() over its five champions. For every lane, both directions
+    are recorded: games, wins, and summed per-minute gold / CS / damage
+    differentials (see LaneMatchupStore).
+    """
+
+    _fields = ("roles",)
+
+    def __init__(self):
+        self.roles: dict[str, dict] = {}
+
+    def update(self, game: dict):
+        minutes = game.get("duration_seconds", 0) / 60
+        lanes = {}
+        for side_key in ("blue_team", "red_team"):
+            players = game[side_key]["players"]
+            assigned = assign_roles([p["champion_name"] for p in players])
+            lanes[side_key] = {assigned[p["champion_name"]]: p for p in players
+                               if p["champion_name"] in assigned}
+        blue_won = game["blue_team"]["won"]
+
+        for role, bp in lanes["blue_team"].items():
+            rp = lanes["red_team"].get(role)
+            if rp is None:
+                continue
+            b_stats, r_stats = _per_minute(bp, minutes), _per_minute(rp, minutes)
+            table = self.roles.setdefault(role, {})
+            for me, opp, my_stats, opp_stats, won in (
+                    (bp, rp, b_stats, r_stats, blue_won),
+                    (rp, bp, r_stats, b_stats, not blue_won)):
+                entry = _cell(table, me["champion_name"], opp["champion_name"], _lane_entry)
+                entry["games"] += 1
+                if won:
+                    entry["wins"] += 1
+                for key, mine, theirs in zip(LANE_DIFF_KEYS, my_stats, opp_stats):
+                    entry[key] += mine - theirs
+
+    def result(self) -> dict:
+        return LaneMatchupStore.from_counts(self.roles, LANE_DIFF_KEYS).to_json()
+
+
+class PatchCounts(Aggregator):
+    """Champion, pair and team counts per patch -> patch_stats.json (see PatchStats)."""
+
+    _fields = ("patches", "pair_champions")
+
+    def __init__(self):
+        # patch -> {"games", "first_date", "last_date", "champions", "pairs", "teams"}
+        self.patches: dict[str, dict] = {}
+        self.pair_champions: list[str] = []
+        self._live: dict[str, tuple] = {}  # patch -> restored (champions, pairs, teams)
+        self._seen: set[str] = set()
+
+    def _partition(self, patch: str) -> tuple:
+        live = self._live.get(patch)
+        if live is None:
+            p = self.patches.setdefault(patch, {"games": 0, "first_date": "", "last_date": ""})
+            live = self._live[patch] = (
+                ChampionCounts.from_state(p.get("champions", {})),
+                PairCounts.from_state(p.get("pairs", {})),
+                TeamCounts.from_state(p.get("teams", {})),
+            )
+        return live
+
+    def update(self, game: dict):
+        patch = game.get("patch") or UNKNOWN_PATCH
+        champions, pairs, teams = self._partition(patch)
+        p = self.patches[patch]
+        p["games"] += 1
+        date = game.get("date")
+        if date:
+            if not p["first_date"] or date < p["first_date"]:
+                p["first_date"] = date
+            if date > p["last_date"]:
+                p["last_date"] = date
+        champions.update(game)
+        pairs.update(game)
+        teams.update(game)
+
+        for side in ("blue_team", "red_team"):
+            for player in game[side]["players"]:
+                if player["champion_name"] not in self._seen:
+                    self._seen.add(player["champion_name"])
+                    self.pair_champions.append(player["champion_name"])
+
+    @classmethod
+    def from_state(cls, state: dict) -> "PatchCounts":
+        agg = super().from_state(state)
+        agg._seen = set(agg.pair_champions)
+        return agg
+
+    def state(self) -> dict:
+        for patch, (champions, pairs, teams) in self._live.items():
+            self.patches[patch].update(champions=champions.state(), pairs=pairs.state(),
+                                       teams=teams.state())
+        return super().state()
+
+    def result(self, champion_stats: dict, team_profiles: dict) -> dict:
+        patches = patch_order(self.patches)
+        champions = sorted(set(champion_stats) | set(self.pair_champions))
+        champ_index = {c: i for i, c in enumerate(champions)}
+        teams = sorted(team_profiles)
+        team_index = {t: i for i, t in enumerate(teams)}
+
+        champion_rows, synergy_rows, counter_rows, team_rows, pick_rows = [], [], [], [], []
+        for patch in patches:
+            counts, pairs, team_counts = self._partition(patch)
+            champion_rows.append({champ_index[c]: v for c, v in counts.stats.items()})
+            for table, rows in ((pairs.synergy, synergy_rows), (pairs.counter, counter_rows)):
+                rows.append({(champ_index[a], champ_index[b]): v
+                             for a, row in table.items() for b, v in row.items()})
+            team_rows.append({team_index[t]: v for t, v in team_counts.totals.items()})
+            pick_rows.append({(team_index[t], champ_index[c]): v
+                              for t, row in team_counts.picks.items() for c, v in row.items()})
+
+        return {
+            "format": "partitioned",
+            "patches": patches,
+            "first_dates": [self.patches[p]["first_date"] for p in patches],
+            "last_dates": [self.patches[p]["last_date"] for p in patches],
+            "games": [self.patches[p]["games"] for p in patches],
+            "champions": champions,
+            "champion_counts": encode_partitions(champion_rows, CHAMPION_COUNT_COLUMNS),
+            "synergies": encode_sparse(synergy_rows, len(champions), PAIR_COUNT_COLUMNS),
+            "counters": encode_sparse(counter_rows, len(champions), PAIR_COUNT_COLUMNS),
+            "teams": teams,
+            "team_counts": encode_partitions(team_rows, TEAM_COUNT_COLUMNS),
+            "team_picks": encode_sparse(pick_rows, len(teams), PAIR_COUNT_COLUMNS),
+        }
+
+
+class DecayedCounts(Aggregator):
+    """Recency-weighted counts -> decayed_stats.json (state is the file itself)."""
+
+    def __init__(self, half_life_days: float = DECAY_HALF_LIFE_DAYS):
+        self.stats = DecayedStats(half_life_days)
+
+    def update(self, game: dict):
+        self.stats.update(game)
+
+    def result(self) -> dict:
+        return self.stats.to_json()
+
+    def state(self) -> dict:
+        return self.stats.to_json()
+
+    def stale(self) -> bool:
+        return self.stats.half_life_days != DECAY_HALF_LIFE_DAYS
+
+    @classmethod
+    def from_state(cls, state: dict) -> "DecayedCounts":
+        # Keep the saved half-life; stale() flags it for a rebuild if the config changed
+        agg = cls()
+        agg.stats = DecayedStats.from_json(state, state.get("half_life_days", DECAY_HALF_LIFE_DAYS))
+        return agg
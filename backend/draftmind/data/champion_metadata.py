@@ -12,6 +12,7 @@ CHAMPION_KEYS = {
     "Akali": "Akali",
     "Akshan": "Akshan",
     "Alistar": "Alistar",
+    "Ambessa": "Ambessa",
     "Amumu": "Amumu",
     "Anivia": "Anivia",
     "Annie": "Annie",
@@ -39,9 +40,11 @@ CHAMPION_KEYS = {
     "Elise": "Elise",
     "Evelynn": "Evelynn",
     "Ezreal": "Ezreal",
+    "Fiddlesticks": "Fiddlesticks",
     "Fiora": "Fiora",
     "Galio": "Galio",
     "Gangplank": "Gangplank",
+    "Garen": "Garen",
     "Gnar": "Gnar",
     "Gragas": "Gragas",
     "Graves": "Graves",
@@ -83,6 +86,7 @@ CHAMPION_KEYS = {
     "Malzahar": "Malzahar",
     "Maokai": "Maokai",
     "Master Yi": "MasterYi",
+    "Mel": "Mel",
     "Milio": "Milio",
     "Miss Fortune": "MissFortune",
     "Mordekaiser": "Mordekaiser",
@@ -103,7 +107,9 @@ CHAMPION_KEYS = {
     "Poppy": "Poppy",
     "Pyke": "Pyke",
     "Qiyana": "Qiyana",
+    "Quinn": "Quinn",
     "Rakan": "Rakan",
+    "Rammus": "Rammus",
     "Rek'Sai": "RekSai",
     "Rell": "Rell",
     "Renata Glasc": "Renata",
@@ -132,6 +138,7 @@ CHAMPION_KEYS = {
     "Tahm Kench": "TahmKench",
     "Taliyah": "Taliyah",
     "Talon": "Talon",
+    "Taric": "Taric",
     "Teemo": "Teemo",
     "Thresh": "Thresh",
     "Tristana": "Tristana",
@@ -158,6 +165,7 @@ CHAMPION_KEYS = {
     "Yasuo": "Yasuo",
     "Yone": "Yone",
     "Yorick": "Yorick",
+    "Yunara": "Yunara",
     "Yuumi": "Yuumi",
     "Zac": "Zac",
     "Zed": "Zed",
@@ -170,10 +178,18 @@ CHAMPION_KEYS = {
 }
 
 
+# Preformatted image URLs, so response rows never format strings
+CHAMPION_IMAGE_URLS = {
+    name: CHAMPION_IMAGE_URL.format(champion_key=key) for name, key in CHAMPION_KEYS.items()
+}
+
+
 def get_champion_image_url(name: str) -> str:
     """Get the Data Dragon image URL for a champion."""
-    key = CHAMPION_KEYS.get(name, name.replace(" ", "").replace("'", ""))
-    return CHAMPION_IMAGE_URL.format(champion_key=key)
+    url = CHAMPION_IMAGE_URLS.get(name)
+    if url is None:
+        url = CHAMPION_IMAGE_URL.format(champion_key=name.replace(" ", "").replace("'", ""))
+    return url
 
 
 def get_champion_splash_url(name: str) -> str:
@@ -1,79 +1,446 @@
 """
 Load pre-computed JSON data into memory at startup.
 All data is served from memory — no runtime database or API dependency.
+
+Each load builds a fresh DataSnapshot off to the side and then publishes it
+with a single reference swap, so a reload never exposes half-loaded state to
+in-flight requests. Snapshots are never mutated after they are published.
+
+Every file is read inside build_snapshot, before the snapshot is published.
+When manifest.json carries a ``data_version`` (a content hash of the data
+files), the bytes read are checked against it: a file rewritten or still
+being written since the manifest was saved fails the load and the current
+snapshot stays. The large, rarely used files (draft_database.json,
+player_pools.json, patch_stats.json, decayed_stats.json) are then parsed
+from those bytes on first access, along with the indexes derived from them;
+summary fields the API needs up front come from the manifest. Nothing read
+after publication touches the filesystem. Without a manifest every file is
+parsed up front and the manifest is built in memory. DataSnapshot.warm()
+parses everything deferred (the pre-fork server calls it before forking, so
+workers share one copy).
+
+Each snapshot carries a ``data_version`` (from the manifest, or the same
+content hash computed at load without one). Reloading unchanged files yields
+the same version, so caches keyed on it survive the reload.
+
+Inside
+``with data_store.window(patch=..., since=...)`` every read is served from a
+view of the snapshot restricted to that patch range; the ``windowed``
+decorator gives engine entry points those two keyword arguments.
 """
+import functools
 import json
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from draftmind.config import PROCESSED_DIR
+from typing import Any, Callable
+from draftmind.config import DECAY_HALF_LIFE_DAYS, PROCESSED_DIR
+from draftmind.data.manifest import DATA_FILES, build_manifest, data_version_of
+from draftmind.data.pair_store import LaneMatchupStore, PairStore
+from draftmind.data.patch_stats import PatchStats
+from draftmind.data.decayed_stats import DecayedStats
+from draftmind.data.indexes import (
+    build_team_series_index, build_adaptation_summaries, build_champion_name_map,
+    build_champion_team_index, build_champion_player_index,
+    build_champion_leaderboards, build_team_leaderboard, build_positions,
+)
 
 
-class DataStore:
-    """In-memory data store for all pre-computed statistics."""
+# Patch-range views kept per snapshot
+MAX_WINDOWS = 16
 
-    def __init__(self):
-        self.champion_stats: dict = {}
-        self.champion_pairs: dict = {}
-        self.team_profiles: dict = {}
-        self.player_pools: dict = {}
-        self.draft_database: dict = {}
-        self.loaded = False
-        self.total_series = 0
-        self.total_games = 0
-        self.total_champions = 0
-
-    def load(self, data_dir: Path | None = None):
-        """Load all processed data files into memory."""
-        d = data_dir or PROCESSED_DIR
+# Snapshot view active in the current context (see DataStore.window)
+_scoped_snapshot: ContextVar["DataSnapshot | None"] = ContextVar("scoped_snapshot", default=None)
 
-        # Champion stats
-        champ_path = d / "champion_stats.json"
-        if champ_path.exists():
-            with open(champ_path, "r", encoding="utf-8") as f:
-                self.champion_stats = json.load(f)
 
-        # Champion pairs (synergies & counters)
-        pairs_path = d / "champion_pairs.json"
-        if pairs_path.exists():
-            with open(pairs_path, "r", encoding="utf-8") as f:
-                self.champion_pairs = json.load(f)
-
-        # Team profiles
-        team_path = d / "team_profiles.json"
-        if team_path.exists():
-            with open(team_path, "r", encoding="utf-8") as f:
-                self.team_profiles = json.load(f)
-
-        # Player pools
-        player_path = d / "player_pools.json"
-        if player_path.exists():
-            with open(player_path, "r", encoding="utf-8") as f:
-                self.player_pools = json.load(f)
+# Parsed on first access, from bytes read at load time
+DEFERRED_FILES = ("player_pools.json", "draft_database.json",
+                  "patch_stats.json", "decayed_stats.json")
 
-        # Draft database (for pattern detection)
-        db_path = d / "draft_database.json"
-        if db_path.exists():
-            with open(db_path, "r", encoding="utf-8") as f:
-                self.draft_database = json.load(f)
-            self.total_series = self.draft_database.get("total_series", 0)
-            self.total_games = self.draft_database.get("total_games", 0)
 
+def _read_json(path: Path) -> dict:
+    """Read a JSON file, returning an empty dict if it does not exist."""
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    if not path.exists():
+        return None
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _parse(raw: bytes | None) -> dict:
+    return json.loads(raw) if raw else {}
+
+
+class _Lazy:
+    """A value computed on first access, exactly once, under a lock."""
+
+    __slots__ = ("_load", "_value", "_lock")
+
+    def __init__(self, load: Callable[[], Any]):
+        self._load = load
+        self._value = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._load is None
+
+    def get(self) -> Any:
+        if self._load is not None:
+            with self._lock:
+                if self._load is not None:
+                    self._value = self._load()
+                    self._load = None
+        return self._value
+
+
+def _lazy_source(source: dict | Callable[[], dict] | None) -> _Lazy:
+    """Wrap a dict (already loaded) or a zero-argument loader."""
+    if callable(source):
+        return _Lazy(lambda: source() or {})
+    lazy = _Lazy(lambda: source or {})
+    lazy.get()
+    return lazy
+
+
+class DataSnapshot:
+    """One immutable generation of processed data plus its derived indexes.
+
+    Views from ``windowed(patch, since)`` restrict champion stats, pairs and
+    team records to a patch range (see PatchStats); everything else is
+    shared with the full snapshot.
+    """
+
+    __slots__ = (
+        "generation", "window", "champion_stats", "champion_pairs", "team_profiles",
+        "sequence_priors", "lane_matchups", "manifest", "data_version", "meta",
+        "total_series", "total_games",
+        "total_champions", "player_count", "loaded", "date_range", "team_series_ids",
+        "champion_names", "champion_teams", "champion_leaderboards", "champion_positions",
+        "team_leaderboard", "team_positions",
+        "_player_pools", "_draft_database", "_team_series", "_team_adaptation",
+        "_champion_players", "_patch_stats", "_decayed", "_windows", "_windows_lock",
+    )
+
+    def __init__(self, generation: int = 0, champion_stats: dict | None = None,
+                 champion_pairs: dict | None = None,
+                 team_profiles: dict | None = None,
+                 player_pools: dict | Callable[[], dict] | None = None,
+                 draft_database: dict | Callable[[], dict] | None = None,
+                 sequence_priors: dict | None = None,
+                 lane_matchups: dict | None = None,
+                 manifest: dict | None = None,
+                 data_version: str = "",
+                 patch_stats: dict | Callable[[], dict] | None = None,
+                 decayed_stats: dict | Callable[[], dict] | None = None):
+        self.generation = generation
+        self.window = None
+        self.champion_stats = champion_stats or {}
+        self.champion_pairs = PairStore.from_json(champion_pairs)
+        self.team_profiles = team_profiles or {}
+        self.sequence_priors = sequence_priors or {}
+        self.lane_matchups = LaneMatchupStore.from_json(lane_matchups)
+
+        # player_pools / draft_database / patch_stats / decayed_stats may be
+        # parsers over bytes already read; they and everything derived from
+        # them are built on first access
+        self._player_pools = _lazy_source(player_pools)
+        self._draft_database = _lazy_source(draft_database)
+        patch_source = _lazy_source(patch_stats)
+        self._patch_stats = _Lazy(lambda: PatchStats(patch_source.get()))
+        decayed_source = _lazy_source(decayed_stats)
+        self._decayed = _Lazy(lambda: DecayedStats.from_json(decayed_source.get(),
+                                                              DECAY_HALF_LIFE_DAYS))
+        self._windows: OrderedDict[tuple[int, int], DataSnapshot] = OrderedDict()
+        self._windows_lock = threading.Lock()
+        if not manifest:
+            manifest = build_manifest(self._draft_database.get(), self._player_pools.get())
+        self.manifest = manifest
+        self._team_series = _Lazy(lambda: build_team_series_index(self.draft_database))
+        self._team_adaptation = _Lazy(lambda: build_adaptation_summaries(self.team_series))
+        self._champion_players = _Lazy(lambda: build_champion_player_index(self.player_pools))
+
+        # Derived fields — computed once here, never on the request path
+        self.total_series = manifest.get("total_series", 0)
+        self.total_games = manifest.get("total_games", 0)
+        self.player_count = manifest.get("player_count", 0)
+        self.date_range = tuple(manifest.get("date_range", ("", "")))
+        self.team_series_ids = manifest.get("team_series", {})
+        self.data_version = manifest.get("data_version") or data_version or f"gen-{generation}"
+        self._build_indexes()
+        # /api/meta body, built once per snapshot
+        self.meta = {
+            "total_series": self.total_series,
+            "total_games": self.total_games,
+            "total_champions": self.total_champions,
+            "total_teams": len(self.team_profiles),
+            "total_players": self.player_count,
+            "date_range": list(self.date_range),
+            "patch_count": len(manifest.get("patches", [])),
+            "tournament_count": len(manifest.get("tournaments", [])),
+            "data_version": self.data_version,
+        }
+
+    def _build_indexes(self):
+        """Indexes over champion_stats and team_profiles."""
         self.total_champions = len(self.champion_stats)
         self.loaded = bool(self.champion_stats)
+        self.champion_names = build_champion_name_map(self.champion_stats)
+        self.champion_teams = build_champion_team_index(self.team_profiles)
+        self.champion_leaderboards = build_champion_leaderboards(self.champion_stats)
+        self.champion_positions = {k: build_positions(rows, "name")
+                                   for k, rows in self.champion_leaderboards.items()}
+        self.team_leaderboard = build_team_leaderboard(self.team_profiles)
+        self.team_positions = build_positions(self.team_leaderboard, "team_id")
+
+    def warm(self):
+        """Parse every deferred file and build the indexes derived from them now."""
+        for lazy in (self._player_pools, self._draft_database, self._patch_stats,
+                     self._decayed, self._team_series, self._team_adaptation,
+                     self._champion_players):
+            lazy.get()
+
+    @property
+    def cache_key(self) -> tuple:
+        """(generation, window): what engine caches derived from this snapshot key on."""
+        return (self.generation, self.window)
+
+    @property
+    def patch_stats(self) -> PatchStats:
+        return self._patch_stats.get()
+
+    @property
+    def decayed(self) -> DecayedStats:
+        """Recency-weighted counts (empty, and falsy, without decayed_stats.json)."""
+        return self._decayed.get()
+
+    def windowed(self, patch: str = "", since: str = "") -> "DataSnapshot":
+        """This snapshot restricted to a ``patch`` or to patches ``since`` one.
+
+        Returns self without a filter (or when it covers every patch). Views
+        are built from prefix sums in time proportional to the number of
+        champions and pairs, and the most recent MAX_WINDOWS are kept.
+        Raises ValueError for an unknown patch.
+        """
+        if self.window is not None:
+            raise ValueError("Snapshot is already windowed")
+        window = self.patch_stats.resolve(patch, since)
+        if window is None:
+            return self
+        view = self._windows.get(window)
+        if view is not None:
+            return view
+        with self._windows_lock:
+            view = self._windows.get(window)
+            if view is None:
+                view = self._view(window)
+                self._windows[window] = view
+                while len(self._windows) > MAX_WINDOWS:
+                    self._windows.popitem(last=False)
+            return view
+
+    def _view(self, window: tuple[int, int]) -> "DataSnapshot":
+        stats = self.patch_stats
+        view = DataSnapshot.__new__(DataSnapshot)
+        for slot in DataSnapshot.__slots__:
+            setattr(view, slot, getattr(self, slot))
+        view.window = window
+        view.champion_stats = stats.champion_stats(*window)
+        view.champion_pairs = stats.champion_pairs(*window)
+        view.team_profiles = stats.team_profiles(*window, self.team_profiles)
+        view.total_games = stats.games(*window)
+        view._windows = OrderedDict()
+        view._build_indexes()
+        return view
+
+    @property
+    def player_pools(self) -> dict:
+        return self._player_pools.get()
+
+    @property
+    def draft_database(self) -> dict:
+        return self._draft_database.get()
+
+    @property
+    def team_series(self) -> dict[str, list[dict]]:
+        return self._team_series.get()
+
+    @property
+    def team_adaptation(self) -> dict[str, dict]:
+        return self._team_adaptation.get()
+
+    @property
+    def champion_players(self) -> dict[str, list[dict]]:
+        return self._champion_players.get()
+
+
+def build_snapshot(data_dir: Path, generation: int) -> DataSnapshot:
+    """Read all processed data files and build a complete snapshot.
+
+    Raises ValueError if the files no longer match the manifest's data_version.
+    """
+    manifest = _read_json(data_dir / "manifest.json")
+    raw = {name: _read_bytes(data_dir / name) for name in DATA_FILES}
+    data_version = data_version_of(raw)
+    if manifest.get("data_version"):
+        if manifest["data_version"] != data_version:
+            raise ValueError(
+                f"Processed data in {data_dir} does not match manifest.json "
+                f"(data_version {manifest['data_version']}, files hash to {data_version}); "
+                "files changed since the manifest was written or are still being written")
+        # Verified: the large files can wait, parsed from these bytes on first access
+        deferred = {name: functools.partial(_parse, raw.pop(name)) for name in DEFERRED_FILES}
+    else:
+        deferred = {name: _parse(raw.pop(name)) for name in DEFERRED_FILES}
+    return DataSnapshot(
+        generation=generation,
+        champion_stats=_parse(raw["champion_stats.json"]),
+        # Champion pairs (synergies & counters)
+        champion_pairs=_parse(raw["champion_pairs.json"]),
+        team_profiles=_parse(raw["team_profiles.json"]),
+        # Large and rarely needed
+        player_pools=deferred["player_pools.json"],
+        # Draft database (for pattern detection)
+        draft_database=deferred["draft_database.json"],
+        # Per-team, per-sequence draft priors (sparse arrays)
+        sequence_priors=_parse(raw["sequence_priors.json"]),
+        # Per-role head-to-head index (sparse arrays)
+        lane_matchups=_parse(raw["lane_matchups.json"]),
+        # Totals, date range, player count, per-team series ids
+        manifest=manifest,
+        # Used only when the manifest has no data_version
+        data_version=data_version,
+        # Per-patch counts, for ?patch= / ?since= views
+        patch_stats=deferred["patch_stats.json"],
+        # Recency-weighted counts
+        decayed_stats=deferred["decayed_stats.json"],
+    )
+
+
+class DataStore:
+    """In-memory data store for all pre-computed statistics.
+
+    Attribute reads are served from the currently published snapshot, or
+    from a patch-range view of it inside ``with data_store.window(...)``.
+    Callers that need several reads to be mutually consistent should grab
+    ``data_store.snapshot`` once and read from that.
+    """
+
+    def __init__(self):
+        self._snapshot = DataSnapshot()
+        self._reload_lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> DataSnapshot:
+        return _scoped_snapshot.get() or self._snapshot
+
+    @contextmanager
+    def window(self, patch: str = "", since: str = ""):
+        """Serve reads in this context from the published snapshot restricted
+        to ``patch`` or to patches ``since`` one (ValueError if unknown).
+        Without a filter, the current scope is left as it is."""
+        if not patch and not since:
+            yield
+            return
+        token = _scoped_snapshot.set(self._snapshot.windowed(patch, since))
+        try:
+            yield
+        finally:
+            _scoped_snapshot.reset(token)
+
+    @property
+    def generation(self) -> int:
+        """Monotonic data version; derived caches key on this."""
+        return self._snapshot.generation
+
+    @property
+    def data_version(self) -> str:
+        """Hash of the loaded data files; unchanged across reloads of the same data."""
+        return self._snapshot.data_version
+
+    @property
+    def champion_stats(self) -> dict:
+        return self.snapshot.champion_stats
+
+    @property
+    def champion_pairs(self) -> PairStore:
+        return self.snapshot.champion_pairs
+
+    @property
+    def team_profiles(self) -> dict:
+        return self.snapshot.team_profiles
+
+    @property
+    def player_pools(self) -> dict:
+        return self.snapshot.player_pools
+
+    @property
+    def draft_database(self) -> dict:
+        return self.snapshot.draft_database
+
+    @property
+    def sequence_priors(self) -> dict:
+        return self.snapshot.sequence_priors
+
+    @property
+    def lane_matchups(self) -> LaneMatchupStore:
+        return self.snapshot.lane_matchups
+
+    @property
+    def loaded(self) -> bool:
+        return self.snapshot.loaded
+
+    @property
+    def total_series(self) -> int:
+        return self.snapshot.total_series
+
+    @property
+    def total_games(self) -> int:
+        return self.snapshot.total_games
+
+    @property
+    def total_champions(self) -> int:
+        return self.snapshot.total_champions
+
+    def load(self, data_dir: Path | None = None, warm: bool = False) -> DataSnapshot:
+        """Load all processed data files and atomically publish them.
+
+        Safe to call while serving traffic: the new snapshot is fully built
+        before the swap, and concurrent reloads are serialized. If the files
+        fail to load (ValueError for a manifest mismatch, or a parse error)
+        the current snapshot is kept and the error propagates. With ``warm``,
+        deferred files are parsed (see DataSnapshot.warm) before the swap too.
+        """
+        d = data_dir or PROCESSED_DIR
+        with self._reload_lock:
+            snapshot = build_snapshot(d, self._snapshot.generation + 1)
+            if warm:
+                snapshot.warm()
+            self._snapshot = snapshot
+        return snapshot
 
     def get_date_range(self) -> tuple[str, str]:
         """Get the date range of the data."""
-        if not self.draft_database.get("series"):
-            return ("", "")
-        dates = []
-        for s in self.draft_database["series"]:
-            for g in s.get("games", []):
-                d = g.get("date", "")
-                if d:
-                    dates.append(d)
-        if not dates:
-            return ("", "")
-        return (min(dates), max(dates))
+        return self.snapshot.date_range
 
 
 # Global singleton
 data_store = DataStore()
+
+
+def windowed(fn: Callable) -> Callable:
+    """Give an engine entry point ``patch=`` / ``since=`` keyword arguments
+    that run it against that patch range of the data."""
+    @functools.wraps(fn)
+    def wrapper(*args, patch: str = "", since: str = "", **kwargs):
+        with data_store.window(patch, since):
+            return fn(*args, **kwargs)
+    return wrapper
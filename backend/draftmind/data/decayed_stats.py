@@ -0,0 +1,228 @@
+"""
+Recency-weighted (exponentially decayed) game and win counts.
+
+Flat statistics weigh a game from two years ago like one from last week.
+Here every game counts ``0.5 ** (age_days / half_life_days)``, where age is
+measured from the newest game seen (``as_of``), so the numbers only move
+when data does. Tables:
+
+- ``games``: decayed number of games (one row, key "");
+- ``champions``: games, wins, picks and bans per champion;
+- ``synergies`` / ``counters``: games and wins per champion pair
+  ("a\\tb" keys, a's record with / against b);
+- ``teams``: games and wins per team;
+- ``team_picks``: games and wins per (team, champion) pick;
+- ``players``: games and wins per (team, player id, champion).
+
+update(game) is O(1) per table row the game touches: values are held
+relative to an anchor date (weight ``2 ** ((date - anchor) / half_life)``)
+and only rebased to ``as_of`` when saved, so folding in a night's games
+never revisits history. Games without a date are skipped. Callers fold
+each game once: the pipeline's StatisticsState dedupes by series id, so
+nothing here grows with the number of games seen.
+
+The half-life is baked into the saved values. from_json keeps the stored
+one and warns when it differs from the half-life asked for; update_statistics
+then refolds the counts from the game log (StatisticsState.rebuild_stale).
+"""
+import warnings
+from datetime import date
+
+DEFAULT_HALF_LIFE_DAYS = 30.0
+
+TABLE_COLUMNS = {
+    "games": ("games",),
+    "champions": ("games", "wins", "picks", "bans"),
+    "synergies": ("games", "wins"),
+    "counters": ("games", "wins"),
+    "teams": ("games", "wins"),
+    "team_picks": ("games", "wins"),
+    "players": ("games", "wins"),
+}
+
+# Rebase before anchored weights get anywhere near float overflow
+_MAX_EXPONENT = 512
+
+
+def _day(value: str) -> int | None:
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+class DecayedStats:
+    """Exponentially decayed counts, updated one game at a time."""
+
+    def __init__(self, half_life_days: float = DEFAULT_HALF_LIFE_DAYS):
+        self.half_life_days = half_life_days
+        self.as_of: int | None = None  # ordinal day of the newest game
+        self._anchor: int | None = None
+        self.tables: dict[str, dict[str, list[float]]] = {name: {} for name in TABLE_COLUMNS}
+        self._mastery: dict[tuple[str, str], float] | None = None
+
+    # -- updates --------------------------------------------------------
+
+    def _weight(self, day: int) -> float:
+        if self._anchor is None:
+            self._anchor = day
+        if self.as_of is None or day > self.as_of:
+            self.as_of = day
+            if (day - self._anchor) / self.half_life_days > _MAX_EXPONENT:
+                self.rebase()
+        return 2.0 ** ((day - self._anchor) / self.half_life_days)
+
+    def _add(self, table: str, key: str, weight: float, *values: float):
+        row = self.tables[table].get(key)
+        if row is None:
+            row = self.tables[table][key] = [0.0] * len(TABLE_COLUMNS[table])
+        for i, v in enumerate(values):
+            if v:
+                row[i] += weight * v
+
+    def update(self, game: dict) -> bool:
+        """Fold one draft_database game in; False if it was skipped (no date)."""
+        day = _day(game.get("date", ""))
+        if day is None:
+            return False
+        self._mastery = None
+        w = self._weight(day)
+
+        self._add("games", "", w, 1)
+        for da in game.get("draft_actions", []):
+            if da["action_type"] == "ban":
+                self._add("champions", da["champion_name"], w, 0, 0, 0, 1)
+            elif da["action_type"] == "pick":
+                won = (game["blue_team"]["won"] if da["team_id"] == game["blue_team"]["team_id"]
+                       else game["red_team"]["won"])
+                self._add("champions", da["champion_name"], w, 0, 0, 1, 0)
+                self._add("team_picks", f"{da['team_id']}\t{da['champion_name']}", w, 1, won)
+
+        sides = (game["blue_team"], game["red_team"])
+        for team, enemy in (sides, sides[::-1]):
+            won = team["won"]
+            tid = team["team_id"]
+            self._add("teams", tid, w, 1, won)
+            champs = [p["champion_name"] for p in team["players"]]
+            for p in team["players"]:
+                champ = p["champion_name"]
+                self._add("champions", champ, w, 1, won)
+                self._add("players", f"{tid}\t{p.get('player_id', '')}\t{champ}", w, 1, won)
+            for i, a in enumerate(champs):
+                for b in champs[:i] + champs[i + 1:]:
+                    self._add("synergies", f"{a}\t{b}", w, 1, won)
+                for p in enemy["players"]:
+                    self._add("counters", f"{a}\t{p['champion_name']}", w, 1, won)
+        return True
+
+    def rebase(self):
+        """Re-anchor every value at ``as_of`` (weights of 1 for the newest games)."""
+        if self._anchor is None or self.as_of is None or self._anchor == self.as_of:
+            return
+        factor = 2.0 ** ((self._anchor - self.as_of) / self.half_life_days)
+        for rows in self.tables.values():
+            for row in rows.values():
+                for i in range(len(row)):
+                    row[i] *= factor
+        self._anchor = self.as_of
+
+    # -- reads (decayed to as_of) ---------------------------------------
+
+    def _scale(self) -> float:
+        if self._anchor is None or self._anchor == self.as_of:
+            return 1.0
+        return 2.0 ** ((self._anchor - self.as_of) / self.half_life_days)
+
+    def get(self, table: str, key: str) -> dict[str, float] | None:
+        row = self.tables[table].get(key)
+        if row is None:
+            return None
+        scale = self._scale()
+        return {c: v * scale for c, v in zip(TABLE_COLUMNS[table], row)}
+
+    @property
+    def total_games(self) -> float:
+        row = self.get("games", "")
+        return row["games"] if row else 0.0
+
+    def champion(self, name: str) -> dict | None:
+        """Decayed games/wins/picks/bans plus the rates meta scoring uses (percent)."""
+        row = self.get("champions", name)
+        if row is None:
+            return None
+        total = self.total_games or 1.0
+        return {
+            **row,
+            "win_rate": row["wins"] / row["games"] * 100 if row["games"] else 0.0,
+            "pick_rate": row["picks"] / total * 100,
+            "ban_rate": row["bans"] / total * 100,
+            "presence": (row["picks"] + row["bans"]) / total * 100,
+        }
+
+    def pair(self, table: str, a: str, b: str) -> dict | None:
+        return self.get(table, f"{a}\t{b}")
+
+    def team(self, team_id: str) -> dict | None:
+        return self.get("teams", team_id)
+
+    def team_pick(self, team_id: str, champion: str) -> dict | None:
+        return self.get("team_picks", f"{team_id}\t{champion}")
+
+    def player_mastery(self, team_id: str, champion: str) -> float:
+        """Most decayed games any of the team's players has on the champion."""
+        if self._mastery is None:
+            mastery: dict[tuple[str, str], float] = {}
+            for key, row in self.tables["players"].items():
+                tid, _, champ = key.split("\t")
+                mastery[(tid, champ)] = max(mastery.get((tid, champ), 0.0), row[0])
+            self._mastery = mastery
+        return self._mastery.get((team_id, champion), 0.0) * self._scale()
+
+    def summary(self, row: dict | None) -> dict | None:
+        """Rounded {games, wins, win_rate} for API responses."""
+        if not row:
+            return None
+        return {
+            "games": round(row["games"], 2),
+            "wins": round(row["wins"], 2),
+            "win_rate": round(row["wins"] / row["games"] * 100, 1) if row["games"] else 0.0,
+        }
+
+    # -- persistence ----------------------------------------------------
+
+    def to_json(self) -> dict:
+        self.rebase()
+        return {
+            "format": "decayed",
+            "half_life_days": self.half_life_days,
+            "as_of": date.fromordinal(self.as_of).isoformat() if self.as_of else "",
+            "tables": {
+                name: {"keys": list(rows), "values": [[round(v, 6) for v in row]
+                                                      for row in rows.values()]}
+                for name, rows in self.tables.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: dict | None,
+                  half_life_days: float = DEFAULT_HALF_LIFE_DAYS) -> "DecayedStats":
+        """Counts saved by to_json, at their stored half-life.
+
+        Warns if that differs from ``half_life_days`` (the values cannot be
+        re-weighted; rebuild them from the games instead).
+        """
+        data = data or {}
+        stored = data.get("half_life_days", half_life_days)
+        if stored != half_life_days:
+            warnings.warn(f"decayed stats were built with a {stored:g}-day half-life, "
+                          f"not the configured {half_life_days:g}; run update_statistics "
+                          "to rebuild them", stacklevel=2)
+        stats = cls(stored)
+        stats.as_of = stats._anchor = _day(data.get("as_of", ""))
+        for name, table in data.get("tables", {}).items():
+            if name in stats.tables:
+                stats.tables[name] = {k: list(v) for k, v in zip(table["keys"], table["values"])}
+        return stats
+
+    def __bool__(self) -> bool:
+        return self.as_of is not None
@@ -0,0 +1,206 @@
+"""
+Append-only game log and the incremental statistics state folded from it.
+
+``game_log.jsonl`` holds one parsed series (a draft_database series record)
+per line, in ingestion order. Lines are only ever appended, so a byte
+offset into the file marks exactly which games have been counted.
+
+StatisticsState bundles every aggregator (see aggregators.py) with the
+manifest tallies, the ids of the series already logged and that offset.
+compute_statistics.py folds the full draft database into a fresh state
+and writes the log from scratch; update_statistics.py appends new series
+and folds in only the lines past the saved offset, so refreshing the
+processed files costs O(new games). A fresh fold over the whole log must
+give the same state, which ``update_statistics --verify`` checks.
+"""
+import json
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from draftmind.data.aggregators import (
+    ChampionCounts, DecayedCounts, LaneMatchupCounts, PairCounts, PatchCounts, PlayerPools,
+    SequencePriorCounts, TeamProfiles,
+)
+from draftmind.data.manifest import ManifestCounts
+
+GAME_LOG_FILE = "game_log.jsonl"
+STATE_FILE = "statistics_state.json"
+STATE_VERSION = 1
+
+# Output file -> aggregator class, in the order compute_statistics reports them
+AGGREGATORS = {
+    "champion_stats.json": ChampionCounts,
+    "champion_pairs.json": PairCounts,
+    "team_profiles.json": TeamProfiles,
+    "player_pools.json": PlayerPools,
+    "sequence_priors.json": SequencePriorCounts,
+    "lane_matchups.json": LaneMatchupCounts,
+    "patch_stats.json": PatchCounts,
+    "decayed_stats.json": DecayedCounts,
+}
+
+# Files small enough to keep human-readable; the rest are written compact
+INDENTED_FILES = ("champion_stats.json", "team_profiles.json", "player_pools.json")
+
+
+class GameLog:
+    """Append-only JSONL file of draft_database series records."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def read(self, offset: int = 0) -> Iterator[tuple[dict, int]]:
+        """(series, offset just past its line) for every complete line from ``offset`` on."""
+        if not self.path.exists():
+            return
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partially written; picked up once the append completes
+                offset += len(line)
+                if line.strip():
+                    yield json.loads(line), offset
+
+    def append(self, series_list: Iterable[dict]) -> int:
+        """Append series records; returns the number written."""
+        lines = [json.dumps(series) + "\n" for series in series_list]
+        if lines:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+        return len(lines)
+
+    def write(self, series_list: Iterable[dict]) -> None:
+        """Replace the log with the given series (full rebuilds)."""
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for series in series_list:
+                f.write(json.dumps(series) + "\n")
+        tmp.replace(self.path)
+
+    def write_database(self, path: Path, header: dict) -> None:
+        """Write draft_database.json (``header`` fields plus every logged series).
+
+        Lines are copied as text rather than parsed, giving the same bytes
+        build_draft_database.py writes for the same series.
+        """
+        prefix = json.dumps({**header, "series": []})[:-2]  # up to and including "series": [
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as out:
+            out.write(prefix)
+            if self.path.exists():
+                with open(self.path, "r", encoding="utf-8") as f:
+                    first = True
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        out.write(("" if first else ", ") + line.rstrip("\n"))
+                        first = False
+            out.write("]}")
+        tmp.replace(path)
+
+
+class StatisticsState:
+    """Every aggregator's counts plus the game log position they reflect."""
+
+    def __init__(self):
+        self.aggregators = {name: cls() for name, cls in AGGREGATORS.items()}
+        self.manifest = ManifestCounts()
+        self.series_ids: set[str] = set()
+        self.unique_champions: set[str] = set()
+        self.log_offset = 0
+
+    def add_series(self, series: dict):
+        self.series_ids.add(series.get("series_id", ""))
+        self.manifest.add(series)
+        for game in series["games"]:
+            for da in game["draft_actions"]:
+                self.unique_champions.add(da["champion_name"])
+            for agg in self.aggregators.values():
+                agg.update(game)
+
+    def catch_up(self, log: GameLog) -> int:
+        """Fold in every series logged past ``log_offset``; returns how many."""
+        added = 0
+        for series, offset in log.read(self.log_offset):
+            self.add_series(series)
+            self.log_offset = offset
+            added += 1
+        return added
+
+    def rebuild_stale(self, log: GameLog) -> list[str]:
+        """Refold aggregators whose settings changed since the state was saved
+        (e.g. DECAY_HALF_LIFE_DAYS) over the logged games; returns their file names."""
+        stale = [name for name, agg in self.aggregators.items() if agg.stale()]
+        if stale:
+            fresh = {name: AGGREGATORS[name]() for name in stale}
+            for series, offset in log.read():
+                if offset > self.log_offset:
+                    break
+                for game in series["games"]:
+                    for agg in fresh.values():
+                        agg.update(game)
+            self.aggregators.update(fresh)
+        return stale
+
+    @classmethod
+    def fold(cls, series_list: Iterable[dict]) -> "StatisticsState":
+        state = cls()
+        for series in series_list:
+            state.add_series(series)
+        return state
+
+    def outputs(self) -> dict[str, dict]:
+        """Contents of every statistics file, keyed by file name."""
+        results = {name: agg.result() for name, agg in self.aggregators.items()
+                   if name != "patch_stats.json"}
+        results["patch_stats.json"] = self.aggregators["patch_stats.json"].result(
+            results["champion_stats.json"], results["team_profiles.json"])
+        return {name: results[name] for name in AGGREGATORS}
+
+    def database_header(self) -> dict:
+        return {
+            "total_series": self.manifest.total_series,
+            "total_games": self.manifest.total_games,
+            "unique_champions": sorted(self.unique_champions),
+        }
+
+    def to_json(self) -> dict:
+        return {
+            "version": STATE_VERSION,
+            "log_offset": self.log_offset,
+            "series_ids": sorted(self.series_ids),
+            "unique_champions": sorted(self.unique_champions),
+            "manifest": self.manifest.state(),
+            "aggregators": {name: agg.state() for name, agg in self.aggregators.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "StatisticsState":
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(f"unsupported statistics state version {data.get('version')!r}")
+        state = cls()
+        state.log_offset = data["log_offset"]
+        state.series_ids = set(data["series_ids"])
+        state.unique_champions = set(data["unique_champions"])
+        state.manifest = ManifestCounts.from_state(data["manifest"])
+        state.aggregators = {name: agg_cls.from_state(data["aggregators"].get(name, {}))
+                             for name, agg_cls in AGGREGATORS.items()}
+        return state
+
+
+def write_json(path: Path, data, indent: bool = False) -> None:
+    """Write JSON via a temp file and rename, so a live server never reads a partial file."""
+    # json.dumps runs the C encoder in one pass; json.dump(f) streams through the
+    # pure-Python one and is about 3x slower on these files
+    text = json.dumps(data, indent=2) if indent else json.dumps(data, separators=(",", ":"))
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    tmp.replace(path)
+
+
+def write_outputs(data_dir: Path, outputs: dict[str, dict]) -> None:
+    for name, data in outputs.items():
+        write_json(data_dir / name, data, indent=name in INDENTED_FILES)
@@ -2,7 +2,10 @@ import requests
 import time
 import json
 from pathlib import Path
-from draftmind.config import CENTRAL_DATA_URL, FILE_DOWNLOAD_URL, SERIES_STATE_URL, GRID_HEADERS, LOL_TITLE_ID
+from draftmind.config import (
+    CENTRAL_DATA_URL, FILE_DOWNLOAD_URL, SERIES_STATE_URL, GRID_HEADERS, GRID_PAGE_DELAY_SECONDS,
+    LOL_TITLE_ID,
+)
 
 
 class GridClient:
@@ -16,7 +19,7 @@ class GridClient:
     def _gql(self, url: str, query: str, label: str = "") -> dict | None:
         self._request_count += 1
         if self._request_count % 18 == 0:
-            time.sleep(3)
+            time.sleep(GRID_PAGE_DELAY_SECONDS)
         try:
             resp = requests.post(url, headers=self.headers, json={"query": query}, timeout=30)
         except Exception as e:
@@ -62,7 +65,7 @@ class GridClient:
             if not data.get("pageInfo", {}).get("hasNextPage"):
                 break
             cursor = data["pageInfo"]["endCursor"]
-            time.sleep(3)  # Rate limit: 20 req/min
+            time.sleep(GRID_PAGE_DELAY_SECONDS)  # Rate limit: 20 req/min
         return all_ids
 
     def download_end_state(self, series_id: str) -> dict | None:
@@ -98,5 +101,5 @@ class GridClient:
                 r = self._gql(self.central_url, query, f"meta:{sid}")
                 if r and r.get("data", {}).get("series"):
                     metadata[sid] = r["data"]["series"]
-                time.sleep(3)
+                time.sleep(GRID_PAGE_DELAY_SECONDS)
         return metadata
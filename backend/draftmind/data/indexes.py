@@ -0,0 +1,194 @@
+"""
+Derived lookup indexes built once per data snapshot.
+Everything here runs at load/reload time so request handlers only do
+dictionary reads.
+"""
+from draftmind.core.champion_catalog import CATALOG
+
+
+def build_team_series_index(draft_database: dict) -> dict[str, list[dict]]:
+    """Map team_id -> the series (in database order) that team played in."""
+    index: dict[str, list[dict]] = {}
+    for series in draft_database.get("series", []):
+        for tid in series.get("teams", {}):
+            index.setdefault(tid, []).append(series)
+    return index
+
+
+def _team_game_view(game: dict, team_id: str) -> dict:
+    """Extract one team's bans, picks, side and result from a game."""
+    bans = []
+    picks = []
+    for da in game.get("draft_actions", []):
+        if da["team_id"] != team_id:
+            continue
+        if da["action_type"] == "ban":
+            bans.append(da["champion_name"])
+        else:
+            picks.append(da["champion_name"])
+
+    if game.get("blue_team", {}).get("team_id") == team_id:
+        side = "blue"
+    elif game.get("red_team", {}).get("team_id") == team_id:
+        side = "red"
+    else:
+        side = ""
+
+    return {
+        "game": game.get("game_sequence", 0),
+        "side": side,
+        "won": bool(side) and game.get("winner_side") == side,
+        "bans": bans,
+        "picks": picks,
+    }
+
+
+def _summarize_series(series: dict, team_id: str) -> dict:
+    """Game-to-game adaptation for one team across a whole series."""
+    games = [_team_game_view(g, team_id) for g in series.get("games", [])]
+
+    transitions = []
+    for prev, cur in zip(games, games[1:]):
+        prev_bans, cur_bans = set(prev["bans"]), set(cur["bans"])
+        transitions.append({
+            "from_game": prev["game"],
+            "to_game": cur["game"],
+            "bans_added": sorted(cur_bans - prev_bans),
+            "bans_dropped": sorted(prev_bans - cur_bans),
+            "repeated_picks": sorted(set(prev["picks"]) & set(cur["picks"])),
+            # "" when the team's side in the previous game is unknown
+            "previous_result": ("W" if prev["won"] else "L") if prev["side"] else "",
+            "side": cur["side"],
+        })
+
+    return {
+        "series_id": series.get("series_id", ""),
+        "games": len(games),
+        "sides": [g["side"] for g in games],
+        "transitions": transitions,
+    }
+
+
+def build_adaptation_summaries(team_series: dict[str, list[dict]]) -> dict[str, dict]:
+    """Precompute per-team adaptation summaries across every game of every series."""
+    summaries = {}
+    for tid, series_list in team_series.items():
+        per_series = [_summarize_series(s, tid) for s in series_list]
+
+        transitions = [t for s in per_series for t in s["transitions"]]
+        ban_changes = sum(len(t["bans_added"]) for t in transitions)
+        repeats = sum(len(t["repeated_picks"]) for t in transitions)
+        side_after_loss = {"blue": 0, "red": 0}
+        side_after_win = {"blue": 0, "red": 0}
+        for t in transitions:
+            if not t["previous_result"]:
+                continue
+            bucket = side_after_loss if t["previous_result"] == "L" else side_after_win
+            if t["side"] in bucket:
+                bucket[t["side"]] += 1
+
+        summaries[tid] = {
+            "series_count": len(per_series),
+            "multi_game_series": sum(1 for s in per_series if s["games"] > 1),
+            "transitions": len(transitions),
+            "avg_ban_changes": round(ban_changes / len(transitions), 2) if transitions else 0.0,
+            "avg_repeated_picks": round(repeats / len(transitions), 2) if transitions else 0.0,
+            "side_after_loss": side_after_loss,
+            "side_after_win": side_after_win,
+            "series": per_series,
+        }
+    return summaries
+
+
+def build_champion_name_map(champion_stats: dict) -> dict[str, str]:
+    """Map case-folded champion name -> canonical key in champion_stats."""
+    return {name.casefold(): name for name in champion_stats}
+
+
+def build_champion_team_index(team_profiles: dict) -> dict[str, list[dict]]:
+    """Map champion -> teams that picked it, sorted by games (most first)."""
+    index: dict[str, list[dict]] = {}
+    for tid, profile in team_profiles.items():
+        for champ, data in profile.get("champion_picks", {}).items():
+            index.setdefault(champ, []).append({
+                "team_id": tid,
+                "team_name": profile["team_name"],
+                "games": data["games"],
+                "wins": data["wins"],
+                "win_rate": round(data["wins"] / max(data["games"], 1) * 100, 1),
+            })
+    for rows in index.values():
+        rows.sort(key=lambda x: -x["games"])
+    return index
+
+
+def build_champion_player_index(player_pools: dict) -> dict[str, list[dict]]:
+    """Map champion -> players who played it, sorted by games (most first)."""
+    index: dict[str, list[dict]] = {}
+    for pid, player in player_pools.items():
+        for champ, data in player.get("champions", {}).items():
+            index.setdefault(champ, []).append({
+                "player_id": pid,
+                "player_name": player["player_name"],
+                "team_id": player["team_id"],
+                "team_name": player["team_name"],
+                **data,
+            })
+    for rows in index.values():
+        rows.sort(key=lambda x: (-x["games"], -x["wins"]))
+    return index
+
+
+CHAMPION_SORT_KEYS = ("presence", "win_rate", "pick_rate", "ban_rate", "games_played", "name")
+
+
+def build_champion_leaderboards(champion_stats: dict) -> dict[tuple[str, str], list[dict]]:
+    """Precompute champion orderings for every (sort key, role) pair.
+
+    Role "" is the unfiltered leaderboard. Ordering matches a stable sort of
+    champion_stats values, descending for everything except name.
+    """
+    champs = list(champion_stats.values())
+    roles = {""} | {c.get("primary_role", "") for c in champs}
+    boards = {}
+    for sort_by in CHAMPION_SORT_KEYS:
+        ordered = sorted(champs, key=lambda x: x.get(sort_by, 0), reverse=sort_by != "name")
+        for role in roles:
+            boards[(sort_by, role)] = (ordered if not role else
+                                       [c for c in ordered if c.get("primary_role") == role])
+    return boards
+
+
+def build_positions(rows: list[dict], key: str) -> dict[str, int]:
+    """Map each row's ``key`` value to its index, for cursor lookups."""
+    return {row[key]: i for i, row in enumerate(rows)}
+
+
+def build_team_leaderboard(team_profiles: dict) -> list[dict]:
+    """Team summaries pre-sorted by total games (most first)."""
+    teams = []
+    for tid, profile in team_profiles.items():
+        top_picks = [
+            {"champion": k, "games": v["games"], "wins": v["wins"],
+             "win_rate": round(v["wins"] / max(v["games"], 1) * 100, 1),
+             "image_url": CATALOG.image_url(k)}
+            for k, v in list(profile.get("champion_picks", {}).items())[:5]
+        ]
+        top_bans = [
+            {"champion": k, "count": v}
+            for k, v in list(profile.get("champion_bans_by", {}).items())[:5]
+        ]
+
+        teams.append({
+            "team_id": tid,
+            "team_name": profile["team_name"],
+            "total_games": profile["total_games"],
+            "total_wins": profile["total_wins"],
+            "win_rate": profile["win_rate"],
+            "series_count": profile["series_count"],
+            "top_picks": top_picks,
+            "top_bans": top_bans,
+        })
+
+    teams.sort(key=lambda x: -x["total_games"])
+    return teams
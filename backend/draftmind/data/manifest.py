@@ -0,0 +1,161 @@
+"""
+Data manifest: small summary of the processed dataset, loaded eagerly.
+
+compute_statistics.py writes manifest.json next to the other processed
+files. It carries the summary fields the API reports on every request
+(series/game totals, date range, player count, per-patch and
+per-tournament counts) and a per-team index of series ids. With those at
+hand, DataStore can leave the large files (draft_database.json,
+player_pools.json) unread until something actually needs them.
+
+``data_version`` is a hash of the processed files the API loads. It only
+changes when the data does, so response caches key on it rather than on
+the reload counter.
+"""
+import hashlib
+from pathlib import Path
+
+MANIFEST_VERSION = 2
+
+# Processed files DataStore reads; data_version covers exactly these
+DATA_FILES = (
+    "champion_stats.json", "champion_pairs.json", "team_profiles.json",
+    "player_pools.json", "draft_database.json", "sequence_priors.json",
+    "lane_matchups.json", "patch_stats.json", "decayed_stats.json",
+)
+
+_READ_CHUNK = 1 << 20
+
+
+def patch_sort_key(patch: str) -> tuple:
+    """Numeric sort key for patch strings ("14.2" < "14.10")."""
+    parts = []
+    for part in patch.split("."):
+        parts.append((0, int(part), "") if part.isdigit() else (1, 0, part))
+    return tuple(parts)
+
+
+def _tally(counts: dict, key: str, series_id: str, date: str, extra: dict | None = None) -> None:
+    row = counts.get(key)
+    if row is None:
+        row = counts[key] = {**(extra or {}), "series": set(), "games": 0,
+                             "first_date": "", "last_date": ""}
+    row["series"].add(series_id)
+    row["games"] += 1
+    if date:
+        if not row["first_date"] or date < row["first_date"]:
+            row["first_date"] = date
+        if date > row["last_date"]:
+            row["last_date"] = date
+
+
+def _finish(rows: dict, key_field: str) -> list[dict]:
+    return [{key_field: key, **row, "series": len(row["series"])} for key, row in rows.items()]
+
+
+class ManifestCounts:
+    """The manifest's totals, date range, breakdowns and team index, one series at a time.
+
+    update_statistics.py keeps one in its saved state so the manifest
+    refreshes without rereading the draft database.
+    """
+
+    def __init__(self):
+        self.total_series = 0
+        self.total_games = 0
+        self.first_date = ""
+        self.last_date = ""
+        self.patches: dict[str, dict] = {}
+        self.tournaments: dict[str, dict] = {}
+        self.team_series: dict[str, list[str]] = {}
+
+    def add(self, series: dict):
+        series_id = series.get("series_id", "")
+        tournament = series.get("tournament") or {}
+        self.total_series += 1
+        for tid in series.get("teams", {}):
+            self.team_series.setdefault(tid, []).append(series_id)
+        for game in series.get("games", []):
+            self.total_games += 1
+            date = game.get("date", "")
+            if date:
+                if not self.first_date or date < self.first_date:
+                    self.first_date = date
+                if date > self.last_date:
+                    self.last_date = date
+            _tally(self.patches, game.get("patch") or "unknown", series_id, date)
+            if tournament.get("id"):
+                _tally(self.tournaments, tournament["id"], series_id, date,
+                       {"name": tournament.get("name", "")})
+
+    def breakdowns(self) -> tuple[list[dict], list[dict]]:
+        """Series/game counts and date span per patch and per tournament.
+
+        Patches are ordered by version; tournaments by first game date. Series
+        without tournament information are left out of the tournament list.
+        """
+        patch_rows = sorted(_finish(self.patches, "patch"), key=lambda r: patch_sort_key(r["patch"]))
+        tournament_rows = sorted(_finish(self.tournaments, "id"),
+                                 key=lambda r: (r["first_date"], r["name"]))
+        return patch_rows, tournament_rows
+
+    def build(self, player_count: int, data_version: str = "") -> dict:
+        patches, tournaments = self.breakdowns()
+        return {
+            "version": MANIFEST_VERSION,
+            "data_version": data_version,
+            "total_series": self.total_series,
+            "total_games": self.total_games,
+            "date_range": [self.first_date, self.last_date],
+            "player_count": player_count,
+            "patches": patches,
+            "tournaments": tournaments,
+            "team_series": self.team_series,
+        }
+
+    def state(self) -> dict:
+        def rows(table):
+            return {k: {**row, "series": sorted(row["series"])} for k, row in table.items()}
+        return {**vars(self), "patches": rows(self.patches), "tournaments": rows(self.tournaments)}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "ManifestCounts":
+        counts = cls()
+        for name, value in state.items():
+            if name in ("patches", "tournaments"):
+                value = {k: {**row, "series": set(row["series"])} for k, row in value.items()}
+            setattr(counts, name, value)
+        return counts
+
+
+def compute_data_version(data_dir: Path) -> str:
+    """Content hash of the processed data files (missing files hash as absent)."""
+    digest = hashlib.blake2b(digest_size=8)
+    for name in DATA_FILES:
+        path = data_dir / name
+        digest.update(name.encode())
+        if not path.exists():
+            digest.update(b"\0missing")
+            continue
+        with open(path, "rb") as f:
+            while chunk := f.read(_READ_CHUNK):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def data_version_of(contents: dict[str, bytes | None]) -> str:
+    """compute_data_version over file contents already in memory (None for a missing file)."""
+    digest = hashlib.blake2b(digest_size=8)
+    for name in DATA_FILES:
+        digest.update(name.encode())
+        data = contents.get(name)
+        digest.update(b"\0missing" if data is None else data)
+    return digest.hexdigest()
+
+
+def build_manifest(draft_database: dict, player_pools: dict, data_version: str = "") -> dict:
+    """Summary fields and per-team series ids for a draft database and player pools."""
+    counts = ManifestCounts()
+    for series in draft_database.get("series", []):
+        counts.add(series)
+    return counts.build(len(player_pools), data_version)
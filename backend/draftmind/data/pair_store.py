@@ -0,0 +1,252 @@
+"""
+Sparse champion pair store (synergies and counters).
+
+champion_pairs.json holds raw (games, wins) counts for every observed pair
+as CSR arrays: one row per champion in sorted-name order, partners sorted
+by champion id within each row. Nothing is filtered when the file is
+written. Consumers pick a significance threshold, or a Bayesian-shrunk win
+rate, when they query.
+
+At load time each table gets:
+- a dense champion x champion position matrix (about 170 x 170), so one
+  pair lookup is two dict hits and two list reads (scalar lookups use
+  Python-list mirrors of the arrays; numpy scalar indexing is ~5x slower);
+- a per-row ordering by games (descending) with prefix counts, so "all
+  partners with at least k games" is a contiguous slice found by a binary
+  search rather than a filter over the row.
+
+Older nested-dict files ({"synergies": {a: {b: {games, wins, win_rate}}}})
+are converted on load.
+
+LaneMatchupStore holds one such table per role (lane_matchups.json), with
+extra per-pair sum columns (stat differentials) that queries report as
+per-game averages.
+"""
+import numpy as np
+
+# Threshold the engines have always applied to pair data
+DEFAULT_MIN_GAMES = 2
+
+
+def _win_rate_pct(wins: np.ndarray, games: np.ndarray) -> np.ndarray:
+    """Per-pair win rate in percent, rounded like the pipeline always has."""
+    return np.array([round(w / g * 100, 1) if g else 0.0
+                     for w, g in zip(wins.tolist(), games.tolist())])
+
+
+def _csr(champions: list[str], index: dict[str, int], table: dict,
+         sum_keys: tuple[str, ...] = ()) -> dict:
+    """Nested {a: {b: {"games", "wins", *sum_keys}}} -> CSR column lists."""
+    out = {"indptr": [0], "indices": [], "games": [], "wins": [], **{k: [] for k in sum_keys}}
+    for champ in champions:
+        row = table.get(champ, {})
+        for partner in sorted(row, key=index.__getitem__):
+            out["indices"].append(index[partner])
+            for key in ("games", "wins") + sum_keys:
+                out[key].append(row[partner][key])
+        out["indptr"].append(len(out["indices"]))
+    return out
+
+
+def _champions_of(*tables: dict) -> list[str]:
+    return sorted({c for t in tables for c in t} | {b for t in tables for row in t.values() for b in row})
+
+
+class PairTable:
+    """One pair relation (synergy, counter, lane matchup) over a shared champion index.
+
+    Keyword columns beyond games/wins are per-pair sums; lookups report them
+    as per-game averages under the same name.
+    """
+
+    __slots__ = ("names", "index", "indptr", "indices", "games", "wins", "win_rate",
+                 "sums", "row_games", "_pos", "_games", "_wins", "_win_rate", "_sums",
+                 "_order", "_ordered_games")
+
+    def __init__(self, names: list[str], index: dict[str, int], indptr, indices, games, wins,
+                 **sums):
+        self.names = names
+        self.index = index
+        n = len(names)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.games = np.asarray(games, dtype=np.int32)
+        self.wins = np.asarray(wins, dtype=np.int32)
+        self.win_rate = _win_rate_pct(self.wins, self.games)
+        self.sums = {k: np.asarray(v, dtype=np.float64) for k, v in sums.items()}
+        self._sums = {k: v.tolist() for k, v in self.sums.items()}
+
+        pos = np.full((n, n), -1, dtype=np.int32)
+        rows = np.repeat(np.arange(n), np.diff(self.indptr))
+        pos[rows, self.indices] = np.arange(len(self.indices), dtype=np.int32)
+        # Games per row across all partners
+        self.row_games = np.bincount(rows, weights=self.games, minlength=n).astype(np.int64)
+        self._pos = pos.tolist()
+        self._games = self.games.tolist()
+        self._wins = self.wins.tolist()
+        self._win_rate = self.win_rate.tolist()
+
+        # Within each row: positions by (-games, -win_rate, partner id)
+        self._order = np.lexsort((self.indices, -self.win_rate, -self.games, rows))
+        self._ordered_games = self.games[self._order]
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def _find(self, a: str, b: str) -> int:
+        i, j = self.index.get(a), self.index.get(b)
+        if i is None or j is None:
+            return -1
+        return self._pos[i][j]
+
+    def get(self, a: str, b: str, min_games: int = DEFAULT_MIN_GAMES) -> dict | None:
+        """{games, wins, win_rate} for the pair, or None below the threshold."""
+        k = self._find(a, b)
+        if k < 0 or self._games[k] < min_games:
+            return None
+        return self._entry(k)
+
+    def _entry(self, k: int) -> dict:
+        games = self._games[k]
+        entry = {"games": games, "wins": self._wins[k], "win_rate": self._win_rate[k]}
+        for key, values in self._sums.items():
+            entry[key] = round(values[k] / games, 1) if games else 0.0
+        return entry
+
+    def win_rate_of(self, a: str, b: str, min_games: int = DEFAULT_MIN_GAMES,
+                    prior_games: float = 0.0, prior_rate: float = 50.0) -> float | None:
+        """a's win rate (percent) with b, or None below ``min_games``.
+
+        With ``prior_games`` > 0 the rate is shrunk toward ``prior_rate`` as
+        if that many extra games had been played at it.
+        """
+        k = self._find(a, b)
+        if k < 0 or self._games[k] < min_games:
+            return None
+        if not prior_games:
+            return self._win_rate[k]
+        return ((self._wins[k] + prior_games * prior_rate / 100)
+                / (self._games[k] + prior_games) * 100)
+
+    def _row_slice(self, i: int, min_games: int) -> tuple[int, int]:
+        lo, hi = int(self.indptr[i]), int(self.indptr[i + 1])
+        # Row games are descending, so the qualifying partners are a prefix
+        n = int(np.searchsorted(-self._ordered_games[lo:hi], -min_games, side="right"))
+        return lo, lo + n
+
+    def count(self, a: str, min_games: int = DEFAULT_MIN_GAMES) -> int:
+        """How many partners of ``a`` have at least ``min_games`` games."""
+        i = self.index.get(a)
+        if i is None:
+            return 0
+        lo, hi = self._row_slice(i, min_games)
+        return hi - lo
+
+    def top(self, a: str, limit: int | None = None,
+            min_games: int = DEFAULT_MIN_GAMES) -> list[tuple[str, dict]]:
+        """Partners of ``a`` by games played, as (name, {games, wins, win_rate})."""
+        i = self.index.get(a)
+        if i is None:
+            return []
+        lo, hi = self._row_slice(i, min_games)
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return [(self.names[self.indices[k]], self._entry(k))
+                for k in self._order[lo:hi].tolist()]
+
+    def matrix(self, index: dict[str, int], min_games: int = DEFAULT_MIN_GAMES
+               ) -> tuple[np.ndarray, np.ndarray]:
+        """(win rate percent, usable) as dense matrices over another champion index."""
+        n = len(index)
+        values = np.zeros((n, n))
+        usable = np.zeros((n, n), dtype=bool)
+        remap = np.array([index.get(c, -1) for c in self.names], dtype=np.int64)
+        rows = np.repeat(np.arange(len(self.names)), np.diff(self.indptr))
+        i, j = remap[rows], remap[self.indices]
+        keep = (i >= 0) & (j >= 0) & (self.games >= min_games)
+        values[i[keep], j[keep]] = self.win_rate[keep]
+        usable[i[keep], j[keep]] = True
+        return values, usable
+
+    def to_json(self) -> dict:
+        return {"indptr": self.indptr.tolist(), "indices": self.indices.tolist(),
+                "games": self.games.tolist(), "wins": self.wins.tolist(),
+                **{k: [round(x, 2) for x in v] for k, v in self._sums.items()}}
+
+
+class PairStore:
+    """Synergy and counter tables sharing one sorted champion index."""
+
+    __slots__ = ("champions", "index", "synergies", "counters")
+
+    def __init__(self, champions: list[str], synergies: dict, counters: dict):
+        self.champions = list(champions)
+        self.index = {c: i for i, c in enumerate(self.champions)}
+        self.synergies = PairTable(self.champions, self.index, **synergies)
+        self.counters = PairTable(self.champions, self.index, **counters)
+
+    @classmethod
+    def from_counts(cls, synergy: dict, counter: dict) -> "PairStore":
+        """Build from nested {a: {b: {"games", "wins", ...}}} count dicts."""
+        champions = _champions_of(synergy, counter)
+        index = {c: i for i, c in enumerate(champions)}
+        return cls(champions, _csr(champions, index, synergy), _csr(champions, index, counter))
+
+    @classmethod
+    def from_json(cls, data: dict | None) -> "PairStore":
+        """Load either the CSR file format or the older nested format."""
+        data = data or {}
+        if data.get("format") == "csr":
+            return cls(data["champions"], data["synergies"], data["counters"])
+        return cls.from_counts(data.get("synergies", {}), data.get("counters", {}))
+
+    def to_json(self) -> dict:
+        return {
+            "format": "csr",
+            "champions": self.champions,
+            "synergies": self.synergies.to_json(),
+            "counters": self.counters.to_json(),
+        }
+
+
+class LaneMatchupStore:
+    """Head-to-head tables partitioned by role: roles[role].get(a, b) is a vs b in that lane."""
+
+    __slots__ = ("champions", "index", "roles")
+
+    def __init__(self, champions: list[str], roles: dict[str, dict]):
+        self.champions = list(champions)
+        self.index = {c: i for i, c in enumerate(self.champions)}
+        self.roles = {role: PairTable(self.champions, self.index, **table)
+                      for role, table in roles.items()}
+
+    @classmethod
+    def from_counts(cls, roles: dict[str, dict], sum_keys: tuple[str, ...] = ()) -> "LaneMatchupStore":
+        """Build from {role: {a: {b: {"games", "wins", *sum_keys}}}} count dicts."""
+        champions = _champions_of(*roles.values())
+        index = {c: i for i, c in enumerate(champions)}
+        return cls(champions, {role: _csr(champions, index, table, sum_keys)
+                               for role, table in roles.items()})
+
+    @classmethod
+    def from_json(cls, data: dict | None) -> "LaneMatchupStore":
+        data = data or {}
+        return cls(data.get("champions", []), data.get("roles", {}))
+
+    def to_json(self) -> dict:
+        return {
+            "format": "csr",
+            "champions": self.champions,
+            "roles": {role: table.to_json() for role, table in self.roles.items()},
+        }
+
+    def table(self, role: str) -> PairTable | None:
+        return self.roles.get(role)
+
+    def role_games(self, champion: str) -> dict[str, int]:
+        """Games the champion has played in each role, most played first."""
+        i = self.index.get(champion)
+        if i is None:
+            return {}
+        games = {role: int(t.row_games[i]) for role, t in self.roles.items() if t.row_games[i]}
+        return dict(sorted(games.items(), key=lambda kv: -kv[1]))
@@ -0,0 +1,270 @@
+"""
+Patch-partitioned statistics (patch_stats.json).
+
+champion_stats.json, champion_pairs.json and team_profiles.json aggregate
+every game ever played, so an old meta weighs as much as the current one.
+compute_statistics.py also writes the underlying counts split by patch:
+
+- champion counts (picks, bans, games, wins, per-side splits, K/D/A and
+  other stat sums), one column of length n_champions per patch;
+- synergy and counter pair counts, over the CSR structure of all pairs
+  ever observed (see PairStore);
+- team totals (games, wins, per side) and per-team champion pick counts.
+
+Each column is stored sparsely per patch. At load time it becomes a dense
+(patches + 1) x entries prefix-sum array, so the counts for any contiguous
+patch range are one subtraction: per-query cost is proportional to the
+number of champions (or pairs), never to the number of games. Patches are
+ordered by version, with games of unknown patch first so ``since`` never
+includes them.
+"""
+import numpy as np
+
+from draftmind.core.champion_catalog import CATALOG
+from draftmind.data.manifest import patch_sort_key
+from draftmind.data.pair_store import PairStore
+
+UNKNOWN_PATCH = "unknown"
+
+# Raw per-champion accumulators, as compute_champion_stats keeps them
+CHAMPION_COUNT_COLUMNS = (
+    "total_games", "total_wins", "total_bans", "total_picks",
+    "blue_picks", "blue_wins", "red_picks", "red_wins",
+    "kills_sum", "deaths_sum", "assists_sum", "damage_sum", "gold_sum", "vision_sum", "cs_sum",
+)
+PAIR_COUNT_COLUMNS = ("games", "wins")
+TEAM_COUNT_COLUMNS = ("total_games", "total_wins", "blue_games", "blue_wins", "red_games", "red_wins")
+
+
+def patch_order(patches) -> list[str]:
+    """Patches in partition order: unknown first, then by version."""
+    return sorted(patches, key=lambda p: (p != UNKNOWN_PATCH, patch_sort_key(p)))
+
+
+def champion_stats_row(name: str, s: dict, total_games: int) -> dict:
+    """One champion_stats.json entry from raw counts (CHAMPION_COUNT_COLUMNS)."""
+    games = s["total_games"] or 1
+    meta = CATALOG.meta(name)
+    return {
+        "name": name,
+        "image_url": CATALOG.image_url(name),
+        "primary_role": meta.primary_role if meta else "unknown",
+        "tags": list(meta.tags) if meta else [],
+        "total_games": total_games,
+        "games_played": s["total_games"],
+        "wins": s["total_wins"],
+        "win_rate": round(s["total_wins"] / max(s["total_games"], 1) * 100, 1),
+        "picks": s["total_picks"],
+        "pick_rate": round(s["total_picks"] / max(total_games, 1) * 100, 1),
+        "bans": s["total_bans"],
+        "ban_rate": round(s["total_bans"] / max(total_games, 1) * 100, 1),
+        "presence": round((s["total_picks"] + s["total_bans"]) / max(total_games, 1) * 100, 1),
+        "blue_picks": s["blue_picks"],
+        "blue_wins": s["blue_wins"],
+        "blue_win_rate": round(s["blue_wins"] / max(s["blue_picks"], 1) * 100, 1),
+        "red_picks": s["red_picks"],
+        "red_wins": s["red_wins"],
+        "red_win_rate": round(s["red_wins"] / max(s["red_picks"], 1) * 100, 1),
+        "avg_kills": round(s["kills_sum"] / games, 1),
+        "avg_deaths": round(s["deaths_sum"] / games, 1),
+        "avg_assists": round(s["assists_sum"] / games, 1),
+        "avg_damage": round(s["damage_sum"] / games),
+        "avg_gold": round(s["gold_sum"] / games),
+        "avg_vision": round(s["vision_sum"] / games, 1),
+        "avg_cs": round(s["cs_sum"] / games, 1),
+    }
+
+
+def encode_partitions(rows: list[dict[int, dict]], columns: tuple[str, ...]) -> dict:
+    """Per-partition {entry: {column: value}} -> partition-major sparse lists."""
+    out = {"indptr": [0], "pos": [], **{c: [] for c in columns}}
+    for row in rows:
+        for pos in sorted(row):
+            out["pos"].append(pos)
+            for c in columns:
+                out[c].append(row[pos][c])
+        out["indptr"].append(len(out["pos"]))
+    return out
+
+
+def encode_sparse(rows: list[dict[tuple[int, int], dict]], n_rows: int,
+                  columns: tuple[str, ...]) -> dict:
+    """Per-partition {(row, col): counts} -> CSR structure of every observed cell plus
+    partition-major counts over its positions."""
+    cells = sorted({cell for row in rows for cell in row})
+    position = {cell: k for k, cell in enumerate(cells)}
+    indptr = np.searchsorted([r for r, _ in cells], np.arange(n_rows + 1)).tolist()
+    return {
+        "indptr": indptr,
+        "indices": [c for _, c in cells],
+        "partitions": encode_partitions(
+            [{position[cell]: counts for cell, counts in row.items()} for row in rows], columns),
+    }
+
+
+class PartitionedCounts:
+    """Count columns over ``size`` entries, summed over any contiguous partition range."""
+
+    __slots__ = ("size", "_cumulative")
+
+    def __init__(self, data: dict, partitions: int, size: int, columns: tuple[str, ...]):
+        self.size = size
+        indptr = np.asarray(data.get("indptr") or [0] * (partitions + 1), dtype=np.int64)
+        pos = np.asarray(data.get("pos", []), dtype=np.int64)
+        rows = np.repeat(np.arange(partitions), np.diff(indptr))
+        self._cumulative = {}
+        for c in columns:
+            table = np.zeros((partitions + 1, size))
+            table[rows + 1, pos] = data.get(c, [])
+            self._cumulative[c] = np.cumsum(table, axis=0)
+
+    def sum(self, lo: int, hi: int) -> dict[str, np.ndarray]:
+        """Per-entry totals over partitions [lo, hi)."""
+        return {c: cum[hi] - cum[lo] for c, cum in self._cumulative.items()}
+
+
+class _SparseCounts:
+    """CSR (row, col) cells with partitioned counts."""
+
+    __slots__ = ("indptr", "indices", "rows", "counts")
+
+    def __init__(self, data: dict, partitions: int, n_rows: int, columns: tuple[str, ...]):
+        self.indptr = np.asarray(data.get("indptr") or [0] * (n_rows + 1), dtype=np.int64)
+        self.indices = np.asarray(data.get("indices", []), dtype=np.int32)
+        self.rows = np.repeat(np.arange(n_rows), np.diff(self.indptr))
+        self.counts = PartitionedCounts(data.get("partitions", {}), partitions,
+                                        len(self.indices), columns)
+
+    def window(self, lo: int, hi: int) -> tuple[np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        """(rows, cols, counts) of the cells with games in [lo, hi)."""
+        counts = self.counts.sum(lo, hi)
+        keep = counts["games"] > 0
+        return self.rows[keep], self.indices[keep], {c: v[keep] for c, v in counts.items()}
+
+    def csr(self, lo: int, hi: int) -> dict:
+        """PairTable arguments for the window (cells without games dropped)."""
+        rows, cols, counts = self.window(lo, hi)
+        indptr = np.searchsorted(rows, np.arange(len(self.indptr)))
+        return {"indptr": indptr, "indices": cols,
+                "games": counts["games"].astype(np.int64), "wins": counts["wins"].astype(np.int64)}
+
+
+class PatchStats:
+    """Champion, pair and team counts partitioned by patch."""
+
+    def __init__(self, data: dict | None = None):
+        data = data or {}
+        self.patches: list[str] = list(data.get("patches", []))
+        self.index = {p: i for i, p in enumerate(self.patches)}
+        self._keys = [patch_sort_key(p) for p in self.patches]
+        self.first_dates: list[str] = list(data.get("first_dates", []))
+        self.last_dates: list[str] = list(data.get("last_dates", []))
+        n = len(self.patches)
+        self._games = np.concatenate([[0], np.cumsum(data.get("games", [0] * n))]).astype(np.int64)
+
+        self.champions: list[str] = list(data.get("champions", []))
+        self.champion_counts = PartitionedCounts(data.get("champion_counts", {}), n,
+                                                 len(self.champions), CHAMPION_COUNT_COLUMNS)
+        self.synergies = _SparseCounts(data.get("synergies", {}), n, len(self.champions),
+                                       PAIR_COUNT_COLUMNS)
+        self.counters = _SparseCounts(data.get("counters", {}), n, len(self.champions),
+                                      PAIR_COUNT_COLUMNS)
+
+        self.teams: list[str] = list(data.get("teams", []))
+        self.team_counts = PartitionedCounts(data.get("team_counts", {}), n, len(self.teams),
+                                             TEAM_COUNT_COLUMNS)
+        self.team_picks = _SparseCounts(data.get("team_picks", {}), n, len(self.teams),
+                                        PAIR_COUNT_COLUMNS)
+
+    def __bool__(self) -> bool:
+        return bool(self.patches)
+
+    def resolve(self, patch: str = "", since: str = "") -> tuple[int, int] | None:
+        """Partition range [lo, hi) for a ``patch`` or ``since`` filter.
+
+        ``since`` is a patch ("14.5": that patch and later) or an ISO date
+        (every patch with games on or after it). Returns None when no filter
+        is given or the range covers every partition; raises ValueError for
+        an unknown patch or an empty range.
+        """
+        if not patch and not since:
+            return None
+        if not self:
+            raise ValueError("Patch-partitioned statistics are not available")
+        if patch and since:
+            raise ValueError("Use either patch or since, not both")
+        if patch:
+            if patch not in self.index:
+                raise ValueError(f"Unknown patch '{patch}'")
+            lo = self.index[patch]
+            hi = lo + 1
+        else:
+            hi = len(self.patches)
+            if "-" in since:
+                lo = next((i for i, d in enumerate(self.last_dates) if d and d >= since), hi)
+            else:
+                key = patch_sort_key(since)
+                lo = next((i for i, (p, k) in enumerate(zip(self.patches, self._keys))
+                           if p != UNKNOWN_PATCH and k >= key), hi)
+            if lo == hi:
+                raise ValueError(f"No games since {since}")
+        if lo == 0 and hi == len(self.patches):
+            return None
+        return lo, hi
+
+    def games(self, lo: int, hi: int) -> int:
+        return int(self._games[hi] - self._games[lo])
+
+    def champion_stats(self, lo: int, hi: int) -> dict:
+        """champion_stats.json equivalent for patches [lo, hi)."""
+        total_games = self.games(lo, hi)
+        counts = {c: v.tolist() for c, v in self.champion_counts.sum(lo, hi).items()}
+        result = {}
+        for i, name in enumerate(self.champions):
+            s = {c: (round(v[i]) if not c.endswith("_sum") else v[i]) for c, v in counts.items()}
+            if s["total_picks"] or s["total_bans"]:
+                result[name] = champion_stats_row(name, s, total_games)
+        return result
+
+    def champion_pairs(self, lo: int, hi: int) -> PairStore:
+        """Synergy and counter tables for patches [lo, hi)."""
+        return PairStore(self.champions, self.synergies.csr(lo, hi), self.counters.csr(lo, hi))
+
+    def team_profiles(self, lo: int, hi: int, profiles: dict) -> dict:
+        """Team profiles with record and champion picks restricted to patches [lo, hi).
+
+        Other profile fields (bans, first picks, player pools, recent
+        results) keep their all-time values. Teams without games in the
+        range are left out.
+        """
+        totals = {c: v.tolist() for c, v in self.team_counts.sum(lo, hi).items()}
+        rows, cols, counts = self.team_picks.window(lo, hi)
+        picks: dict[int, list[tuple[str, int, int]]] = {}
+        for t, c, g, w in zip(rows.tolist(), cols.tolist(),
+                              counts["games"].tolist(), counts["wins"].tolist()):
+            picks.setdefault(t, []).append((self.champions[c], round(g), round(w)))
+
+        result = {}
+        for t, tid in enumerate(self.teams):
+            profile = profiles.get(tid)
+            games = round(totals["total_games"][t])
+            if not profile or not games:
+                continue
+            r = {c: round(v[t]) for c, v in totals.items()}
+            result[tid] = {
+                **profile,
+                "total_games": games,
+                "total_wins": r["total_wins"],
+                "win_rate": round(r["total_wins"] / games * 100, 1),
+                "blue_games": r["blue_games"],
+                "blue_wins": r["blue_wins"],
+                "blue_win_rate": round(r["blue_wins"] / max(r["blue_games"], 1) * 100, 1),
+                "red_games": r["red_games"],
+                "red_wins": r["red_wins"],
+                "red_win_rate": round(r["red_wins"] / max(r["red_games"], 1) * 100, 1),
+                "champion_picks": {
+                    champ: {"games": g, "wins": w}
+                    for champ, g, w in sorted(picks.get(t, []), key=lambda x: -x[1])
+                },
+            }
+        return result
@@ -2,12 +2,13 @@
 Composition analysis engine.
 Analyzes team compositions for damage balance, CC, scaling, and archetype.
 """
+import numpy as np
+
+from draftmind.core.champion_catalog import CATALOG
 from draftmind.core.champion_roles import (
-    get_champion_meta, get_damage_profile, get_cc_score,
-    get_scaling_profile, has_role_coverage, get_engage_champions
+    get_damage_profile, get_cc_score, get_scaling_profile, has_role_coverage, assign_roles
 )
 from draftmind.data.data_loader import data_store
-from draftmind.data.champion_metadata import get_champion_image_url
 
 
 COMPOSITION_ARCHETYPES = {
@@ -20,14 +21,19 @@ COMPOSITION_ARCHETYPES = {
     "balanced": "Balanced composition with no extreme specialization",
 }
 
+# Lane-aware counter score: share given to the direct lane matchup, the
+# games it needs, and pseudo-games shrinking its win rate toward 50%
+LANE_WEIGHT = 0.5
+LANE_MIN_GAMES = 2
+LANE_PRIOR_GAMES = 5.0
+
 
 def classify_composition(champion_names: list[str]) -> str:
     """Classify a team composition archetype."""
     if len(champion_names) < 3:
         return "balanced"
 
-    engage_champs = get_engage_champions()
-    engage_count = sum(1 for c in champion_names if c in engage_champs)
+    engage_count = sum(1 for c in champion_names if c in CATALOG.engage)
 
     damage = get_damage_profile(champion_names)
     scaling = get_scaling_profile(champion_names)
@@ -36,7 +42,7 @@ def classify_composition(champion_names: list[str]) -> str:
     # Count tags
     tag_counts = {}
     for name in champion_names:
-        meta = get_champion_meta(name)
+        meta = CATALOG.meta(name)
         if meta:
             for tag in meta.tags:
                 tag_counts[tag] = tag_counts.get(tag, 0) + 1
@@ -72,8 +78,7 @@ def analyze_composition(champion_names: list[str], team_side: str = "",
     roles = has_role_coverage(champion_names)
     comp_type = classify_composition(champion_names)
 
-    engage_champs = get_engage_champions()
-    engage_count = sum(1 for c in champion_names if c in engage_champs)
+    engage_count = sum(1 for c in champion_names if c in CATALOG.engage)
 
     # Calculate strengths and weaknesses
     strengths = []
@@ -216,17 +221,77 @@ def estimate_win_probability(blue_analysis: dict, red_analysis: dict,
     return max(0.25, min(0.75, round(probability, 3)))
 
 
+def _round(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """Python's round() elementwise; np.round differs on exact half-way values."""
+    return np.array([round(v, ndigits) for v in values.tolist()])
+
+
+def estimate_win_probability_batch(tables, blue, red, blue_team_id: str | None = None,
+                                   red_team_id: str | None = None) -> np.ndarray:
+    """Heuristic estimate_win_probability for many drafts given as champion-id arrays.
+
+    ``tables`` is a FeatureTables; ``blue`` / ``red`` are (N x picks) arrays.
+    Mirrors the heuristic fallback above (not the ML model) signal by signal.
+    """
+    sides = []
+    for picks in (np.asarray(blue, dtype=np.intp), np.asarray(red, dtype=np.intp)):
+        picks = picks.reshape(len(picks), -1)
+        n = len(picks)
+        has_stats = tables.has_stats[picks]
+        has_meta = tables.has_meta[picks]
+        n_stats = has_stats.sum(axis=1)
+        n_meta = has_meta.sum(axis=1)
+        wr_sum = np.where(has_stats, tables.stats["win_rate"][picks], 0.0).sum(axis=1)
+        avg_wr = _round(np.where(n_stats > 0, wr_sum / np.maximum(n_stats, 1), 50.0), 1)
+
+        syn_sum, syn_n = np.zeros(n), np.zeros(n, dtype=int)
+        for i in range(picks.shape[1]):
+            for j in range(i + 1, picks.shape[1]):
+                mask = tables.synergy_mask[picks[:, i], picks[:, j]]
+                wr = tables.synergy_pct[picks[:, i], picks[:, j]]
+                syn_sum += np.where(mask, (wr - 30) / 40, 0.0)
+                syn_n += mask
+        synergy = _round(np.where(syn_n > 0, syn_sum / np.maximum(syn_n, 1), 0.5), 2)
+
+        cc_sum = np.where(has_meta, tables.cc[picks], 0.0).sum(axis=1)
+        cc = _round(np.where(n_meta > 0, cc_sum / np.maximum(n_meta, 1), 0.0), 2)
+        engage = tables.engage[picks].sum(axis=1)
+        physical = ((tables.damage[picks] == 0) & has_meta).sum(axis=1)
+        magic = ((tables.damage[picks] == 1) & has_meta).sum(axis=1)
+        balance = 1.0 - np.abs(physical - magic) / np.maximum(n_meta, 1)
+        roles = sum(((tables.role[picks] == r) & has_meta).any(axis=1).astype(int)
+                    for r in range(5))
+        sides.append((avg_wr, synergy, cc, engage, balance, roles >= 5))
+
+    (b_wr, b_syn, b_cc, b_eng, b_bal, b_full), (r_wr, r_syn, r_cc, r_eng, r_bal, r_full) = sides
+    score = np.clip((b_wr - r_wr) / 100 * 2, -0.10, 0.10)
+    score += np.clip((b_syn - r_syn) * 0.5, -0.05, 0.05)
+    score += np.clip((b_cc - r_cc) * 0.02, -0.04, 0.04)
+    score += np.clip((b_eng - r_eng) * 0.015, -0.03, 0.03)
+    score += np.clip((b_bal - r_bal) * 0.06, -0.03, 0.03)
+    score += np.where(b_full & ~r_full, 0.02, np.where(r_full & ~b_full, -0.02, 0.0))
+
+    if blue_team_id and red_team_id:
+        blue_profile = data_store.team_profiles.get(blue_team_id)
+        red_profile = data_store.team_profiles.get(red_team_id)
+        if blue_profile and red_profile:
+            team_wr_diff = (blue_profile["win_rate"] - red_profile["win_rate"]) / 100
+            score += max(-0.08, min(0.08, team_wr_diff * 1.5))
+
+    return np.clip(_round(0.5 + score, 3), 0.25, 0.75)
+
+
 def compute_synergy_score(champion_names: list[str]) -> float:
     """Compute average synergy score between all pairs in the team."""
-    synergies = data_store.champion_pairs.get("synergies", {})
+    synergies = data_store.champion_pairs.synergies
     scores = []
 
     for i, c1 in enumerate(champion_names):
         for c2 in champion_names[i+1:]:
-            pair_data = synergies.get(c1, {}).get(c2)
-            if pair_data and pair_data["games"] >= 2:
+            wr = synergies.win_rate_of(c1, c2)
+            if wr is not None:
                 # Normalize win rate to 0-1 scale centered on 50%
-                scores.append((pair_data["win_rate"] - 30) / 40)
+                scores.append((wr - 30) / 40)
 
     return sum(scores) / len(scores) if scores else 0.5
 
@@ -236,18 +301,45 @@ def get_counter_score(champion_name: str, opponent_picks: list[str]) -> float:
     if not opponent_picks:
         return 0.5
 
-    counters = data_store.champion_pairs.get("counters", {})
-    champ_counters = counters.get(champion_name, {})
+    counters = data_store.champion_pairs.counters
 
     scores = []
     for opp in opponent_picks:
-        matchup = champ_counters.get(opp)
-        if matchup and matchup["games"] >= 2:
-            scores.append(matchup["win_rate"] / 100)
+        wr = counters.win_rate_of(champion_name, opp)
+        if wr is not None:
+            scores.append(wr / 100)
 
     return sum(scores) / len(scores) if scores else 0.5
 
 
+def get_lane_counter_score(champion_name: str, opponent_picks: list[str],
+                           role: str | None = None) -> float:
+    """Counter score (0-1) weighted toward the lane opponent.
+
+    The lane opponent is whichever enemy pick assign_roles() puts in the
+    champion's role (its primary role unless ``role`` is given). When the
+    lane index has that head-to-head, its shrunk win rate is blended with
+    the all-opponents counter score; otherwise this is get_counter_score.
+    """
+    overall = get_counter_score(champion_name, opponent_picks)
+    if not opponent_picks:
+        return overall
+    if role is None:
+        meta = CATALOG.meta(champion_name)
+        role = meta.primary_role if meta else None
+    table = data_store.lane_matchups.table(role) if role else None
+    if table is None:
+        return overall
+    lane_opponent = next((c for c, r in assign_roles(opponent_picks).items() if r == role), None)
+    if lane_opponent is None:
+        return overall
+    wr = table.win_rate_of(champion_name, lane_opponent, min_games=LANE_MIN_GAMES,
+                           prior_games=LANE_PRIOR_GAMES)
+    if wr is None:
+        return overall
+    return LANE_WEIGHT * wr / 100 + (1 - LANE_WEIGHT) * overall
+
+
 def score_composition_fit(champion_name: str, existing_picks: list[str]) -> float:
     """Score how well a champion fits with existing team picks (0-1)."""
     if not existing_picks:
@@ -275,18 +367,17 @@ def score_composition_fit(champion_name: str, existing_picks: list[str]) -> floa
     role_score = 0.2 if new_roles_filled > old_roles_filled else 0.1
 
     # Engage check
-    meta = get_champion_meta(champion_name)
-    engage_champs = get_engage_champions()
-    current_engage = sum(1 for c in existing_picks if c in engage_champs)
+    meta = CATALOG.meta(champion_name)
+    current_engage = sum(1 for c in existing_picks if c in CATALOG.engage)
     engage_score = 0.15 if (meta and meta.is_engage and current_engage < 2) else 0.05
 
     # Synergy with existing picks
     synergy_score = 0
-    synergies = data_store.champion_pairs.get("synergies", {})
+    synergies = data_store.champion_pairs.synergies
     for pick in existing_picks:
-        pair = synergies.get(champion_name, {}).get(pick)
-        if pair and pair["games"] >= 2:
-            synergy_score += (pair["win_rate"] - 45) / 100
+        wr = synergies.win_rate_of(champion_name, pick)
+        if wr is not None:
+            synergy_score += (wr - 45) / 100
     synergy_score = max(0, min(0.25, synergy_score / max(len(existing_picks), 1) + 0.1))
 
     total_score = damage_score + cc_score + role_score + engage_score + synergy_score
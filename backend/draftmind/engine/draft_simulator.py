@@ -0,0 +1,299 @@
+"""
+Monte Carlo draft completion simulator.
+
+Samples many plausible completions of a partial draft and scores them with
+the win model. Each side's remaining bans and picks are drawn from its own
+team's P(champion | team, sequence) in sequence_priors.json when the
+pipeline has produced it; otherwise from team_profiles (champion_picks,
+champion_bans_by, and first_pick_blue / first_ban_blue / first_ban_red for
+the opening actions), smoothed toward league-wide pick and ban shares so
+unseen champions stay possible. Picks into a role the side has already filled are down-weighted.
+
+All rollouts advance together: each DRAFT_SEQUENCE step is one vectorized
+draw for every rollout over champion-id arrays (rejection sampling from the
+team's CDF against per-rollout availability and role masks), and final
+drafts go through batch_features and one batched model call (or the
+vectorized heuristic when no model is loaded). Large runs
+can be split across the CPU pool with run_rollouts + summarize_rollouts.
+"""
+import threading
+
+import numpy as np
+
+from draftmind.core.champion_catalog import CATALOG
+from draftmind.core.draft_rules import DRAFT_SEQUENCE
+from draftmind.data.data_loader import data_store
+from draftmind.engine.composition_scorer import estimate_win_probability_batch
+from draftmind.engine.feature_tables import FeatureTables, batch_features, get_feature_tables
+from draftmind.engine.opponent_model import SequencePriors, get_sequence_priors
+from draftmind.engine.win_predictor import win_predictor
+from draftmind.metrics import span
+
+DEFAULT_ROLLOUTS = 10_000
+MAX_ROLLOUTS = 100_000
+# Pseudo-games of league-wide share mixed into each team's counts
+PRIOR_STRENGTH = 10.0
+# Weight multiplier for a pick whose primary role the side already has
+ROLE_PENALTY = 0.05
+TOP_COMPS = 5
+TOP_PICKS = 15
+# Smallest chunk worth shipping to a separate CPU pool worker
+MIN_CHUNK_ROLLOUTS = 2_500
+# Rejection-sampling rounds before the remaining rollouts use an exact masked draw
+MAX_REJECTION_ROUNDS = 32
+
+
+class SamplingPriors:
+    """Per-team pick/ban weight vectors over champion ids, built lazily."""
+
+    def __init__(self, tables: FeatureTables, champion_stats: dict, team_profiles: dict,
+                 sequence_priors: SequencePriors | None = None):
+        self.tables = tables
+        self.team_profiles = team_profiles
+        self.sequence_priors = sequence_priors if sequence_priors and sequence_priors.observed else None
+        if self.sequence_priors is not None:
+            # Sequence-prior champion order -> feature-table id (-1 if unknown)
+            self._seq_ids = np.array([tables.index.get(c, -1) for c in self.sequence_priors.champions],
+                                     dtype=np.intp)
+        n = len(tables.names)
+        picks, bans = np.zeros(n), np.zeros(n)
+        for name, cs in champion_stats.items():
+            i = tables.index[name]
+            picks[i] = cs.get("picks", cs.get("games_played", 0))
+            bans[i] = cs.get("bans", 0)
+        self.global_share = {
+            "pick": picks / (picks.sum() or 1),
+            "ban": bans / (bans.sum() or 1),
+        }
+        self._cache: dict[tuple, np.ndarray] = {}
+
+    def _counts(self, counts: dict) -> np.ndarray:
+        vec = np.zeros(len(self.tables.names))
+        for name, value in counts.items():
+            i = self.tables.index.get(name)
+            if i is not None:
+                vec[i] = value["games"] if isinstance(value, dict) else value
+        return vec
+
+    def weights(self, team_id: str | None, action: str, sequence: int, side: str) -> np.ndarray:
+        """Unnormalized sampling weights for one team's action at a draft step."""
+        # Opening actions have their own, sharper distributions
+        opening = {(7, "blue"): "first_pick_blue", (1, "blue"): "first_ban_blue",
+                   (2, "red"): "first_ban_red"}.get((sequence, side))
+        if self.sequence_priors is not None:
+            return self._sequence_weights(team_id, sequence)
+        key = (team_id, action, opening)
+        if key not in self._cache:
+            prior = self.global_share[action]
+            profile = self.team_profiles.get(team_id or "")
+            if not profile:
+                w = prior
+            else:
+                field = "champion_picks" if action == "pick" else "champion_bans_by"
+                w = self._counts(profile.get(field, {})) + PRIOR_STRENGTH * prior
+                if opening and profile.get(opening):
+                    w = self._counts(profile[opening]) + PRIOR_STRENGTH * w / w.sum()
+            self._cache[key] = w
+        return self._cache[key]
+
+    def _sequence_weights(self, team_id: str | None, sequence: int) -> np.ndarray:
+        key = (team_id, sequence)
+        if key not in self._cache:
+            dist = self.sequence_priors.distribution(team_id, sequence)
+            known = self._seq_ids >= 0
+            w = np.zeros(len(self.tables.names))
+            w[self._seq_ids[known]] = dist[known]
+            self._cache[key] = w
+        return self._cache[key]
+
+
+_priors: SamplingPriors | None = None
+_priors_lock = threading.Lock()
+
+
+def get_sampling_priors() -> SamplingPriors:
+    """Sampling priors for the current data generation."""
+    global _priors
+    tables = get_feature_tables()
+    priors = _priors
+    if priors is None or priors.tables is not tables:
+        with _priors_lock:
+            if _priors is None or _priors.tables is not tables:
+                snapshot = data_store.snapshot
+                _priors = SamplingPriors(tables, snapshot.champion_stats, snapshot.team_profiles,
+                                         get_sequence_priors())
+            priors = _priors
+    return priors
+
+
+def _draw(rng: np.random.Generator, weights: np.ndarray, available: np.ndarray,
+          filled: np.ndarray | None, role_idx: np.ndarray, has_meta: np.ndarray) -> np.ndarray:
+    """One champion per rollout, proportional to weights x availability x role penalty.
+
+    Rejection sampling from the shared CDF (a binary search per rollout);
+    rows that keep getting rejected fall back to an exact masked draw.
+    """
+    n, m = available.shape
+    cdf = np.cumsum(weights)
+    choice = np.empty(n, dtype=np.intp)
+    pending = np.arange(n)
+    for _ in range(MAX_REJECTION_ROUNDS):
+        cand = np.minimum(np.searchsorted(cdf, rng.random(len(pending)) * cdf[-1], side="right"), m - 1)
+        ok = available[pending, cand]
+        if filled is not None:
+            penalized = filled[pending, role_idx[cand]] & has_meta[cand]
+            ok &= ~penalized | (rng.random(len(pending)) < ROLE_PENALTY)
+        choice[pending[ok]] = cand[ok]
+        pending = pending[~ok]
+        if not len(pending):
+            return choice
+
+    w = np.where(available[pending], weights, 0.0)
+    if filled is not None:
+        w = np.where(filled[pending][:, role_idx] & has_meta, w * ROLE_PENALTY, w)
+    row_cdf = np.cumsum(w, axis=1)
+    u = rng.random(len(pending)) * row_cdf[:, -1]
+    choice[pending] = np.minimum((row_cdf <= u[:, None]).sum(axis=1), m - 1)
+    return choice
+
+
+def run_rollouts(current_actions: list[dict], blue_team_id: str | None = None,
+                 red_team_id: str | None = None, rollouts: int = DEFAULT_ROLLOUTS,
+                 seed=None) -> dict:
+    """Sample completions of a partial draft and score them.
+
+    Returns raw arrays so chunks run in separate processes can be merged:
+    ``blue`` / ``red`` (rollouts x picks champion ids) and
+    ``blue_win_probability`` (rollouts,).
+    """
+    priors = get_sampling_priors()
+    t = priors.tables
+    rng = np.random.default_rng(seed)
+    n = max(1, int(rollouts))
+    m = len(t.names)
+
+    used = np.zeros(m, dtype=bool)
+    fixed = {"blue": [], "red": []}
+    done = set()
+    for a in sorted(current_actions, key=lambda x: x.get("sequence_number", 0)):
+        done.add(a.get("sequence_number"))
+        i = t.index.get(CATALOG.resolve(a.get("champion_name", "")))
+        if i is None:
+            continue
+        used[i] = True
+        if a.get("action_type") == "pick":
+            fixed["blue" if a.get("team_side") == "blue" else "red"].append(i)
+
+    remaining = [(seq, action, side) for seq, action, side in DRAFT_SEQUENCE if seq not in done]
+    # Role index per champion, with "no role" mapped to an always-empty slot
+    role_idx = np.where(t.role >= 0, t.role, 5).astype(np.intp)
+
+    with span("monte_carlo.sample"):
+        available = np.tile(~used, (n, 1))
+        picks = {side: [np.full(n, i, dtype=np.intp) for i in ids] for side, ids in fixed.items()}
+        roles = {side: np.zeros((n, 6), dtype=bool) for side in ("blue", "red")}
+        for side, ids in fixed.items():
+            for i in ids:
+                if t.has_meta[i]:
+                    roles[side][:, role_idx[i]] = True
+        rows = np.arange(n)
+
+        for seq, action, side in remaining:
+            team_id = blue_team_id if side == "blue" else red_team_id
+            weights = priors.weights(team_id, action, seq, side)
+            filled = roles[side] if action == "pick" else None
+            choice = _draw(rng, weights, available, filled, role_idx, t.has_meta)
+            available[rows, choice] = False
+            if action == "pick":
+                picks[side].append(choice)
+                roles[side][rows, role_idx[choice]] |= t.has_meta[choice]
+
+    blue = np.column_stack(picks["blue"]) if picks["blue"] else np.zeros((n, 0), dtype=np.intp)
+    red = np.column_stack(picks["red"]) if picks["red"] else np.zeros((n, 0), dtype=np.intp)
+
+    if win_predictor.ready:
+        model = "xgboost"
+        with span("monte_carlo.features"):
+            features = batch_features(t, blue, red, blue_team_id, red_team_id)
+        probs = np.asarray(win_predictor.predict_many(features))
+    else:
+        model = "heuristic"
+        with span("monte_carlo.heuristic"):
+            probs = estimate_win_probability_batch(t, blue, red, blue_team_id, red_team_id)
+
+    return {
+        "blue": blue.astype(np.int16),
+        "red": red.astype(np.int16),
+        "blue_win_probability": probs.astype(np.float32),
+        "remaining_actions": len(remaining),
+        "model": model,
+    }
+
+
+def summarize_rollouts(results: list[dict], team_side: str = "blue") -> dict:
+    """Merge rollout chunks into a win-probability distribution and likely enemy comps."""
+    t = get_feature_tables()
+    team_side = "red" if team_side == "red" else "blue"
+    enemy_side = "red" if team_side == "blue" else "blue"
+    probs = np.concatenate([r["blue_win_probability"] for r in results]).astype(float)
+    if team_side == "red":
+        probs = 1.0 - probs
+    enemy = np.concatenate([r[enemy_side] for r in results])
+    n = len(probs)
+
+    counts, edges = np.histogram(probs, bins=20, range=(0.25, 0.75))
+    pct = np.percentile(probs, [5, 25, 50, 75, 95])
+
+    picks = []
+    if enemy.shape[1]:
+        ids, freq = np.unique(enemy, return_counts=True)
+        for k in np.argsort(-freq, kind="stable")[:TOP_PICKS]:
+            picks.append({"champion_name": t.names[ids[k]],
+                          "share": round(float(freq[k]) / n, 4)})
+
+    comps = []
+    if enemy.shape[1]:
+        # A comp is a set of champions: sort ids within each row before counting
+        unique, inverse, freq = np.unique(np.sort(enemy, axis=1), axis=0,
+                                          return_inverse=True, return_counts=True)
+        inverse = inverse.reshape(-1)
+        for k in np.argsort(-freq, kind="stable")[:TOP_COMPS]:
+            ids = sorted(unique[k], key=lambda i: (t.role[i] if t.role[i] >= 0 else 9, t.names[i]))
+            comps.append({
+                "champions": [t.names[i] for i in ids],
+                "rollouts": int(freq[k]),
+                "share": round(float(freq[k]) / n, 4),
+                "win_probability": round(float(probs[inverse == k].mean()), 3),
+            })
+
+    return {
+        "rollouts": n,
+        "remaining_actions": results[0]["remaining_actions"],
+        "model": results[0]["model"],
+        "team_side": team_side,
+        "win_probability": {
+            "mean": round(float(probs.mean()), 4),
+            "std": round(float(probs.std()), 4),
+            "p5": round(float(pct[0]), 3),
+            "p25": round(float(pct[1]), 3),
+            "p50": round(float(pct[2]), 3),
+            "p75": round(float(pct[3]), 3),
+            "p95": round(float(pct[4]), 3),
+            "histogram": [
+                {"low": round(float(lo), 3), "high": round(float(hi), 3),
+                 "share": round(float(c) / n, 4)}
+                for lo, hi, c in zip(edges[:-1], edges[1:], counts)
+            ],
+        },
+        "enemy_side": enemy_side,
+        "likely_enemy_picks": picks,
+        "likely_enemy_comps": comps,
+    }
+
+
+def simulate_completions(current_actions: list[dict], blue_team_id: str | None = None,
+                         red_team_id: str | None = None, team_side: str = "blue",
+                         rollouts: int = DEFAULT_ROLLOUTS, seed=None) -> dict:
+    """Sample completions of a partial draft and summarize them (single process)."""
+    result = run_rollouts(current_actions, blue_team_id, red_team_id, rollouts, seed)
+    return summarize_rollouts([result], team_side)
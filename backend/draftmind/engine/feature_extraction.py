@@ -4,10 +4,11 @@ Extracts ~40 aggregate composition features from champion picks and team data.
 Shared between training (scripts/train_win_model.py) and runtime (win_predictor.py).
 """
 import math
+from draftmind.core.champion_catalog import CATALOG
 from draftmind.core.champion_roles import (
-    get_champion_meta, get_damage_profile, get_cc_score,
-    get_scaling_profile, has_role_coverage, get_engage_champions,
+    get_damage_profile, get_cc_score, get_scaling_profile, has_role_coverage,
 )
+from draftmind.data.pair_store import PairStore
 
 FEATURE_NAMES = [
     "blue_avg_wr", "red_avg_wr",
@@ -51,30 +52,28 @@ def _damage_balance(picks: list[str]) -> float:
     return 1.0 - abs(dmg["physical"] - dmg["magic"]) / total
 
 
-def _avg_synergy(picks: list[str], champion_pairs: dict) -> float:
+def _avg_synergy(picks: list[str], champion_pairs: PairStore) -> float:
     """Average synergy win rate between all pairs (normalized 0-1)."""
-    synergies = champion_pairs.get("synergies", {})
+    synergies = champion_pairs.synergies
     scores = []
     for i, c1 in enumerate(picks):
         for c2 in picks[i + 1:]:
-            pair = synergies.get(c1, {}).get(c2)
-            if not pair:
-                pair = synergies.get(c2, {}).get(c1)
-            if pair and pair.get("games", 0) >= 2:
-                scores.append(pair["win_rate"] / 100.0)
+            wr = synergies.win_rate_of(c1, c2)
+            if wr is not None:
+                scores.append(wr / 100.0)
     return sum(scores) / len(scores) if scores else 0.5
 
 
 def _counter_score(my_picks: list[str], opp_picks: list[str],
-                   champion_pairs: dict) -> float:
+                   champion_pairs: PairStore) -> float:
     """Average counter win rate of my_picks vs opp_picks (0-1)."""
-    counters = champion_pairs.get("counters", {})
+    counters = champion_pairs.counters
     scores = []
     for mine in my_picks:
         for opp in opp_picks:
-            matchup = counters.get(mine, {}).get(opp)
-            if matchup and matchup.get("games", 0) >= 2:
-                scores.append(matchup["win_rate"] / 100.0)
+            wr = counters.win_rate_of(mine, opp)
+            if wr is not None:
+                scores.append(wr / 100.0)
     return sum(scores) / len(scores) if scores else 0.5
 
 
@@ -102,7 +101,7 @@ def _tag_count(picks: list[str], tag: str) -> int:
     """Count champions with a specific tag."""
     count = 0
     for c in picks:
-        meta = get_champion_meta(c)
+        meta = CATALOG.meta(c)
         if meta and tag in meta.tags:
             count += 1
     return count
@@ -110,13 +109,13 @@ def _tag_count(picks: list[str], tag: str) -> int:
 
 def extract_features(blue_picks: list[str], red_picks: list[str],
                      blue_team_id: str | None, red_team_id: str | None,
-                     champion_stats: dict, champion_pairs: dict,
+                     champion_stats: dict, champion_pairs: PairStore,
                      team_profiles: dict) -> list[float]:
     """Extract 40 features for win prediction.
 
     Returns a list of 40 floats in the order defined by FEATURE_NAMES.
     """
-    engage_set = set(get_engage_champions())
+    engage_set = CATALOG.engage
 
     # 1-6: Champion stat averages (normalized to 0-1)
     blue_avg_wr = _avg_stat(blue_picks, champion_stats, "win_rate", 50.0) / 100
@@ -0,0 +1,414 @@
+"""
+Precomputed feature tables for batch win-probability evaluation.
+
+extract_features() rebuilds every per-champion and per-pair lookup for each
+call. For many related drafts (a win curve, every candidate pick, Monte
+Carlo completions) the same lookups are shared, so this module stores them
+once per data generation (and patch window) as numpy arrays indexed by
+champion id, and DraftFeatures keeps running per-side partial sums so the
+40-feature vector is updated one pick at a time instead of recomputed.
+
+Feature semantics mirror extract_features() exactly; values can differ only
+in float rounding from a different summation order.
+"""
+import math
+import threading
+
+import numpy as np
+
+from draftmind.core.champion_catalog import CATALOG
+from draftmind.core.champion_roles import CHAMPIONS, ROLES
+from draftmind.data.data_loader import data_store
+from draftmind.data.pair_store import PairStore
+
+# Stat key -> default used by extract_features when a champion has no value
+STAT_DEFAULTS = {"win_rate": 50.0, "pick_rate": 10.0, "presence": 20.0}
+
+
+class FeatureTables:
+    """Per-champion feature attributes and pair matrices, indexed by champion id."""
+
+    def __init__(self, champion_stats: dict, champion_pairs: PairStore,
+                 team_profiles: dict, cache_key: tuple = ()):
+        self.cache_key = cache_key
+        self.team_profiles = team_profiles
+        self.names = sorted(set(champion_stats) | set(CHAMPIONS))
+        self.index = {name: i for i, name in enumerate(self.names)}
+        n = len(self.names)
+
+        self.has_stats = np.zeros(n, dtype=bool)
+        self.stats = {key: np.full(n, default) for key, default in STAT_DEFAULTS.items()}
+        self.has_meta = np.zeros(n, dtype=bool)
+        self.damage = np.full(n, -1, dtype=np.int8)
+        self.scaling = np.full(n, -1, dtype=np.int8)
+        self.role = np.full(n, -1, dtype=np.int8)
+        self.cc = np.zeros(n)
+        self.engage = np.zeros(n, dtype=bool)
+        self.tank = np.zeros(n, dtype=bool)
+        self.assassin = np.zeros(n, dtype=bool)
+
+        for i, name in enumerate(self.names):
+            cs = champion_stats.get(name)
+            if cs:
+                self.has_stats[i] = True
+                for key, default in STAT_DEFAULTS.items():
+                    self.stats[key][i] = cs.get(key, default)
+            meta = CATALOG.meta(name)
+            if meta:
+                self.has_meta[i] = True
+                self.damage[i] = meta.damage_id
+                self.scaling[i] = meta.scaling_id
+                self.role[i] = meta.role_id
+                self.cc[i] = meta.cc_score
+                self.tank[i] = "tank" in meta.tags
+                self.assassin[i] = "assassin" in meta.tags
+            self.engage[i] = name in CATALOG.engage
+
+        # synergy[i, j]: win rate of i and j together (symmetric); the raw
+        # percentages are kept too, as compute_synergy_score reads them
+        self.synergy_pct, self.synergy_mask = champion_pairs.synergies.matrix(self.index)
+        self.synergy = self.synergy_pct / 100.0
+        # counter[i, j]: i's win rate against j
+        counter_pct, self.counter_mask = champion_pairs.counters.matrix(self.index)
+        self.counter = counter_pct / 100.0
+
+        self._affinity: dict[str, tuple[np.ndarray, np.ndarray] | None] = {}
+
+    def team_affinity(self, team_id: str | None) -> tuple[np.ndarray, np.ndarray] | None:
+        """Per-champion (frequency x win rate, has_data) for a team, or None."""
+        if not team_id:
+            return None
+        if team_id not in self._affinity:
+            profile = self.team_profiles.get(team_id)
+            result = None
+            if profile:
+                values = np.zeros(len(self.names))
+                mask = np.zeros(len(self.names), dtype=bool)
+                total_games = profile.get("total_games", 1) or 1
+                for champ, cd in profile.get("champion_picks", {}).items():
+                    i = self.index.get(champ)
+                    if i is not None and cd:
+                        values[i] = (cd["games"] / total_games) * (cd["wins"] / max(cd["games"], 1))
+                        mask[i] = True
+                result = (values, mask)
+            self._affinity[team_id] = result
+        return self._affinity[team_id]
+
+    def team_constants(self, team_id: str | None) -> tuple[float, float]:
+        """(team win rate 0-1, log games / 6) as used by extract_features."""
+        profile = self.team_profiles.get(team_id or "", {})
+        if not profile:
+            return 0.5, 0.0
+        return (profile.get("win_rate", 50.0) / 100,
+                math.log1p(profile.get("total_games", 0)) / 6.0)
+
+
+# Tables per (generation, patch window); the full data plus a few recent windows
+MAX_TABLES = 4
+_tables: dict[tuple, FeatureTables] = {}
+_tables_lock = threading.Lock()
+
+
+def get_feature_tables() -> FeatureTables:
+    """Feature tables for the current data snapshot or patch view (built on first use)."""
+    snapshot = data_store.snapshot
+    key = snapshot.cache_key
+    tables = _tables.get(key)
+    if tables is None:
+        with _tables_lock:
+            tables = _tables.get(key)
+            if tables is None:
+                tables = FeatureTables(snapshot.champion_stats, snapshot.champion_pairs,
+                                       snapshot.team_profiles, key)
+                for stale in [k for k in _tables if k[0] != key[0]]:
+                    del _tables[stale]
+                while len(_tables) >= MAX_TABLES:
+                    del _tables[next(iter(_tables))]
+                _tables[key] = tables
+    return tables
+
+
+class _Side:
+    """Running partial sums for one side's picks."""
+
+    __slots__ = ("picks", "n_stats", "stat_sums", "damage", "n_meta", "cc_sum",
+                 "scaling", "engage", "roles", "tanks", "assassins",
+                 "syn_sum", "syn_n", "ctr_sum", "ctr_n", "aff_sum", "aff_n",
+                 "affinity", "team_wr", "team_games")
+
+    def __init__(self, tables: FeatureTables, team_id: str | None):
+        self.picks: list[int] = []
+        self.n_stats = 0
+        self.stat_sums = dict.fromkeys(STAT_DEFAULTS, 0.0)
+        self.damage = [0, 0, 0]
+        self.n_meta = 0
+        self.cc_sum = 0.0
+        self.scaling = [0, 0, 0]
+        self.engage = 0
+        self.roles = 0  # bitmask over ROLES
+        self.tanks = 0
+        self.assassins = 0
+        self.syn_sum = 0.0
+        self.syn_n = 0
+        self.ctr_sum = 0.0  # this side's picks vs the other side's
+        self.ctr_n = 0
+        self.aff_sum = 0.0
+        self.aff_n = 0
+        self.affinity = tables.team_affinity(team_id)
+        self.team_wr, self.team_games = tables.team_constants(team_id)
+
+    def copy(self) -> "_Side":
+        other = _Side.__new__(_Side)
+        for attr in _Side.__slots__:
+            setattr(other, attr, getattr(self, attr))
+        other.picks = list(self.picks)
+        other.stat_sums = dict(self.stat_sums)
+        other.damage = list(self.damage)
+        other.scaling = list(self.scaling)
+        return other
+
+    def features(self) -> list[float]:
+        """This side's 20 features, in FEATURE_NAMES order."""
+        avg = [
+            (self.stat_sums[key] / self.n_stats if self.n_stats else default) / 100
+            for key, default in STAT_DEFAULTS.items()
+        ]
+        total_dmg = sum(self.damage) or 1
+        return [
+            *avg,
+            self.damage[0], self.damage[1], self.damage[2],
+            self.cc_sum / self.n_meta if self.n_meta else 0,
+            self.scaling[0], self.scaling[1], self.scaling[2],
+            self.engage,
+            1.0 if bin(self.roles).count("1") >= 5 else 0.0,
+            1.0 - abs(self.damage[0] - self.damage[1]) / total_dmg,
+            self.syn_sum / self.syn_n if self.syn_n else 0.5,
+            self.ctr_sum / self.ctr_n if self.ctr_n else 0.5,
+            self.team_wr, self.team_games,
+            self.aff_sum / self.aff_n if self.aff_n else 0.0,
+            self.tanks, self.assassins,
+        ]
+
+
+class DraftFeatures:
+    """Incrementally maintained win-model features for a draft in progress."""
+
+    def __init__(self, tables: FeatureTables, blue_team_id: str | None = None,
+                 red_team_id: str | None = None):
+        self.tables = tables
+        self.sides = {"blue": _Side(tables, blue_team_id), "red": _Side(tables, red_team_id)}
+
+    def copy(self) -> "DraftFeatures":
+        other = DraftFeatures.__new__(DraftFeatures)
+        other.tables = self.tables
+        other.sides = {side: s.copy() for side, s in self.sides.items()}
+        return other
+
+    def add(self, side: str, champion: str):
+        """Add a pick. Champions unknown to the tables contribute to no feature."""
+        t = self.tables
+        i = t.index.get(champion)
+        if i is None:
+            return
+        s = self.sides[side]
+        o = self.sides["red" if side == "blue" else "blue"]
+
+        if t.has_stats[i]:
+            s.n_stats += 1
+            for key, values in t.stats.items():
+                s.stat_sums[key] += values[i]
+        if t.has_meta[i]:
+            s.n_meta += 1
+            s.damage[t.damage[i]] += 1
+            s.scaling[t.scaling[i]] += 1
+            s.cc_sum += t.cc[i]
+            if t.role[i] >= 0:
+                s.roles |= 1 << int(t.role[i])
+            s.tanks += int(t.tank[i])
+            s.assassins += int(t.assassin[i])
+        s.engage += int(t.engage[i])
+
+        for p in s.picks:
+            if t.synergy_mask[p, i]:
+                s.syn_sum += t.synergy[p, i]
+                s.syn_n += 1
+        for q in o.picks:
+            if t.counter_mask[i, q]:
+                s.ctr_sum += t.counter[i, q]
+                s.ctr_n += 1
+            if t.counter_mask[q, i]:
+                o.ctr_sum += t.counter[q, i]
+                o.ctr_n += 1
+        if s.affinity is not None and s.affinity[1][i]:
+            s.aff_sum += s.affinity[0][i]
+            s.aff_n += 1
+
+        s.picks.append(i)
+
+    def vector(self) -> list[float]:
+        """The 40 features in FEATURE_NAMES order (blue/red interleaved)."""
+        blue = self.sides["blue"].features()
+        red = self.sides["red"].features()
+        return [float(x) for pair in zip(blue, red) for x in pair]
+
+    def expand(self, side: str, candidates: np.ndarray) -> np.ndarray:
+        """Feature matrix (len(candidates) x 40) for adding each candidate to ``side``.
+
+        Vectorized equivalent of ``copy(); add(side, c); vector()`` per candidate:
+        the current partial sums are shared and only each candidate's own
+        contribution is applied, as array operations over champion ids.
+        """
+        t = self.tables
+        x = np.asarray(candidates, dtype=np.intp)
+        k = len(x)
+        s = self.sides[side]
+        o = self.sides["red" if side == "blue" else "blue"]
+        mine = np.asarray(s.picks, dtype=np.intp)
+        theirs = np.asarray(o.picks, dtype=np.intp)
+
+        has_stats = t.has_stats[x]
+        has_meta = t.has_meta[x]
+        n_stats = s.n_stats + has_stats
+        n_meta = s.n_meta + has_meta
+        cols = []
+
+        for key, default in STAT_DEFAULTS.items():
+            total = s.stat_sums[key] + np.where(has_stats, t.stats[key][x], 0.0)
+            safe = np.maximum(n_stats, 1)
+            cols.append(np.where(n_stats > 0, total / safe, default) / 100)
+
+        damage = [s.damage[d] + (has_meta & (t.damage[x] == d)) for d in range(3)]
+        cols.extend(damage)
+        cc_total = s.cc_sum + np.where(has_meta, t.cc[x], 0.0)
+        cols.append(np.where(n_meta > 0, cc_total / np.maximum(n_meta, 1), 0.0))
+        cols.extend(s.scaling[d] + (has_meta & (t.scaling[x] == d)) for d in range(3))
+        cols.append(s.engage + t.engage[x])
+
+        role = t.role[x].astype(np.intp)
+        new_role = has_meta & (role >= 0) & (((s.roles >> np.maximum(role, 0)) & 1) == 0)
+        cols.append(np.where(bin(s.roles).count("1") + new_role >= 5, 1.0, 0.0))
+
+        total_dmg = np.maximum(damage[0] + damage[1] + damage[2], 1)
+        cols.append(1.0 - np.abs(damage[0] - damage[1]) / total_dmg)
+
+        if len(mine):
+            syn_mask = t.synergy_mask[np.ix_(mine, x)]
+            syn_sum = s.syn_sum + np.where(syn_mask, t.synergy[np.ix_(mine, x)], 0.0).sum(axis=0)
+            syn_n = s.syn_n + syn_mask.sum(axis=0)
+        else:
+            syn_sum, syn_n = np.full(k, s.syn_sum), np.full(k, s.syn_n)
+        cols.append(np.where(syn_n > 0, syn_sum / np.maximum(syn_n, 1), 0.5))
+
+        if len(theirs):
+            fwd_mask = t.counter_mask[np.ix_(x, theirs)]
+            ctr_sum = s.ctr_sum + np.where(fwd_mask, t.counter[np.ix_(x, theirs)], 0.0).sum(axis=1)
+            ctr_n = s.ctr_n + fwd_mask.sum(axis=1)
+            back_mask = t.counter_mask[np.ix_(theirs, x)]
+            opp_sum = o.ctr_sum + np.where(back_mask, t.counter[np.ix_(theirs, x)], 0.0).sum(axis=0)
+            opp_n = o.ctr_n + back_mask.sum(axis=0)
+        else:
+            ctr_sum, ctr_n = np.full(k, s.ctr_sum), np.full(k, s.ctr_n)
+            opp_sum, opp_n = np.full(k, o.ctr_sum), np.full(k, o.ctr_n)
+        cols.append(np.where(ctr_n > 0, ctr_sum / np.maximum(ctr_n, 1), 0.5))
+
+        cols.append(np.full(k, s.team_wr))
+        cols.append(np.full(k, s.team_games))
+
+        if s.affinity is not None:
+            aff_mask = s.affinity[1][x]
+            aff_sum = s.aff_sum + np.where(aff_mask, s.affinity[0][x], 0.0)
+            aff_n = s.aff_n + aff_mask
+            cols.append(np.where(aff_n > 0, aff_sum / np.maximum(aff_n, 1), 0.0))
+        else:
+            cols.append(np.zeros(k))
+
+        cols.append(s.tanks + (has_meta & t.tank[x]))
+        cols.append(s.assassins + (has_meta & t.assassin[x]))
+
+        acting = np.column_stack([np.broadcast_to(np.asarray(c, dtype=float), (k,)) for c in cols])
+        other = np.tile(np.asarray(o.features(), dtype=float), (k, 1))
+        counter_col = 14  # position of the counter feature within a side
+        other[:, counter_col] = np.where(opp_n > 0, opp_sum / np.maximum(opp_n, 1), 0.5)
+
+        out = np.empty((k, 40))
+        blue, red = (acting, other) if side == "blue" else (other, acting)
+        out[:, 0::2] = blue
+        out[:, 1::2] = red
+        return out
+
+
+def _side_batch(t: FeatureTables, picks: np.ndarray, opp: np.ndarray,
+                team_id: str | None) -> list[np.ndarray]:
+    """One side's 20 feature columns for many drafts (rows of champion ids)."""
+    n = len(picks)
+    has_stats = t.has_stats[picks]
+    has_meta = t.has_meta[picks]
+    n_stats = has_stats.sum(axis=1)
+    n_meta = has_meta.sum(axis=1)
+    cols = []
+
+    for key, default in STAT_DEFAULTS.items():
+        total = np.where(has_stats, t.stats[key][picks], 0.0).sum(axis=1)
+        cols.append(np.where(n_stats > 0, total / np.maximum(n_stats, 1), default) / 100)
+
+    damage = [((t.damage[picks] == d) & has_meta).sum(axis=1) for d in range(3)]
+    cols.extend(damage)
+    cc_total = np.where(has_meta, t.cc[picks], 0.0).sum(axis=1)
+    cols.append(np.where(n_meta > 0, cc_total / np.maximum(n_meta, 1), 0.0))
+    cols.extend(((t.scaling[picks] == d) & has_meta).sum(axis=1) for d in range(3))
+    cols.append(t.engage[picks].sum(axis=1))
+
+    roles_filled = sum(((t.role[picks] == r) & has_meta).any(axis=1).astype(int)
+                       for r in range(len(ROLES)))
+    cols.append(np.where(roles_filled >= 5, 1.0, 0.0))
+    total_dmg = np.maximum(damage[0] + damage[1] + damage[2], 1)
+    cols.append(1.0 - np.abs(damage[0] - damage[1]) / total_dmg)
+
+    syn_sum, syn_n = np.zeros(n), np.zeros(n, dtype=int)
+    for i in range(picks.shape[1]):
+        for j in range(i + 1, picks.shape[1]):
+            mask = t.synergy_mask[picks[:, i], picks[:, j]]
+            syn_sum += np.where(mask, t.synergy[picks[:, i], picks[:, j]], 0.0)
+            syn_n += mask
+    cols.append(np.where(syn_n > 0, syn_sum / np.maximum(syn_n, 1), 0.5))
+
+    ctr_sum, ctr_n = np.zeros(n), np.zeros(n, dtype=int)
+    for i in range(picks.shape[1]):
+        for j in range(opp.shape[1]):
+            mask = t.counter_mask[picks[:, i], opp[:, j]]
+            ctr_sum += np.where(mask, t.counter[picks[:, i], opp[:, j]], 0.0)
+            ctr_n += mask
+    cols.append(np.where(ctr_n > 0, ctr_sum / np.maximum(ctr_n, 1), 0.5))
+
+    team_wr, team_games = t.team_constants(team_id)
+    cols.append(np.full(n, team_wr))
+    cols.append(np.full(n, team_games))
+
+    affinity = t.team_affinity(team_id)
+    if affinity is not None:
+        aff_mask = affinity[1][picks]
+        aff_n = aff_mask.sum(axis=1)
+        aff_sum = np.where(aff_mask, affinity[0][picks], 0.0).sum(axis=1)
+        cols.append(np.where(aff_n > 0, aff_sum / np.maximum(aff_n, 1), 0.0))
+    else:
+        cols.append(np.zeros(n))
+
+    cols.append((t.tank[picks] & has_meta).sum(axis=1))
+    cols.append((t.assassin[picks] & has_meta).sum(axis=1))
+    return cols
+
+
+def batch_features(tables: FeatureTables, blue: np.ndarray, red: np.ndarray,
+                   blue_team_id: str | None = None,
+                   red_team_id: str | None = None) -> np.ndarray:
+    """Feature matrix (N x 40) for N drafts given as champion-id arrays.
+
+    ``blue`` and ``red`` are (N x picks) integer arrays in pick order; every
+    row is evaluated as extract_features() would, without per-draft Python.
+    """
+    blue = np.asarray(blue, dtype=np.intp).reshape(len(blue), -1)
+    red = np.asarray(red, dtype=np.intp).reshape(len(red), -1)
+    out = np.empty((len(blue), 40))
+    out[:, 0::2] = np.column_stack(_side_batch(tables, blue, red, blue_team_id))
+    out[:, 1::2] = np.column_stack(_side_batch(tables, red, blue, red_team_id))
+    return out
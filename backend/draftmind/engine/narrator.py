@@ -4,7 +4,10 @@ Generates natural language commentary for each draft action.
 """
 import google.generativeai as genai
 from draftmind.config import GEMINI_API_KEY
+from draftmind.core.champion_catalog import CATALOG
+from draftmind.core.champion_roles import assign_roles
 from draftmind.data.data_loader import data_store
+from draftmind.metrics import span
 
 _model = None
 
@@ -176,17 +179,13 @@ def _build_draft_context(
 
 def _get_composition_summary(picks: list[str]) -> str:
     """Get a brief composition summary based on picks."""
-    from draftmind.data.champion_metadata import CHAMPION_METADATA
-
     damage_types = {"physical": 0, "magic": 0, "mixed": 0}
-    roles = []
     cc_heavy = []
 
     for champ in picks:
-        meta = CHAMPION_METADATA.get(champ, {})
-        damage_types[meta.get("damage_type", "mixed")] += 1
-        roles.append(meta.get("role", "unknown"))
-        if meta.get("cc_type") in ["hard", "heavy"]:
+        meta = CATALOG.meta(champ)
+        damage_types[meta.damage_type if meta else "mixed"] += 1
+        if meta and meta.cc_score >= 3:
             cc_heavy.append(champ)
 
     summary_parts = []
@@ -211,19 +210,18 @@ def _get_composition_summary(picks: list[str]) -> str:
 
 def _get_synergies(champion: str, teammates: list[str]) -> str:
     """Check for known synergies between champion and teammates."""
-    synergy_pairs = data_store.champion_pairs
+    synergy_pairs = data_store.champion_pairs.synergies
     synergies = []
 
     for teammate in teammates:
-        pair_key = tuple(sorted([champion, teammate]))
-        pair_data = synergy_pairs.get(pair_key) or synergy_pairs.get(f"{champion}_{teammate}") or synergy_pairs.get(f"{teammate}_{champion}")
+        pair_data = synergy_pairs.get(champion, teammate, min_games=5)
 
         if pair_data:
-            games = pair_data.get("games", 0)
-            wr = pair_data.get("win_rate", 0)
-            if games >= 5 and wr > 52:
+            games = pair_data["games"]
+            wr = pair_data["win_rate"]
+            if wr > 52:
                 synergies.append(f"{champion} + {teammate}: {wr:.0f}% WR over {games} games (strong synergy)")
-            elif games >= 5 and wr < 48:
+            elif wr < 48:
                 synergies.append(f"{champion} + {teammate}: {wr:.0f}% WR over {games} games (weak synergy)")
 
     return " | ".join(synergies) if synergies else f"{champion} adds to the team composition"
@@ -231,19 +229,19 @@ def _get_synergies(champion: str, teammates: list[str]) -> str:
 
 def _get_counter_context(champion: str, enemies: list[str]) -> str:
     """Analyze how this champion fares against enemy picks."""
-    from draftmind.data.champion_metadata import CHAMPION_METADATA
-
-    champ_meta = CHAMPION_METADATA.get(champion, {})
-    champ_role = champ_meta.get("role", "unknown")
+    meta = CATALOG.meta(champion)
+    champ_role = meta.primary_role if meta else "unknown"
 
     insights = []
-    for enemy in enemies:
-        enemy_meta = CHAMPION_METADATA.get(enemy, {})
-        enemy_role = enemy_meta.get("role", "unknown")
-
+    for enemy, enemy_role in assign_roles(enemies).items():
         # Same role = likely lane matchup
-        if champ_role == enemy_role and champ_role != "unknown":
-            insights.append(f"Lane matchup: {champion} vs {enemy} ({champ_role})")
+        if champ_role == enemy_role:
+            insight = f"Lane matchup: {champion} vs {enemy} ({champ_role})"
+            table = data_store.lane_matchups.table(champ_role)
+            record = table.get(champion, enemy, min_games=3) if table else None
+            if record:
+                insight += f", {record['win_rate']:.0f}% WR over {record['games']} games"
+            insights.append(insight)
 
     return " | ".join(insights) if insights else f"No direct lane counters identified yet"
 
@@ -264,14 +262,16 @@ def generate_narration(
     if not current_actions:
         return {"narrative": "The draft is about to begin. Both teams are ready.", "tone": "analytical"}
 
-    context = _build_draft_context(
-        current_actions, blue_team_name, red_team_name, recommendations, win_probability
-    )
+    with span("narrator.context"):
+        context = _build_draft_context(
+            current_actions, blue_team_name, red_team_name, recommendations, win_probability
+        )
 
     prompt = f"{SYSTEM_PROMPT}\n\n{context}\n\nCast this latest draft action LIVE:"
 
     try:
-        response = model.generate_content(prompt)
+        with span("narrator.llm"):
+            response = model.generate_content(prompt)
         raw = response.text.strip()
 
         # Parse tone - can be on its own line OR at end of text
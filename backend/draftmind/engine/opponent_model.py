@@ -0,0 +1,160 @@
+"""
+Opponent next-action prediction from per-sequence draft priors.
+
+compute_statistics.py emits sequence_priors.json: P(champion | team, sequence)
+for every team and draft slot, smoothed toward the league distribution for
+that slot. The file is a CSR matrix (one row per team x sequence) plus dense
+league rows, and is loaded here into numpy arrays once per data generation:
+
+    P(c | team, seq) = probs[row][c] + backoff[row] * league[seq][c]
+
+Finding a row is a dict lookup, and a single champion's probability is a
+binary search within that row's few dozen entries. A full distribution is
+one dense league row scaled and scattered with the row's entries. Without
+the file, every team falls back to league-wide pick and ban shares.
+"""
+import threading
+
+import numpy as np
+
+from draftmind.core.champion_catalog import CATALOG
+from draftmind.core.draft_rules import DRAFT_SEQUENCE, SEQUENCE_MAP
+from draftmind.data.data_loader import data_store
+
+DEFAULT_TOP_K = 10
+
+
+class SequencePriors:
+    """Sparse P(champion | team, sequence) arrays with constant-time row lookup."""
+
+    def __init__(self, priors: dict, champion_stats: dict, cache_key: tuple = ()):
+        self.cache_key = cache_key
+        n_seq = len(DRAFT_SEQUENCE)
+        if priors.get("champions"):
+            self.champions = list(priors["champions"])
+            self.league = np.asarray(priors["league"], dtype=np.float64)
+            teams = priors["teams"]
+            self.indptr = np.asarray(priors["indptr"], dtype=np.int64)
+            self.indices = np.asarray(priors["indices"], dtype=np.int32)
+            self.probs = np.asarray(priors["probs"], dtype=np.float64)
+            self.backoff = np.asarray(priors["backoff"], dtype=np.float64)
+            self.samples = np.asarray(priors["samples"], dtype=np.int32)
+        else:
+            # No pipeline output: league-wide pick/ban shares for every slot
+            self.champions = sorted(champion_stats)
+            shares = {}
+            for action, key in (("pick", "picks"), ("ban", "bans")):
+                v = np.array([champion_stats[c].get(key, 0) for c in self.champions], dtype=np.float64)
+                shares[action] = v / (v.sum() or 1)
+            self.league = np.array([shares[action] for _, action, _ in DRAFT_SEQUENCE])
+            teams = []
+            self.indptr = np.zeros(1, dtype=np.int64)
+            self.indices = np.zeros(0, dtype=np.int32)
+            self.probs = np.zeros(0)
+            self.backoff = np.zeros(0)
+            self.samples = np.zeros(0, dtype=np.int32)
+        self.observed = bool(teams)
+        self.index = {c: i for i, c in enumerate(self.champions)}
+        self._team_rows = {tid: i * n_seq for i, tid in enumerate(teams)}
+
+    def _row(self, team_id: str | None, sequence: int) -> int | None:
+        base = self._team_rows.get(team_id or "")
+        return None if base is None else base + sequence - 1
+
+    def team_samples(self, team_id: str | None, sequence: int) -> int:
+        """How many times the team has acted at this sequence number."""
+        row = self._row(team_id, sequence)
+        return 0 if row is None else int(self.samples[row])
+
+    def probability(self, team_id: str | None, sequence: int, champion: str) -> float:
+        """Smoothed P(champion | team, sequence)."""
+        c = self.index.get(champion)
+        if c is None:
+            return 0.0
+        league = float(self.league[sequence - 1, c])
+        row = self._row(team_id, sequence)
+        if row is None:
+            return league
+        lo, hi = self.indptr[row], self.indptr[row + 1]
+        k = lo + np.searchsorted(self.indices[lo:hi], c)
+        own = float(self.probs[k]) if k < hi and self.indices[k] == c else 0.0
+        return own + float(self.backoff[row]) * league
+
+    def distribution(self, team_id: str | None, sequence: int) -> np.ndarray:
+        """Dense smoothed distribution over self.champions for one team and slot."""
+        row = self._row(team_id, sequence)
+        if row is None:
+            return self.league[sequence - 1].copy()
+        lo, hi = self.indptr[row], self.indptr[row + 1]
+        dist = self.league[sequence - 1] * self.backoff[row]
+        dist[self.indices[lo:hi]] += self.probs[lo:hi]
+        return dist
+
+
+_priors: SequencePriors | None = None
+_priors_lock = threading.Lock()
+
+
+def get_sequence_priors() -> SequencePriors:
+    """Sequence priors for the current data generation (built on first use)."""
+    global _priors
+    snapshot = data_store.snapshot
+    priors = _priors
+    if priors is None or priors.cache_key != snapshot.cache_key:
+        with _priors_lock:
+            if _priors is None or _priors.cache_key != snapshot.cache_key:
+                _priors = SequencePriors(snapshot.sequence_priors, snapshot.champion_stats,
+                                         snapshot.cache_key)
+            priors = _priors
+    return priors
+
+
+def predict_opponent_action(current_actions: list[dict], blue_team_id: str | None = None,
+                            red_team_id: str | None = None, team_side: str = "blue",
+                            top_k: int = DEFAULT_TOP_K) -> dict:
+    """Most likely champions for the opponent's next ban or pick.
+
+    ``team_side`` is our side; the prediction is for the first remaining
+    sequence number that belongs to the other side. Champions already banned
+    or picked are excluded and the distribution renormalized.
+    """
+    opponent_side = "red" if team_side == "blue" else "blue"
+    opponent_id = red_team_id if opponent_side == "red" else blue_team_id
+
+    done = {a.get("sequence_number") for a in current_actions}
+    sequence = next((seq for seq, _, side in DRAFT_SEQUENCE
+                     if side == opponent_side and seq not in done), None)
+    if sequence is None:
+        return {"error": "Opponent has no actions left", "predictions": []}
+    action_type, _ = SEQUENCE_MAP[sequence]
+
+    priors = get_sequence_priors()
+    dist = priors.distribution(opponent_id, sequence)
+    for a in current_actions:
+        c = priors.index.get(CATALOG.resolve(a.get("champion_name", "")))
+        if c is not None:
+            dist[c] = 0.0
+    total = dist.sum()
+    if total > 0:
+        dist /= total
+
+    top = np.argsort(-dist, kind="stable")[:top_k]
+    profile = data_store.team_profiles.get(opponent_id) if opponent_id else None
+    return {
+        "next_action": {
+            "sequence_number": sequence,
+            "action_type": action_type,
+            "team_side": opponent_side,
+        },
+        "team_id": opponent_id,
+        "team_name": profile["team_name"] if profile else None,
+        "team_samples": priors.team_samples(opponent_id, sequence),
+        "predictions": [
+            {
+                "champion_name": priors.champions[c],
+                "image_url": CATALOG.image_url(priors.champions[c]),
+                "probability": round(float(dist[c]), 4),
+            }
+            for c in top if dist[c] > 0
+        ],
+    }
@@ -3,8 +3,8 @@ Tier 3: Opponent draft pattern detection.
 Analyzes a team's draft DNA: ban priorities, pick preferences,
 comfort picks, one-trick alerts, composition tendencies.
 """
+from draftmind.core.champion_catalog import CATALOG
 from draftmind.data.data_loader import data_store
-from draftmind.data.champion_metadata import get_champion_image_url
 
 
 def detect_patterns(team_id: str) -> dict | None:
@@ -25,6 +25,7 @@ def detect_patterns(team_id: str) -> dict | None:
         "one_trick_alerts": _detect_one_tricks(profile),
         "composition_tendencies": _analyze_comp_tendencies(profile),
         "adaptation_between_games": _detect_adaptation(team_id),
+        "adaptation_summary": _adaptation_summary(team_id),
         "ban_recommendations": _generate_ban_recommendations(team_id, profile),
     }
 
@@ -37,7 +38,7 @@ def _analyze_ban_priorities(profile: dict) -> dict:
     for champ, count in list(profile.get("champion_bans_by", {}).items())[:10]:
         bans_by.append({
             "champion": champ,
-            "image_url": get_champion_image_url(champ),
+            "image_url": CATALOG.image_url(champ),
             "count": count,
             "rate": round(count / total * 100, 1),
         })
@@ -46,7 +47,7 @@ def _analyze_ban_priorities(profile: dict) -> dict:
     for champ, count in list(profile.get("champion_bans_against", {}).items())[:10]:
         bans_against.append({
             "champion": champ,
-            "image_url": get_champion_image_url(champ),
+            "image_url": CATALOG.image_url(champ),
             "count": count,
             "rate": round(count / total * 100, 1),
         })
@@ -84,7 +85,7 @@ def _analyze_first_picks(profile: dict) -> dict:
 
         first_picks.append({
             "champion": champ,
-            "image_url": get_champion_image_url(champ),
+            "image_url": CATALOG.image_url(champ),
             "count": count,
             "win_rate": wr,
         })
@@ -112,7 +113,7 @@ def _analyze_comfort_picks(profile: dict) -> list[dict]:
         if pick_rate >= 15 and games >= 3:
             comfort.append({
                 "champion": champ,
-                "image_url": get_champion_image_url(champ),
+                "image_url": CATALOG.image_url(champ),
                 "games": games,
                 "wins": wins,
                 "pick_rate": round(pick_rate, 1),
@@ -147,7 +148,7 @@ def _detect_one_tricks(profile: dict) -> list[dict]:
             alerts.append({
                 "player_name": pname,
                 "champion": top_champ,
-                "image_url": get_champion_image_url(top_champ),
+                "image_url": CATALOG.image_url(top_champ),
                 "games": top_data["games"],
                 "total_games": total_player_games,
                 "pick_rate": round(top_rate, 1),
@@ -165,12 +166,11 @@ def _analyze_comp_tendencies(profile: dict) -> dict:
     picks = profile.get("champion_picks", {})
 
     # Count roles from most-picked champions
-    from draftmind.core.champion_roles import get_champion_meta
     tag_counts = {}
     role_counts = {}
 
     for champ, data in picks.items():
-        meta = get_champion_meta(champ)
+        meta = CATALOG.meta(champ)
         if meta:
             for tag in meta.tags:
                 tag_counts[tag] = tag_counts.get(tag, 0) + data["games"]
@@ -190,53 +190,37 @@ def _analyze_comp_tendencies(profile: dict) -> dict:
     }
 
 
+def _team_adaptation(team_id: str) -> dict | None:
+    """Adaptation summary for a team; the draft database is only read for teams with series."""
+    snapshot = data_store.snapshot
+    if not snapshot.team_series_ids.get(team_id):
+        return None
+    return snapshot.team_adaptation.get(team_id)
+
+
 def _detect_adaptation(team_id: str) -> list[str]:
     """Detect how a team adapts between games in a series."""
-    db = data_store.draft_database
-    if not db.get("series"):
+    if not data_store.snapshot.total_series:
         return []
+    summary = _team_adaptation(team_id)
+    if not summary:
+        return ["Insufficient multi-game series data for adaptation analysis"]
 
     notes = []
-    series_count = 0
-
-    for series in db["series"]:
-        # Check if this team played in the series
-        if team_id not in series.get("teams", {}):
-            continue
-        series_count += 1
-
-        games = series.get("games", [])
-        if len(games) < 2:
-            continue
-
-        # Compare bans between game 1 and game 2
-        g1_bans = set()
-        g2_bans = set()
-        g1_picks = set()
-        g2_picks = set()
-
-        for da in games[0].get("draft_actions", []):
-            if da["team_id"] == team_id:
-                if da["action_type"] == "ban":
-                    g1_bans.add(da["champion_name"])
-                else:
-                    g1_picks.add(da["champion_name"])
-
-        if len(games) > 1:
-            for da in games[1].get("draft_actions", []):
-                if da["team_id"] == team_id:
-                    if da["action_type"] == "ban":
-                        g2_bans.add(da["champion_name"])
-                    else:
-                        g2_picks.add(da["champion_name"])
-
-        ban_changes = g2_bans - g1_bans
-        pick_overlap = g1_picks & g2_picks
-
-        if ban_changes and series_count <= 3:
-            notes.append(f"Changed bans between G1-G2: added {', '.join(ban_changes)}")
-        if pick_overlap and series_count <= 3:
-            notes.append(f"Repeated picks G1-G2: {', '.join(pick_overlap)}")
+    # Detailed notes come from the team's first few series, as before
+    for series in summary["series"][:3]:
+        for t in series["transitions"]:
+            label = f"G{t['from_game']}-G{t['to_game']}"
+            if t["bans_added"]:
+                notes.append(f"Changed bans between {label}: added {', '.join(t['bans_added'])}")
+            if t["repeated_picks"]:
+                notes.append(f"Repeated picks {label}: {', '.join(t['repeated_picks'])}")
+
+    after_loss = summary["side_after_loss"]
+    if after_loss["blue"] + after_loss["red"] >= 3:
+        preferred = "blue" if after_loss["blue"] >= after_loss["red"] else "red"
+        notes.insert(0, f"After a loss, takes {preferred} side "
+                        f"{after_loss[preferred]}/{after_loss['blue'] + after_loss['red']} times")
 
     if not notes:
         notes.append("Insufficient multi-game series data for adaptation analysis")
@@ -244,6 +228,14 @@ def _detect_adaptation(team_id: str) -> list[str]:
     return notes[:5]
 
 
+def _adaptation_summary(team_id: str) -> dict:
+    """Aggregate adaptation stats across every game of every series."""
+    summary = _team_adaptation(team_id)
+    if not summary:
+        return {}
+    return {k: v for k, v in summary.items() if k != "series"}
+
+
 def _generate_ban_recommendations(team_id: str, profile: dict) -> list[dict]:
     """Generate ban recommendations against this team."""
     recommendations = []
@@ -259,7 +251,7 @@ def _generate_ban_recommendations(team_id: str, profile: dict) -> list[dict]:
         if wr >= 55 and pick_rate >= 15:
             recommendations.append({
                 "champion": champ,
-                "image_url": get_champion_image_url(champ),
+                "image_url": CATALOG.image_url(champ),
                 "reason": f"High win rate comfort pick ({wr:.0f}% WR in {data['games']} games)",
                 "priority": "high",
                 "impact_score": round((wr / 100) * (pick_rate / 100), 3),
@@ -283,7 +275,7 @@ def _generate_ban_recommendations(team_id: str, profile: dict) -> list[dict]:
             if not already:
                 recommendations.append({
                     "champion": champ,
-                    "image_url": get_champion_image_url(champ),
+                    "image_url": CATALOG.image_url(champ),
                     "reason": f"First pick priority ({count} times on blue side)",
                     "priority": "medium",
                     "impact_score": round(count / max(profile.get("blue_games", 1), 1), 3),
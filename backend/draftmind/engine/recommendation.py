@@ -2,16 +2,22 @@
 Multi-signal draft recommendation engine.
 Orchestrates all tiers to produce ranked champion recommendations.
 """
-from draftmind.data.data_loader import data_store
-from draftmind.data.champion_metadata import get_champion_image_url
+import numpy as np
+
+from draftmind.data.data_loader import data_store, windowed
+from draftmind.core.champion_catalog import CATALOG
+from draftmind.core.champion_roles import ALL_CHAMPION_NAMES
+from draftmind.metrics import span
 from draftmind.core.draft_rules import (
     get_action_at, get_draft_phase, get_available_champions, SEQUENCE_MAP
 )
-from draftmind.core.champion_roles import ALL_CHAMPION_NAMES, normalize_champion_name
 from draftmind.engine.statistics import get_meta_score, get_team_affinity_score
 from draftmind.engine.composition_scorer import (
-    get_counter_score, score_composition_fit, analyze_composition
+    get_counter_score, get_lane_counter_score, score_composition_fit, analyze_composition,
+    estimate_win_probability, estimate_win_probability_batch,
 )
+from draftmind.engine.feature_tables import DraftFeatures, get_feature_tables
+from draftmind.engine.win_predictor import win_predictor
 
 # Scoring weights for picks
 PICK_WEIGHTS = {
@@ -30,10 +36,20 @@ BAN_WEIGHTS = {
 }
 
 
+@windowed
 def recommend(current_actions: list[dict], blue_team_id: str | None = None,
               red_team_id: str | None = None,
-              next_sequence: int | None = None) -> dict:
-    """Generate top recommendations for the next draft action."""
+              next_sequence: int | None = None,
+              include_win_delta: bool = False,
+              decayed: bool = False) -> dict:
+    """Generate top recommendations for the next draft action.
+
+    With ``include_win_delta`` (pick actions), every available champion's
+    effect on the acting side's win probability is predicted in one batched
+    call and returned alongside the scores; ``model`` says whether the ML
+    model or the heuristic estimate (no model loaded) produced it.
+    With ``decayed``, the meta and team signals use recency-weighted stats.
+    """
 
     # Determine next action
     if next_sequence is None:
@@ -53,52 +69,61 @@ def recommend(current_actions: list[dict], blue_team_id: str | None = None,
     opponent_team_id = red_team_id if acting_side == "blue" else blue_team_id
 
     # Parse current state
-    banned = []
-    blue_picks = []
-    red_picks = []
-    for a in current_actions:
-        champ = normalize_champion_name(a.get("champion_name", ""))
-        if a.get("action_type") == "ban":
-            banned.append(champ)
-        elif a.get("action_type") == "pick":
-            if a.get("team_side") == "blue":
-                blue_picks.append(champ)
-            else:
-                red_picks.append(champ)
-
-    my_picks = blue_picks if acting_side == "blue" else red_picks
-    opp_picks = red_picks if acting_side == "blue" else blue_picks
-
-    # Available champions
-    all_champs = set(data_store.champion_stats.keys()) | ALL_CHAMPION_NAMES
-    used = set(banned) | set(blue_picks) | set(red_picks)
-    available = all_champs - used
+    with span("recommend.parse"):
+        banned = []
+        blue_picks = []
+        red_picks = []
+        for a in current_actions:
+            champ = CATALOG.resolve(a.get("champion_name", ""))
+            if a.get("action_type") == "ban":
+                banned.append(champ)
+            elif a.get("action_type") == "pick":
+                if a.get("team_side") == "blue":
+                    blue_picks.append(champ)
+                else:
+                    red_picks.append(champ)
+
+        my_picks = blue_picks if acting_side == "blue" else red_picks
+        opp_picks = red_picks if acting_side == "blue" else blue_picks
+
+    # Available champions (unknown champions are skipped)
+    with span("recommend.candidates"):
+        all_champs = set(data_store.champion_stats.keys()) | ALL_CHAMPION_NAMES
+        used = set(banned) | set(blue_picks) | set(red_picks)
+        available = all_champs - used
+        candidates = [c for c in available if c in data_store.champion_stats]
 
     # Score each available champion
-    scored = []
-    for champ in available:
-        if champ not in data_store.champion_stats:
-            continue  # Skip unknown champions
-
-        if action_type == "pick":
-            scores = _score_pick(champ, acting_team_id, my_picks, opp_picks)
-        else:
-            scores = _score_ban(champ, acting_team_id, opponent_team_id, opp_picks)
-
-        total = scores["total"]
-        reasons = _generate_reasons(champ, scores, action_type, acting_team_id, opponent_team_id)
-
-        scored.append({
-            "champion_name": champ,
-            "image_url": get_champion_image_url(champ),
-            "score": round(total, 3),
-            "confidence": _get_confidence(champ, scores),
-            "reasons": reasons,
-            "meta_score": round(scores.get("meta", 0), 3),
-            "team_score": round(scores.get("team_affinity", scores.get("opponent_priority", 0)), 3),
-            "counter_score": round(scores.get("counter", 0), 3),
-            "composition_score": round(scores.get("composition", scores.get("opponent_frequency", 0)), 3),
-        })
+    if action_type == "pick":
+        all_scores = _score_picks(candidates, acting_team_id, my_picks, opp_picks, decayed)
+    else:
+        all_scores = _score_bans(candidates, acting_team_id, opponent_team_id, opp_picks, decayed)
+
+    base_prob, win_deltas, win_model = None, None, None
+    if include_win_delta and action_type == "pick":
+        base_prob, win_deltas, win_model = _win_deltas(candidates, acting_side, blue_picks,
+                                                       red_picks, blue_team_id, red_team_id)
+
+    with span("recommend.reasons"):
+        scored = []
+        for champ in candidates:
+            scores = all_scores[champ]
+            total = scores["total"]
+            reasons = _generate_reasons(champ, scores, action_type, acting_team_id, opponent_team_id)
+
+            scored.append({
+                "champion_name": champ,
+                "image_url": CATALOG.image_url(champ),
+                "score": round(total, 3),
+                "confidence": _get_confidence(champ, scores),
+                "reasons": reasons,
+                "meta_score": round(scores.get("meta", 0), 3),
+                "team_score": round(scores.get("team_affinity", scores.get("opponent_priority", 0)), 3),
+                "counter_score": round(scores.get("counter", 0), 3),
+                "composition_score": round(scores.get("composition", scores.get("opponent_frequency", 0)), 3),
+            })
+            if win_deltas is not None:
+                scored[-1]["win_delta"] = win_deltas[champ]
 
     # Sort by total score, take top 5
     scored.sort(key=lambda x: -x["score"])
@@ -111,7 +136,7 @@ def recommend(current_actions: list[dict], blue_team_id: str | None = None,
         if profile:
             acting_team_name = profile["team_name"]
 
-    return {
+    result = {
         "next_action": {
             "sequence_number": next_sequence,
             "action_type": action_type,
@@ -122,78 +147,139 @@ def recommend(current_actions: list[dict], blue_team_id: str | None = None,
         "acting_team_id": acting_team_id,
         "acting_team_name": acting_team_name,
     }
-
-
-def _score_pick(champ: str, team_id: str | None,
-                my_picks: list[str], opp_picks: list[str]) -> dict:
-    """Score a champion for a pick action."""
-    meta = get_meta_score(champ)
-    team_aff = get_team_affinity_score(champ, team_id) if team_id else 0.3
-    counter = get_counter_score(champ, opp_picks)
-    comp = score_composition_fit(champ, my_picks)
-
-    total = (
-        meta * PICK_WEIGHTS["meta"] +
-        team_aff * PICK_WEIGHTS["team_affinity"] +
-        counter * PICK_WEIGHTS["counter"] +
-        comp * PICK_WEIGHTS["composition"]
-    )
-
-    return {
-        "meta": meta,
-        "team_affinity": team_aff,
-        "counter": counter,
-        "composition": comp,
-        "total": total,
-    }
-
-
-def _score_ban(champ: str, team_id: str | None,
-               opponent_id: str | None, opp_picks: list[str]) -> dict:
-    """Score a champion for a ban action."""
-    meta = get_meta_score(champ)
-
-    # Opponent priority: how much the opponent wants this champion
-    opp_priority = 0.0  # Default 0 if no opponent data — don't ban blindly
-    opp_freq = 0.0
-    has_opponent_data = False
-    if opponent_id:
-        opp_profile = data_store.team_profiles.get(opponent_id)
-        if opp_profile:
-            picks = opp_profile.get("champion_picks", {})
-            opp_games = opp_profile["total_games"] or 1
-            champ_data = picks.get(champ)
-            if champ_data:
-                has_opponent_data = True
-                wr = champ_data["wins"] / max(champ_data["games"], 1)
-                freq = champ_data["games"] / opp_games
-                opp_priority = min(wr * freq * 3, 1.0)
-                opp_freq = min(freq * 2, 1.0)
-
+    if win_deltas is not None:
+        result["base_win_probability"] = base_prob
+        result["win_deltas"] = dict(sorted(win_deltas.items(), key=lambda kv: -kv[1]))
+        result["model"] = win_model
+    return result
+
+
+def _win_deltas(candidates: list[str], acting_side: str,
+                blue_picks: list[str], red_picks: list[str],
+                blue_team_id: str | None, red_team_id: str | None) -> tuple[float, dict, str]:
+    """Acting side's current win probability, each candidate's change to it, and the model used.
+
+    The current draft's feature partials are built once; every candidate's
+    post-pick feature row is derived from them in one vectorized pass, and
+    all rows (plus the base row) go through the model in a single call.
+    Without the model, the heuristic estimate runs over the same drafts as
+    champion-id arrays, as the Monte Carlo simulator does.
+    """
+    with span("recommend.signal.win_delta"):
+        tables = get_feature_tables()
+        ids = np.array([tables.index[c] for c in candidates], dtype=np.intp)
+        if win_predictor.ready:
+            model = "xgboost"
+            state = DraftFeatures(tables, blue_team_id, red_team_id)
+            for champ in blue_picks:
+                state.add("blue", champ)
+            for champ in red_picks:
+                state.add("red", champ)
+            rows = np.vstack([state.vector(), state.expand(acting_side, ids)])
+            probs = list(win_predictor.predict_many(rows))
+        else:
+            model = "heuristic"
+            # Unknown champions are skipped, as DraftFeatures.add does
+            picks = {side: np.array([tables.index[c] for c in names if c in tables.index],
+                                    dtype=np.intp)
+                     for side, names in (("blue", blue_picks), ("red", red_picks))}
+            base = estimate_win_probability_batch(
+                tables, picks["blue"][None], picks["red"][None], blue_team_id, red_team_id)
+            other_side = "red" if acting_side == "blue" else "blue"
+            grown = np.column_stack([np.tile(picks[acting_side], (len(ids), 1)), ids])
+            other = np.tile(picks[other_side], (len(ids), 1))
+            blue, red = (grown, other) if acting_side == "blue" else (other, grown)
+            probs = [float(p) for p in np.concatenate([
+                base, estimate_win_probability_batch(tables, blue, red, blue_team_id, red_team_id)])]
+
+    if acting_side == "red":
+        probs = [1 - p for p in probs]
+    base = round(probs[0], 3)
+    return base, {c: round(p - probs[0], 3) for c, p in zip(candidates, probs[1:])}, model
+
+
+def _score_picks(candidates: list[str], team_id: str | None,
+                 my_picks: list[str], opp_picks: list[str],
+                 decayed: bool = False) -> dict[str, dict]:
+    """Score every candidate for a pick action, one signal at a time."""
+    with span("recommend.signal.meta"):
+        meta = {c: get_meta_score(c, decayed) for c in candidates}
+    with span("recommend.signal.team_affinity"):
+        team_aff = {c: get_team_affinity_score(c, team_id, decayed) if team_id else 0.3
+                    for c in candidates}
+    with span("recommend.signal.counter"):
+        counter = {c: get_lane_counter_score(c, opp_picks) for c in candidates}
+    with span("recommend.signal.composition"):
+        comp = {c: score_composition_fit(c, my_picks) for c in candidates}
+
+    results = {}
+    for c in candidates:
+        total = (
+            meta[c] * PICK_WEIGHTS["meta"] +
+            team_aff[c] * PICK_WEIGHTS["team_affinity"] +
+            counter[c] * PICK_WEIGHTS["counter"] +
+            comp[c] * PICK_WEIGHTS["composition"]
+        )
+        results[c] = {
+            "meta": meta[c],
+            "team_affinity": team_aff[c],
+            "counter": counter[c],
+            "composition": comp[c],
+            "total": total,
+        }
+    return results
+
+
+def _opponent_signal(champ: str, opp_profile: dict | None) -> tuple[float, float, bool]:
+    """How much the opponent wants this champion: (priority, frequency, has_data)."""
+    if not opp_profile:
+        return 0.0, 0.0, False  # Default 0 if no opponent data — don't ban blindly
+    champ_data = opp_profile.get("champion_picks", {}).get(champ)
+    if not champ_data:
+        return 0.0, 0.0, False
+    opp_games = opp_profile["total_games"] or 1
+    wr = champ_data["wins"] / max(champ_data["games"], 1)
+    freq = champ_data["games"] / opp_games
+    return min(wr * freq * 3, 1.0), min(freq * 2, 1.0), True
+
+
+def _score_bans(candidates: list[str], team_id: str | None,
+                opponent_id: str | None, opp_picks: list[str],
+                decayed: bool = False) -> dict[str, dict]:
+    """Score every candidate for a ban action, one signal at a time."""
+    with span("recommend.signal.meta"):
+        meta = {c: get_meta_score(c, decayed) for c in candidates}
+    with span("recommend.signal.opponent"):
+        opp_profile = data_store.team_profiles.get(opponent_id) if opponent_id else None
+        opponent = {c: _opponent_signal(c, opp_profile) for c in candidates}
     # Counter: banning a champion that counters our picks
-    counter = 0.1
-    if opp_picks:
-        counter = get_counter_score(champ, opp_picks) * 0.5
-
-    # For bans, heavily favor champions with actual opponent data
-    total = (
-        opp_priority * BAN_WEIGHTS["opponent_priority"] +
-        opp_freq * BAN_WEIGHTS["opponent_frequency"] +
-        meta * BAN_WEIGHTS["meta"] +
-        counter * BAN_WEIGHTS["counter"]
-    )
-
-    # Bonus for champions with opponent data (data-driven bans beat pure meta)
-    if has_opponent_data:
-        total += 0.05
-
-    return {
-        "opponent_priority": opp_priority,
-        "opponent_frequency": opp_freq,
-        "meta": meta,
-        "counter": counter,
-        "total": total,
-    }
+    with span("recommend.signal.counter"):
+        if opp_picks:
+            counter = {c: get_counter_score(c, opp_picks) * 0.5 for c in candidates}
+        else:
+            counter = dict.fromkeys(candidates, 0.1)
+
+    results = {}
+    for c in candidates:
+        opp_priority, opp_freq, has_opponent_data = opponent[c]
+        # For bans, heavily favor champions with actual opponent data
+        total = (
+            opp_priority * BAN_WEIGHTS["opponent_priority"] +
+            opp_freq * BAN_WEIGHTS["opponent_frequency"] +
+            meta[c] * BAN_WEIGHTS["meta"] +
+            counter[c] * BAN_WEIGHTS["counter"]
+        )
+        # Bonus for champions with opponent data (data-driven bans beat pure meta)
+        if has_opponent_data:
+            total += 0.05
+        results[c] = {
+            "opponent_priority": opp_priority,
+            "opponent_frequency": opp_freq,
+            "meta": meta[c],
+            "counter": counter[c],
+            "total": total,
+        }
+    return results
 
 
 def _generate_reasons(champ: str, scores: dict, action_type: str,
@@ -257,6 +343,7 @@ def _get_confidence(champ: str, scores: dict) -> str:
     return "low"
 
 
+@windowed
 def simulate_draft(blue_picks: list[str], red_picks: list[str],
                    blue_team_id: str | None = None,
                    red_team_id: str | None = None) -> dict:
@@ -306,7 +393,6 @@ def simulate_draft(blue_picks: list[str], red_picks: list[str],
         notes.append("Relatively even draft — game will likely be decided by execution")
 
     # Estimate win probability from composition signals
-    from draftmind.engine.composition_scorer import estimate_win_probability
     win_prob = estimate_win_probability(blue_analysis, red_analysis,
                                          blue_team_id, red_team_id)
 
@@ -316,3 +402,48 @@ def simulate_draft(blue_picks: list[str], red_picks: list[str],
         "matchup_notes": notes,
         "blue_win_probability": win_prob,
     }
+
+
+def win_curve(actions: list[dict], blue_team_id: str | None = None,
+              red_team_id: str | None = None) -> dict:
+    """Blue-side win probability after every pick of a draft.
+
+    With the ML model loaded, features are updated incrementally pick by pick
+    and all rows go through the model in one batch. Otherwise each point uses
+    the heuristic estimate, as simulate_draft does.
+    """
+    picks = []
+    for a in sorted(actions, key=lambda x: x.get("sequence_number", 0)):
+        if a.get("action_type") == "pick":
+            side = "blue" if a.get("team_side") == "blue" else "red"
+            picks.append((a.get("sequence_number", 0), side,
+                          CATALOG.resolve(a.get("champion_name", ""))))
+
+    if win_predictor.ready:
+        model = "xgboost"
+        with span("win_curve.features"):
+            state = DraftFeatures(get_feature_tables(), blue_team_id, red_team_id)
+            rows = []
+            for _, side, champ in picks:
+                state.add(side, champ)
+                rows.append(state.vector())
+        probs = win_predictor.predict_many(rows)
+    else:
+        model = "heuristic"
+        probs = []
+        blue, red = [], []
+        for _, side, champ in picks:
+            (blue if side == "blue" else red).append(champ)
+            probs.append(estimate_win_probability(
+                analyze_composition(blue, "blue", blue_team_id or ""),
+                analyze_composition(red, "red", red_team_id or ""),
+                blue_team_id, red_team_id))
+
+    return {
+        "points": [
+            {"sequence_number": seq, "team_side": side, "champion_name": champ,
+             "blue_win_probability": prob}
+            for (seq, side, champ), prob in zip(picks, probs)
+        ],
+        "model": model,
+    }
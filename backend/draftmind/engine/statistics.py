@@ -2,116 +2,176 @@
 Tier 1: Statistical intelligence engine.
 Provides champion stats, team stats, and meta analysis.
 """
+from draftmind.core.champion_catalog import CATALOG
 from draftmind.data.data_loader import data_store
-from draftmind.data.champion_metadata import get_champion_image_url
+from draftmind.data.indexes import CHAMPION_SORT_KEYS
+from draftmind.data.pair_store import DEFAULT_MIN_GAMES
 
 
-def get_champion_list(sort_by: str = "presence", limit: int = 50, role: str = "") -> list[dict]:
-    """Get sorted list of champions with stats."""
-    champs = list(data_store.champion_stats.values())
+def get_champion_list(sort_by: str = "presence", limit: int = 50, role: str = "",
+                      after: str = "") -> list[dict]:
+    """Get sorted list of champions with stats.
 
-    if role:
-        champs = [c for c in champs if c.get("primary_role") == role]
-
-    valid_sorts = {"presence", "win_rate", "pick_rate", "ban_rate", "games_played", "name"}
-    if sort_by not in valid_sorts:
+    Orderings are precomputed per sort key and role, so this is a slice.
+    ``after`` is a cursor: the name of the last champion on the previous page.
+    """
+    snapshot = data_store.snapshot
+    if sort_by not in CHAMPION_SORT_KEYS:
         sort_by = "presence"
 
-    reverse = sort_by != "name"
-    champs.sort(key=lambda x: x.get(sort_by, 0), reverse=reverse)
+    key = (sort_by, role)
+    ranked = snapshot.champion_leaderboards.get(key, [])
+
+    start = 0
+    if after:
+        pos = snapshot.champion_positions.get(key, {}).get(after)
+        if pos is None:
+            return []
+        start = pos + 1
+
+    return ranked[start:start + limit]
 
-    return champs[:limit]
 
+def resolve_champion_name(name: str) -> str | None:
+    """Resolve a user-supplied champion name to its champion_stats key."""
+    snapshot = data_store.snapshot
+    if name in snapshot.champion_stats:
+        return name
+    return snapshot.champion_names.get(name.casefold())
 
-def get_champion_detail(name: str) -> dict | None:
-    """Get detailed stats for a champion including synergies and counters."""
+
+def get_champion_detail(name: str, min_games: int = DEFAULT_MIN_GAMES,
+                        prior_games: float = 0.0) -> dict | None:
+    """Get detailed stats for a champion including synergies and counters.
+
+    Pairs with fewer than ``min_games`` games are left out. With
+    ``prior_games`` each pair also gets ``adjusted_win_rate``, shrunk toward
+    50% as if that many extra games had been played.
+    """
     # Try exact match first, then case-insensitive
-    stats = data_store.champion_stats.get(name)
-    if not stats:
-        name_lower = name.lower()
-        for k, v in data_store.champion_stats.items():
-            if k.lower() == name_lower:
-                stats = v
-                name = k
-                break
-    if not stats:
+    name = resolve_champion_name(name)
+    if not name:
         return None
-
-    result = dict(stats)
-
-    # Add synergies
-    synergies_data = data_store.champion_pairs.get("synergies", {}).get(name, {})
-    result["synergies"] = [
-        {"champion": k, "image_url": get_champion_image_url(k), **v}
-        for k, v in list(synergies_data.items())[:10]
-    ]
-
-    # Add counters
-    counters_data = data_store.champion_pairs.get("counters", {}).get(name, {})
-    result["counters"] = [
-        {"champion": k, "image_url": get_champion_image_url(k), **v}
-        for k, v in list(counters_data.items())[:10]
-    ]
-
-    # Add teams that pick this champion
-    teams_picking = []
-    for tid, profile in data_store.team_profiles.items():
-        picks = profile.get("champion_picks", {})
-        if name in picks:
-            teams_picking.append({
-                "team_id": tid,
-                "team_name": profile["team_name"],
-                "games": picks[name]["games"],
-                "wins": picks[name]["wins"],
-                "win_rate": round(picks[name]["wins"] / max(picks[name]["games"], 1) * 100, 1),
-            })
-    teams_picking.sort(key=lambda x: -x["games"])
-    result["picked_by_teams"] = teams_picking[:10]
+    snapshot = data_store.snapshot
+
+    result = dict(snapshot.champion_stats[name])
+
+    # Add synergies and counters (most-played first)
+    pairs = snapshot.champion_pairs
+    for key, table in (("synergies", pairs.synergies), ("counters", pairs.counters)):
+        rows = []
+        for k, v in table.top(name, limit=10, min_games=min_games):
+            row = {"champion": k, "image_url": CATALOG.image_url(k), **v}
+            if prior_games:
+                row["adjusted_win_rate"] = round(table.win_rate_of(
+                    name, k, min_games=min_games, prior_games=prior_games), 1)
+            rows.append(row)
+        result[key] = rows
+
+    # Add teams that pick this champion (pre-sorted by games at load time)
+    result["picked_by_teams"] = snapshot.champion_teams.get(name, [])[:10]
+
+    # Recency-weighted record, when decayed statistics are available
+    decayed = snapshot.decayed
+    if decayed:
+        result["recent"] = decayed.summary(decayed.get("champions", name))
 
     return result
 
 
-def get_team_list(search: str = "", limit: int = 20) -> list[dict]:
-    """Get list of teams with summary stats."""
-    teams = []
-    for tid, profile in data_store.team_profiles.items():
-        if search and search.lower() not in profile["team_name"].lower():
-            continue
-
-        top_picks = [
-            {"champion": k, "games": v["games"], "wins": v["wins"],
-             "win_rate": round(v["wins"] / max(v["games"], 1) * 100, 1),
-             "image_url": get_champion_image_url(k)}
-            for k, v in list(profile.get("champion_picks", {}).items())[:5]
-        ]
-        top_bans = [
-            {"champion": k, "count": v}
-            for k, v in list(profile.get("champion_bans_by", {}).items())[:5]
-        ]
-
-        teams.append({
-            "team_id": tid,
-            "team_name": profile["team_name"],
-            "total_games": profile["total_games"],
-            "total_wins": profile["total_wins"],
-            "win_rate": profile["win_rate"],
-            "series_count": profile["series_count"],
-            "top_picks": top_picks,
-            "top_bans": top_bans,
-        })
-
-    teams.sort(key=lambda x: -x["total_games"])
-    return teams[:limit]
+def get_champion_matchups(name: str, role: str = "", min_games: int = DEFAULT_MIN_GAMES,
+                          limit: int = 20) -> dict | None:
+    """Lane head-to-heads for a champion in one role (its most played role by default).
+
+    Each matchup carries the champion's record against that lane opponent
+    and its average per-minute gold / CS / damage lead over them.
+    """
+    name = resolve_champion_name(name)
+    if not name:
+        return None
+    lanes = data_store.snapshot.lane_matchups
+    role_games = lanes.role_games(name)
+    if not role:
+        meta = CATALOG.meta(name)
+        role = next(iter(role_games), meta.primary_role if meta else "")
+    table = lanes.table(role)
+    matchups = table.top(name, limit=limit, min_games=min_games) if table else []
+    return {
+        "champion": name,
+        "image_url": CATALOG.image_url(name),
+        "role": role,
+        "roles": role_games,
+        "matchups": [
+            {"champion": k, "image_url": CATALOG.image_url(k), **v}
+            for k, v in matchups
+        ],
+    }
+
+
+def get_champion_players(name: str, limit: int = 20) -> dict | None:
+    """Get the players with the most games on a champion."""
+    name = resolve_champion_name(name)
+    if not name:
+        return None
+    players = data_store.snapshot.champion_players.get(name, [])
+    return {
+        "champion": name,
+        "image_url": CATALOG.image_url(name),
+        "total_players": len(players),
+        "players": players[:limit],
+    }
+
+
+def get_team_list(search: str = "", limit: int = 20, after: str = "") -> list[dict]:
+    """Get list of teams with summary stats, most games first.
+
+    ``after`` is a cursor: the team_id of the last team on the previous page.
+    """
+    snapshot = data_store.snapshot
+    teams = snapshot.team_leaderboard
+
+    start = 0
+    if after:
+        pos = snapshot.team_positions.get(after)
+        if pos is None:
+            return []
+        start = pos + 1
+
+    if not search:
+        return teams[start:start + limit]
+
+    search_lower = search.lower()
+    matches = []
+    for team in teams[start:]:
+        if search_lower in team["team_name"].lower():
+            matches.append(team)
+            if len(matches) == limit:
+                break
+    return matches
 
 
 def get_team_detail(team_id: str) -> dict | None:
-    """Get detailed team profile."""
-    return data_store.team_profiles.get(team_id)
+    """Get detailed team profile (plus its recency-weighted record, when available)."""
+    snapshot = data_store.snapshot
+    profile = snapshot.team_profiles.get(team_id)
+    decayed = snapshot.decayed
+    if profile is None or not decayed:
+        return profile
+    return {**profile, "recent_form": decayed.summary(decayed.team(team_id))}
+
 
+def get_meta_score(champion_name: str, decayed: bool = False) -> float:
+    """Calculate meta relevance score for a champion (0-1).
 
-def get_meta_score(champion_name: str) -> float:
-    """Calculate meta relevance score for a champion (0-1)."""
+    With ``decayed``, rates and sample size come from the recency-weighted
+    statistics (falling back to the flat ones when they are not loaded).
+    """
     stats = data_store.champion_stats.get(champion_name)
+    recent = data_store.snapshot.decayed if decayed else None
+    if recent:
+        stats = recent.champion(champion_name)
+        if stats:
+            stats["games_played"] = stats["games"]
     if not stats:
         return 0.0
 
@@ -130,12 +190,20 @@ def get_meta_score(champion_name: str) -> float:
     return max(0, min(1, score))
 
 
-def get_team_affinity_score(champion_name: str, team_id: str) -> float:
-    """Calculate how well a champion fits a team's style (0-1)."""
+def get_team_affinity_score(champion_name: str, team_id: str, decayed: bool = False) -> float:
+    """Calculate how well a champion fits a team's style (0-1).
+
+    With ``decayed``, pick frequency, win rate and player mastery use the
+    recency-weighted statistics (when they are loaded).
+    """
     profile = data_store.team_profiles.get(team_id)
     if not profile:
         return 0.0
 
+    recent = data_store.snapshot.decayed if decayed else None
+    if recent:
+        return _decayed_team_affinity(recent, champion_name, team_id)
+
     picks = profile.get("champion_picks", {})
     champ_data = picks.get(champion_name)
     if not champ_data:
@@ -155,3 +223,18 @@ def get_team_affinity_score(champion_name: str, team_id: str) -> float:
 
     score = (pick_freq * 0.3 + champ_wr * 0.4 + player_mastery * 0.3)
     return max(0, min(1, score))
+
+
+def _decayed_team_affinity(recent, champion_name: str, team_id: str) -> float:
+    """get_team_affinity_score over recency-weighted games and wins."""
+    team = recent.team(team_id)
+    champ_data = recent.team_pick(team_id, champion_name)
+    if not team or not champ_data or not champ_data["games"]:
+        return 0.1  # Small base score for unknown
+
+    pick_freq = champ_data["games"] / (team["games"] or 1)
+    champ_wr = champ_data["wins"] / champ_data["games"]
+    player_mastery = min(recent.player_mastery(team_id, champion_name) / 5, 1.0)
+
+    score = (pick_freq * 0.3 + champ_wr * 0.4 + player_mastery * 0.3)
+    return max(0, min(1, score))
@@ -5,8 +5,11 @@ Loaded at startup from data/models/win_model.json.
 import math
 from pathlib import Path
 
+import numpy as np
+
 from draftmind.engine.feature_extraction import extract_features
 from draftmind.data.data_loader import data_store
+from draftmind.metrics import span
 
 # Temperature scaling factor.  T > 1 softens overconfident predictions.
 # The model is trained on aggregate stats that include leakage, so raw
@@ -22,6 +25,12 @@ def _temperature_scale(prob: float, temperature: float = TEMPERATURE) -> float:
     return 1.0 / (1.0 + math.exp(-scaled_logit))
 
 
+def _calibrate(raw_prob: float) -> float:
+    """Temperature-scale a raw model probability and clamp to [0.25, 0.75]."""
+    prob = _temperature_scale(float(raw_prob))
+    return max(0.25, min(0.75, round(prob, 3)))
+
+
 class WinPredictor:
     """Singleton XGBoost-based win probability predictor."""
 
@@ -43,16 +52,27 @@ class WinPredictor:
         if not self.ready or not self.model:
             raise RuntimeError("Model not loaded")
 
-        features = extract_features(
-            blue_picks, red_picks,
-            blue_team_id, red_team_id,
-            data_store.champion_stats,
-            data_store.champion_pairs,
-            data_store.team_profiles,
-        )
-        raw_prob = self.model.predict_proba([features])[0][1]  # P(blue wins)
-        prob = _temperature_scale(raw_prob)
-        return max(0.25, min(0.75, round(prob, 3)))
+        with span("win_predictor.features"):
+            features = extract_features(
+                blue_picks, red_picks,
+                blue_team_id, red_team_id,
+                data_store.champion_stats,
+                data_store.champion_pairs,
+                data_store.team_profiles,
+            )
+        with span("win_predictor.model"):
+            raw_prob = self.model.predict_proba([features])[0][1]  # P(blue wins)
+        return _calibrate(raw_prob)
+
+    def predict_many(self, rows) -> list[float]:
+        """Blue-side win probabilities for many feature rows in one model call."""
+        if not self.ready or not self.model:
+            raise RuntimeError("Model not loaded")
+        if len(rows) == 0:
+            return []
+        with span("win_predictor.model"):
+            raw = self.model.predict_proba(np.asarray(rows, dtype=np.float32))[:, 1]
+        return [_calibrate(p) for p in raw]
 
 
 # Global singleton
@@ -15,29 +15,46 @@ from draftmind.config import VERSION, MODEL_DIR
 from draftmind.data.data_loader import data_store
 from draftmind.engine.win_predictor import win_predictor
 from draftmind.api.router import api_router
+from draftmind.api.compression import CompressionMiddleware
+from draftmind.api.cpu_pool import cpu_pool
+from draftmind.api.serialization import FastJSONResponse
+from draftmind.metrics import MetricsMiddleware
+
+
+def load_runtime():
+    """Load data and the win model into this process, if not already loaded.
+
+    The pre-fork server (draftmind.serve) calls this in the parent so that
+    workers inherit the loaded data instead of each reading it again.
+    """
+    if not data_store.loaded:
+        data_store.load()
+        if data_store.loaded:
+            print(f"  Data loaded: {data_store.total_series} series, "
+                  f"{data_store.total_games} games, "
+                  f"{data_store.total_champions} champions, "
+                  f"{len(data_store.team_profiles)} teams")
+        else:
+            print("  WARNING: No processed data found. Run pipeline scripts first.")
+
+    # Load ML win predictor if model exists
+    if not win_predictor.ready:
+        model_path = MODEL_DIR / "win_model.json"
+        if model_path.exists():
+            win_predictor.load(model_path)
+            print(f"  ML win predictor loaded from {model_path}")
+        else:
+            print("  ML model not found — using heuristic win predictor")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Load data into memory on startup."""
     print(f"DraftMind AI v{VERSION} starting...")
-    data_store.load()
-    if data_store.loaded:
-        print(f"  Data loaded: {data_store.total_series} series, "
-              f"{data_store.total_games} games, "
-              f"{data_store.total_champions} champions, "
-              f"{len(data_store.team_profiles)} teams")
-    else:
-        print("  WARNING: No processed data found. Run pipeline scripts first.")
-
-    # Load ML win predictor if model exists
-    model_path = MODEL_DIR / "win_model.json"
-    if model_path.exists():
-        win_predictor.load(model_path)
-        print(f"  ML win predictor loaded from {model_path}")
-    else:
-        print("  ML model not found — using heuristic win predictor")
+    load_runtime()
+    cpu_pool.start()
     yield
+    cpu_pool.shutdown()
     print("DraftMind AI shutting down.")
 
 
@@ -46,6 +63,7 @@ app = FastAPI(
     description="AI-powered LoL draft recommendation engine using GRID esports data",
     version=VERSION,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
@@ -56,6 +74,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Brotli/gzip for dynamic responses above COMPRESSION_MIN_BYTES (cached
+# responses are served pre-compressed)
+app.add_middleware(CompressionMiddleware)
+
+# Per-route latency histograms (served on /metrics) and optional Server-Timing
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(api_router)
 
 # ── Serve built frontend (production) ──────────────────────────
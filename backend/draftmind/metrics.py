@@ -0,0 +1,177 @@
+"""
+Lightweight latency instrumentation: per-route request timing and
+span-style engine stage timers, exported as Prometheus text on /metrics.
+
+No external service or client library is needed — histograms live in
+process memory. In pre-fork mode each worker keeps its own registry.
+Work offloaded to the CPU pool returns its spans to the parent, which
+records them (see api/cpu_pool.py).
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from draftmind.config import SERVER_TIMING
+
+# Seconds. Covers sub-millisecond lookups up to slow LLM/TTS calls.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Histogram:
+    """Thread-safe labelled histogram with fixed buckets."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...],
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._series: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[idx] += 1
+            series[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {k: list(v) for k, v in self._series.items()}
+        for key, series in sorted(snapshot.items()):
+            labels = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(self.labelnames, key))
+            prefix = labels + "," if labels else ""
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            cumulative += series[len(self.buckets)]
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{labels}}} {series[-1]:.6f}")
+            lines.append(f"{self.name}_count{{{labels}}} {cumulative}")
+        return lines
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+REQUEST_LATENCY = Histogram(
+    "draftmind_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+)
+STAGE_LATENCY = Histogram(
+    "draftmind_stage_duration_seconds",
+    "Engine stage latency (recommend signals, model, narration, TTS).",
+    ("stage",),
+)
+REGISTRY = [REQUEST_LATENCY, STAGE_LATENCY]
+
+
+# ─── Spans ────────────────────────────────────────────────────
+
+# Spans recorded while handling the current request (None = not collecting)
+_request_spans: ContextVar[list | None] = ContextVar("draftmind_request_spans", default=None)
+
+
+def record_span(stage: str, seconds: float):
+    """Record a finished stage into the histogram and the current request."""
+    STAGE_LATENCY.observe(seconds, stage=stage)
+    spans = _request_spans.get()
+    if spans is not None:
+        spans.append((stage, seconds))
+
+
+@contextmanager
+def span(stage: str):
+    """Time a block of code as an engine stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(stage, time.perf_counter() - start)
+
+
+@contextmanager
+def collect_spans():
+    """Collect every span recorded inside the block into a list."""
+    spans: list = []
+    token = _request_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _request_spans.reset(token)
+
+
+def render_prometheus() -> str:
+    """All metrics in Prometheus text exposition format."""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ─── ASGI middleware ──────────────────────────────────────────
+
+def _server_timing(spans: list, total: float) -> bytes:
+    # Aggregate repeated stages so the header stays short
+    totals: dict[str, float] = {}
+    for stage, seconds in spans:
+        totals[stage] = totals.get(stage, 0.0) + seconds
+    parts = [f"{stage};dur={seconds * 1000:.2f}" for stage, seconds in totals.items()]
+    parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts).encode("latin-1")
+
+
+class MetricsMiddleware:
+    """Times every HTTP request by route template; optionally adds Server-Timing."""
+
+    def __init__(self, app, server_timing: bool = SERVER_TIMING):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {"code": 500}
+        spans: list = []
+        token = _request_spans.set(spans)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                if self.server_timing:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing",
+                                    _server_timing(spans, time.perf_counter() - start)))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_spans.reset(token)
+            route = scope.get("route")
+            REQUEST_LATENCY.observe(
+                time.perf_counter() - start,
+                method=scope.get("method", ""),
+                route=getattr(route, "path", "unmatched"),
+                status=status["code"],
+            )
@@ -122,6 +122,7 @@ class DraftRecommendRequest(BaseModel):
     blue_team_id: Optional[str] = None
     red_team_id: Optional[str] = None
     next_action_sequence: Optional[int] = None
+    include_win_delta: bool = False  # predict each candidate's win-probability change
 
 
 class RecommendedChampion(BaseModel):
@@ -134,6 +135,7 @@ class RecommendedChampion(BaseModel):
     team_score: float = 0
     counter_score: float = 0
     composition_score: float = 0
+    win_delta: Optional[float] = None  # acting side's win-probability change
 
 
 class DraftRecommendResponse(BaseModel):
@@ -142,6 +144,9 @@ class DraftRecommendResponse(BaseModel):
     draft_phase: str
     acting_team_id: Optional[str] = None
     acting_team_name: Optional[str] = None
+    base_win_probability: Optional[float] = None  # acting side, before this pick
+    win_deltas: Optional[dict[str, float]] = None  # every available champion
+    model: Optional[str] = None  # win_deltas source: "xgboost" or "heuristic"
 
 
 # ─── Draft Simulation ────────────────────────────────────────
@@ -176,6 +181,41 @@ class DraftSimulateResponse(BaseModel):
     blue_win_probability: Optional[float] = None
 
 
+class DraftWinCurveRequest(BaseModel):
+    actions: list[DraftAction]  # full (or partial) draft, any order
+    blue_team_id: Optional[str] = None
+    red_team_id: Optional[str] = None
+
+
+class WinCurvePoint(BaseModel):
+    sequence_number: int
+    team_side: str
+    champion_name: str
+    blue_win_probability: float
+
+
+class DraftWinCurveResponse(BaseModel):
+    points: list[WinCurvePoint]  # one per pick, in draft order
+    model: str  # "xgboost" or "heuristic"
+
+
+class DraftMonteCarloRequest(BaseModel):
+    current_actions: list[DraftAction] = Field(default_factory=list)
+    blue_team_id: Optional[str] = None
+    red_team_id: Optional[str] = None
+    team_side: str = "blue"  # perspective for win probability and enemy comps
+    rollouts: int = Field(10_000, ge=1, le=100_000)
+    seed: Optional[int] = None
+
+
+class DraftOpponentPredictRequest(BaseModel):
+    current_actions: list[DraftAction] = Field(default_factory=list)
+    blue_team_id: Optional[str] = None
+    red_team_id: Optional[str] = None
+    team_side: str = "blue"  # our side; predicts the other side's next action
+    top_k: int = Field(10, ge=1, le=50)
+
+
 # ─── Analysis ─────────────────────────────────────────────────
 
 class MatchupRequest(BaseModel):
@@ -200,6 +240,7 @@ class PatternResponse(BaseModel):
     one_trick_alerts: list[dict]
     composition_tendencies: dict
     adaptation_between_games: list[str]
+    adaptation_summary: dict = {}
 
 
 # ─── Draft Narration ─────────────────────────────────────────
@@ -0,0 +1,107 @@
+"""
+On-demand profiling for production workers.
+
+- ``sample_stacks``: a wall-clock stack sampler over every thread in this
+  process, returning flamegraph-compatible collapsed stacks
+  (``frame;frame;frame count`` per line — feed to flamegraph.pl or speedscope).
+- ``profile_call``: cProfile around a single engine call.
+
+Nothing here runs unless asked for: the sampler thread only exists for the
+duration of a profile, and unprofiled requests never touch cProfile.
+Work running inside CPU pool processes is not visible to the sampler.
+"""
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable
+
+# Leaf frames of threads that are just waiting for work
+IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+_sampler_lock = threading.Lock()
+# Only one cProfile.Profile may be enabled per process (Python 3.12+ raises
+# "Another profiling tool is already active" otherwise)
+_cprofile_lock = threading.Lock()
+
+
+class ProfilerBusy(RuntimeError):
+    """A profile of the same kind is already running in this process."""
+
+
+def _frame_label(code) -> str:
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def sample_stacks(seconds: float, interval: float = 0.005,
+                  include_idle: bool = False) -> str:
+    """Sample all thread stacks for ``seconds``; return collapsed stacks."""
+    if not _sampler_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profile is already running")
+    # Without a short switch interval the sampler only gets the GIL back when a
+    # busy thread releases it for I/O, which biases every sample toward I/O.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval / 10))
+    try:
+        own = threading.get_ident()
+        counts: Counter = Counter()
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                leaf = frame.f_code
+                if not include_idle and (os.path.basename(leaf.co_filename),
+                                         leaf.co_name) in IDLE_LEAVES:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}").replace(" ", "_"))
+                counts[";".join(reversed(stack))] += 1
+            time.sleep(interval)
+    finally:
+        sys.setswitchinterval(switch_interval)
+        _sampler_lock.release()
+
+    return "".join(f"{stack} {n}\n" for stack, n in counts.most_common())
+
+
+def profile_call(fn: Callable, *args, limit: int = 30, **kwargs) -> tuple[Any, dict]:
+    """Run ``fn`` under cProfile; return (result, top functions by cumulative time)."""
+    if not _cprofile_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profiled call is already running")
+    try:
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        result = profiler.runcall(fn, *args, **kwargs)
+        total_ms = (time.perf_counter() - start) * 1000
+    finally:
+        _cprofile_lock.release()
+
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda kv: -kv[1][3])[:limit]
+    functions = [
+        {
+            "function": f"{os.path.basename(filename)}:{lineno}({name})",
+            "ncalls": ncalls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3),
+        }
+        for (filename, lineno, name), (_, ncalls, tottime, cumtime, _) in rows
+    ]
+    return result, {
+        "total_ms": round(total_ms, 3),
+        "total_calls": stats.total_calls,
+        "functions": functions,
+    }
@@ -0,0 +1,190 @@
+"""
+Production server: pre-fork multiple uvicorn workers over shared data.
+
+The parent process loads the DataStore and win model once, binds the listening
+socket, then forks N workers that inherit both copy-on-write. Each worker runs
+its own event loop (and optionally its own CPU pool, see api/cpu_pool.py), so
+throughput scales with cores.
+
+Signals to the parent:
+    SIGTERM / SIGINT  graceful shutdown of all workers
+    SIGHUP            reload processed data in the parent, then replace the
+                      workers one by one so they pick up the new snapshot
+
+Workers see the parent's pid in DRAFTMIND_PREFORK_PARENT; POST /admin/reload
+uses it to send that SIGHUP instead of reloading only the worker it hit.
+
+Usage:
+    cd backend
+    python -m draftmind.serve --host 0.0.0.0 --port 8000 --workers 4
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+
+import uvicorn
+
+from draftmind.config import VERSION, WEB_CONCURRENCY
+from draftmind.data.data_loader import data_store
+
+PREFORK_PARENT_ENV = "DRAFTMIND_PREFORK_PARENT"
+
+
+def prefork_parent() -> int | None:
+    """Pid of the PreforkServer supervising this process, or None outside one."""
+    pid = os.environ.get(PREFORK_PARENT_ENV, "")
+    # Processes forked from a worker (CPU pool) inherit the variable; only
+    # direct children of the supervisor count
+    if pid.isdigit() and int(pid) == os.getppid():
+        return int(pid)
+    return None
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+class PreforkServer:
+    """Minimal pre-fork supervisor around uvicorn.Server."""
+
+    def __init__(self, host: str, port: int, workers: int):
+        self.host = host
+        self.port = port
+        self.workers = max(1, workers)
+        self.sock: socket.socket | None = None
+        self.children: set[int] = set()
+        self.stopping = False
+        self.reload_requested = False
+
+    def _run_worker(self):
+        """Child process body: serve on the inherited socket until told to stop."""
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(sig, signal.SIG_DFL)
+        os.environ[PREFORK_PARENT_ENV] = str(os.getppid())
+        from draftmind.main import app
+        config = uvicorn.Config(app, host=self.host, port=self.port, lifespan="on")
+        server = uvicorn.Server(config)
+        server.run(sockets=[self.sock])
+
+    def _fork_worker(self):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                self._run_worker()
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            finally:
+                os._exit(code)
+        self.children.add(pid)
+
+    def _stop_workers(self, pids: set[int]):
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+            self.children.discard(pid)
+
+    def _on_stop(self, signum, frame):
+        self.stopping = True
+
+    def _on_reload(self, signum, frame):
+        self.reload_requested = True
+
+    def _rolling_reload(self):
+        """Reload data in the parent, then swap workers one at a time.
+
+        If the data fails to load, the error is logged and the current workers
+        keep serving the previous snapshot.
+        """
+        print(f"[serve] reloading data (generation {data_store.generation})...")
+        gc.unfreeze()
+        try:
+            data_store.load(warm=True)
+        except Exception:
+            traceback.print_exc()
+            print(f"[serve] reload failed; still serving generation {data_store.generation}")
+            return
+        finally:
+            gc.collect()
+            gc.freeze()
+        for pid in list(self.children):
+            self._fork_worker()
+            self._stop_workers({pid})
+        print(f"[serve] now serving generation {data_store.generation}")
+
+    def run(self):
+        from draftmind.main import load_runtime
+
+        print(f"DraftMind AI v{VERSION} pre-fork server, {self.workers} workers")
+        load_runtime()
+        # Parse the deferred files here so workers share them instead of each
+        # parsing its own copy on first use
+        data_store.snapshot.warm()
+        # Keep the loaded objects out of future GC passes so workers don't
+        # dirty (and un-share) the inherited pages just by collecting.
+        gc.collect()
+        gc.freeze()
+
+        self.sock = _bind(self.host, self.port)
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_reload)
+
+        for _ in range(self.workers):
+            self._fork_worker()
+
+        while not self.stopping:
+            if self.reload_requested:
+                self.reload_requested = False
+                self._rolling_reload()
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                pid = 0
+            if pid and pid in self.children:
+                self.children.discard(pid)
+                if not self.stopping:
+                    print(f"[serve] worker {pid} exited ({status}), restarting")
+                    self._fork_worker()
+            time.sleep(0.2)
+
+        print("[serve] shutting down workers...")
+        self._stop_workers(set(self.children))
+        self.sock.close()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="DraftMind AI pre-fork server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=WEB_CONCURRENCY)
+    args = parser.parse_args(argv)
+
+    if not hasattr(os, "fork"):
+        print("fork() unavailable on this platform; running a single uvicorn process")
+        uvicorn.run("draftmind.main:app", host=args.host, port=args.port)
+        return
+
+    PreforkServer(args.host, args.port, args.workers).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
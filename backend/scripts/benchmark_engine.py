@@ -0,0 +1,404 @@
+"""
+Benchmark the engine hot paths against the shipped processed data.
+
+Measures latency distributions (p50/p95/p99) and throughput for:
+    recommend() at each of the 20 draft sequence numbers,
+    simulate_draft, WinPredictor.predict, extract_features, win_curve
+    (vs one simulate_draft per pick), candidate win-delta features (vectorized
+    vs one extract_features per candidate), Monte Carlo completion (10k rollouts),
+    detect_patterns, get_champion_detail, DataStore.load, and response
+    serialization (FastAPI's jsonable_encoder + json vs orjson) and compression.
+
+Drafts come from two sources: synthetic random drafts, and real drafts
+replayed from draft_database.json (when it is present).
+
+Results are written as JSON and compared against a stored baseline; the
+exit code is 1 if any benchmark regressed beyond the tolerance. Timings only
+compare on the same machine, so no baseline is shipped: the first run (or
+--save-baseline) records one and says so instead of comparing.
+
+Usage:
+    cd backend
+    python -m scripts.benchmark_engine                   # run + compare
+    python -m scripts.benchmark_engine --save-baseline   # run + store baseline
+    python -m scripts.benchmark_engine --only recommend --drafts 10
+"""
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+from pathlib import Path
+from datetime import datetime, timezone
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+
+from draftmind.api.compression import brotli, compress
+from draftmind.api.serialization import dumps
+from draftmind.config import DATA_DIR, MODEL_DIR, PROCESSED_DIR
+from draftmind.core.draft_rules import DRAFT_SEQUENCE
+from draftmind.data.data_loader import DataStore, data_store
+from draftmind.engine.feature_extraction import extract_features
+from draftmind.engine.draft_simulator import simulate_completions
+from draftmind.engine.feature_tables import DraftFeatures, get_feature_tables
+from draftmind.engine.pattern_detector import detect_patterns
+from draftmind.engine.recommendation import recommend, simulate_draft, win_curve
+from draftmind.engine.statistics import get_champion_detail, get_champion_list, get_team_detail
+from draftmind.engine.win_predictor import win_predictor
+
+BENCH_DIR = DATA_DIR / "benchmarks"
+
+
+# ─── Timing ───────────────────────────────────────────────────
+
+def _percentile(sorted_vals: list[float], pct: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    k = min(len(sorted_vals) - 1, max(0, round(pct / 100 * (len(sorted_vals) - 1))))
+    return sorted_vals[k]
+
+
+def summarize(durations_ms: list[float]) -> dict:
+    """Latency distribution + throughput for a list of call durations."""
+    vals = sorted(durations_ms)
+    total = sum(vals)
+    mean = total / len(vals) if vals else 0.0
+    return {
+        "count": len(vals),
+        "mean_ms": round(mean, 4),
+        "p50_ms": round(_percentile(vals, 50), 4),
+        "p95_ms": round(_percentile(vals, 95), 4),
+        "p99_ms": round(_percentile(vals, 99), 4),
+        "max_ms": round(vals[-1], 4) if vals else 0.0,
+        "ops_per_sec": round(1000 / mean, 1) if mean else 0.0,
+    }
+
+
+def timed(fn, *args, **kwargs) -> float:
+    """Call fn once and return elapsed milliseconds."""
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000
+
+
+# ─── Draft sources ────────────────────────────────────────────
+
+def synthetic_drafts(n: int, rng: random.Random) -> list[dict]:
+    """Random legal 20-action drafts between random known teams."""
+    champions = sorted(data_store.champion_stats)
+    team_ids = sorted(data_store.team_profiles)
+    drafts = []
+    for _ in range(n):
+        pool = rng.sample(champions, len(DRAFT_SEQUENCE))
+        blue, red = rng.sample(team_ids, 2) if len(team_ids) >= 2 else (None, None)
+        actions = [
+            {"sequence_number": seq, "action_type": action, "team_side": side,
+             "champion_name": champ}
+            for (seq, action, side), champ in zip(DRAFT_SEQUENCE, pool)
+        ]
+        drafts.append({"actions": actions, "blue_team_id": blue, "red_team_id": red})
+    return drafts
+
+
+def replayed_drafts(n: int, rng: random.Random) -> list[dict]:
+    """Real drafts sampled from draft_database.json (empty if not shipped)."""
+    games = [g for s in data_store.draft_database.get("series", []) for g in s.get("games", [])]
+    games = [g for g in games if len(g.get("draft_actions", [])) == len(DRAFT_SEQUENCE)]
+    drafts = []
+    for game in rng.sample(games, min(n, len(games))):
+        actions = [
+            {"sequence_number": da["sequence_number"], "action_type": da["action_type"],
+             "team_side": da["team_side"], "champion_name": da["champion_name"]}
+            for da in sorted(game["draft_actions"], key=lambda x: x["sequence_number"])
+        ]
+        drafts.append({
+            "actions": actions,
+            "blue_team_id": game["blue_team"]["team_id"],
+            "red_team_id": game["red_team"]["team_id"],
+        })
+    return drafts
+
+
+def _picks(actions: list[dict], side: str) -> list[str]:
+    return [a["champion_name"] for a in actions
+            if a["action_type"] == "pick" and a["team_side"] == side]
+
+
+# ─── Benchmarks ───────────────────────────────────────────────
+
+def bench_load(iterations: int) -> dict:
+    store = DataStore()
+    return {"data_store.load": summarize([timed(store.load, PROCESSED_DIR)
+                                          for _ in range(iterations)])}
+
+
+def bench_recommend(label: str, drafts: list[dict]) -> dict:
+    per_seq = {seq: [] for seq, _, _ in DRAFT_SEQUENCE}
+    for d in drafts:
+        for seq, _, _ in DRAFT_SEQUENCE:
+            per_seq[seq].append(timed(
+                recommend, d["actions"][:seq - 1],
+                d["blue_team_id"], d["red_team_id"], seq))
+    results = {f"recommend[{label}].seq{seq:02d}": summarize(v) for seq, v in per_seq.items()}
+    results[f"recommend[{label}].all"] = summarize([x for v in per_seq.values() for x in v])
+    return results
+
+
+def bench_full_draft(label: str, drafts: list[dict], repeat: int) -> dict:
+    sim, feats, pred = [], [], []
+    for d in drafts:
+        blue, red = _picks(d["actions"], "blue"), _picks(d["actions"], "red")
+        args = (blue, red, d["blue_team_id"], d["red_team_id"])
+        for _ in range(repeat):
+            sim.append(timed(simulate_draft, *args))
+            feats.append(timed(extract_features, *args, data_store.champion_stats,
+                               data_store.champion_pairs, data_store.team_profiles))
+            if win_predictor.ready:
+                pred.append(timed(win_predictor.predict, *args))
+    results = {
+        f"simulate_draft[{label}]": summarize(sim),
+        f"extract_features[{label}]": summarize(feats),
+    }
+    if pred:
+        results[f"win_predictor.predict[{label}]"] = summarize(pred)
+    return results
+
+
+def bench_win_curve(label: str, drafts: list[dict], repeat: int) -> dict:
+    curve, per_pick = [], []
+    for d in drafts:
+        for _ in range(repeat):
+            curve.append(timed(win_curve, d["actions"], d["blue_team_id"], d["red_team_id"]))
+            start = time.perf_counter()
+            blue, red = [], []
+            for a in d["actions"]:
+                if a["action_type"] == "pick":
+                    (blue if a["team_side"] == "blue" else red).append(a["champion_name"])
+                    simulate_draft(blue, red, d["blue_team_id"], d["red_team_id"])
+            per_pick.append((time.perf_counter() - start) * 1000)
+    return {
+        f"win_curve[{label}]": summarize(curve),
+        f"simulate_per_pick[{label}]": summarize(per_pick),
+    }
+
+
+def bench_win_delta(label: str, drafts: list[dict]) -> dict:
+    """Post-pick feature rows for every candidate at each pick step."""
+    tables = get_feature_tables()
+    vectorized, naive, with_model = [], [], []
+    for d in drafts:
+        for seq, action, side in DRAFT_SEQUENCE:
+            if action != "pick":
+                continue
+            done = d["actions"][:seq - 1]
+            blue, red = _picks(done, "blue"), _picks(done, "red")
+            used = {a["champion_name"] for a in done}
+            candidates = [c for c in data_store.champion_stats if c not in used]
+
+            def expand():
+                state = DraftFeatures(tables, d["blue_team_id"], d["red_team_id"])
+                for c in blue:
+                    state.add("blue", c)
+                for c in red:
+                    state.add("red", c)
+                state.expand(side, [tables.index[c] for c in candidates])
+
+            def one_by_one():
+                for c in candidates:
+                    b, r = (blue + [c], red) if side == "blue" else (blue, red + [c])
+                    extract_features(b, r, d["blue_team_id"], d["red_team_id"],
+                                     data_store.champion_stats, data_store.champion_pairs,
+                                     data_store.team_profiles)
+
+            vectorized.append(timed(expand))
+            naive.append(timed(one_by_one))
+            if win_predictor.ready:
+                with_model.append(timed(recommend, done, d["blue_team_id"], d["red_team_id"],
+                                        seq, include_win_delta=True))
+    results = {
+        f"win_delta_features[{label}].vectorized": summarize(vectorized),
+        f"win_delta_features[{label}].per_candidate": summarize(naive),
+    }
+    if with_model:
+        results[f"recommend_win_delta[{label}]"] = summarize(with_model)
+    return results
+
+
+def bench_monte_carlo(label: str, drafts: list[dict], rollouts: int = 10_000) -> dict:
+    """Completion sampling + scoring from the start, after bans, and mid-draft."""
+    results = {}
+    for done in (0, 6, 12):
+        results[f"monte_carlo[{label}].from{done:02d}"] = summarize([
+            timed(simulate_completions, d["actions"][:done], d["blue_team_id"],
+                  d["red_team_id"], "blue", rollouts, seed)
+            for seed, d in enumerate(drafts[:5])
+        ])
+    return results
+
+
+def bench_lookups(repeat: int) -> dict:
+    teams = sorted(data_store.team_profiles)
+    champions = sorted(data_store.champion_stats)
+    return {
+        "detect_patterns": summarize([timed(detect_patterns, t)
+                                      for _ in range(repeat) for t in teams]),
+        "get_champion_detail": summarize([timed(get_champion_detail, c)
+                                          for _ in range(repeat) for c in champions]),
+    }
+
+
+def _stdlib_json(payload) -> bytes:
+    """FastAPI's default JSONResponse path."""
+    return json.dumps(jsonable_encoder(payload), ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def bench_serialize(drafts: list[dict], repeat: int) -> dict:
+    """Encode (and compress) the largest response payloads, old path vs new."""
+    payloads = {
+        "champions_200": [get_champion_list(limit=200)],
+        "team_detail": [get_team_detail(t) for t in sorted(data_store.team_profiles)],
+        "recommend": [recommend(d["actions"][:seq - 1], d["blue_team_id"], d["red_team_id"], seq)
+                      for d in drafts[:5] for seq in (1, 7, 13)],
+    }
+    results = {}
+    for name, items in payloads.items():
+        results[f"serialize[{name}].stdlib"] = summarize(
+            [timed(_stdlib_json, p) for _ in range(repeat) for p in items])
+        results[f"serialize[{name}].orjson"] = summarize(
+            [timed(dumps, p) for _ in range(repeat) for p in items])
+        bodies = [dumps(p) for p in items]
+        results[f"compress[{name}].gzip"] = summarize(
+            [timed(compress, b, "gzip") for _ in range(repeat) for b in bodies])
+        if brotli is not None:
+            results[f"compress[{name}].br"] = summarize(
+                [timed(compress, b, "br") for _ in range(repeat) for b in bodies])
+    return results
+
+
+# ─── Baseline comparison ──────────────────────────────────────
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a line per regressed benchmark (p50 slower than baseline by > tolerance)."""
+    regressions = []
+    print(f"\n--- Comparison vs baseline ({baseline['meta'].get('timestamp', '?')}) ---")
+    for name, stats in sorted(current["results"].items()):
+        base = baseline["results"].get(name)
+        if not base or not base["p50_ms"]:
+            continue
+        ratio = stats["p50_ms"] / base["p50_ms"]
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  REGRESSION"
+            regressions.append(f"{name}: p50 {base['p50_ms']:.3f} -> {stats['p50_ms']:.3f} ms")
+        elif ratio < 1 - tolerance:
+            flag = "  faster"
+        print(f"  {name:45s} {base['p50_ms']:9.3f} -> {stats['p50_ms']:9.3f} ms  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark DraftMind engine hot paths")
+    parser.add_argument("--drafts", type=int, default=25, help="drafts per source")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions for per-call benchmarks")
+    parser.add_argument("--load-iterations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", default="", help="run only benchmarks whose group contains this")
+    parser.add_argument("--output", type=Path, default=BENCH_DIR / "latest.json")
+    parser.add_argument("--baseline", type=Path, default=BENCH_DIR / "baseline.json")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed p50 slowdown before flagging a regression")
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("ENGINE BENCHMARKS")
+    print("=" * 60)
+
+    data_store.load()
+    if not data_store.loaded:
+        print("ERROR: No processed data found. Run the pipeline scripts first.")
+        return 1
+    model_path = MODEL_DIR / "win_model.json"
+    if model_path.exists():
+        win_predictor.load(model_path)
+    else:
+        print("  ML model not found — skipping WinPredictor.predict")
+
+    rng = random.Random(args.seed)
+    sources = {
+        "synthetic": synthetic_drafts(args.drafts, rng),
+        "replay": replayed_drafts(args.drafts, rng),
+    }
+    if not sources["replay"]:
+        print("  draft_database.json not found — skipping replayed drafts")
+        del sources["replay"]
+
+    groups = {
+        "load": lambda: bench_load(args.load_iterations),
+        "lookups": lambda: bench_lookups(args.repeat),
+        "serialize": lambda: bench_serialize(sources["synthetic"], args.repeat),
+    }
+    for label, drafts in sources.items():
+        groups[f"recommend[{label}]"] = lambda l=label, d=drafts: bench_recommend(l, d)
+        groups[f"full_draft[{label}]"] = lambda l=label, d=drafts: bench_full_draft(l, d, args.repeat)
+        groups[f"win_curve[{label}]"] = lambda l=label, d=drafts: bench_win_curve(l, d, args.repeat)
+        groups[f"win_delta[{label}]"] = lambda l=label, d=drafts: bench_win_delta(l, d)
+        groups[f"monte_carlo[{label}]"] = lambda l=label, d=drafts: bench_monte_carlo(l, d)
+
+    results = {}
+    for group, run in groups.items():
+        if args.only and args.only not in group:
+            continue
+        print(f"\nRunning {group}...")
+        group_results = run()
+        for name, stats in group_results.items():
+            print(f"  {name:45s} p50 {stats['p50_ms']:9.3f} ms | p99 {stats['p99_ms']:9.3f} ms "
+                  f"| {stats['ops_per_sec']:10.1f} ops/s")
+        results.update(group_results)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "champions": data_store.total_champions,
+            "teams": len(data_store.team_profiles),
+            "games": data_store.total_games,
+            "model_loaded": win_predictor.ready,
+            "args": {k: str(v) for k, v in vars(args).items()},
+        },
+        "results": results,
+    }
+
+    new_baseline = not args.baseline.exists()
+    out_path = args.baseline if args.save_baseline or new_baseline else args.output
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to: {out_path}")
+
+    if args.save_baseline:
+        return 0
+    if new_baseline:
+        print(f"\nNo baseline found; recorded this run as the baseline ({args.baseline}).")
+        print("Nothing was compared. Run again to check for regressions against it.")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -207,6 +207,13 @@ def main():
     raw_files = [f for f in raw_files if f.name != "series_ids.json"]
     print(f"Found {len(raw_files)} raw series files")
 
+    # Series -> tournament from ingestion (older raw dirs lack it)
+    tournaments_path = RAW_DIR / "tournaments.json"
+    tournaments = {}
+    if tournaments_path.exists():
+        with open(tournaments_path, "r", encoding="utf-8") as f:
+            tournaments = json.load(f)
+
     all_series = []
     total_games = 0
     failed = 0
@@ -219,6 +226,7 @@ def main():
             series_id = fp.stem.replace("series_", "")
             result = parse_series(series_id, raw)
             if result:
+                result["tournament"] = tournaments.get(series_id, {})
                 all_series.append(result)
                 total_games += result["total_games"]
                 for game in result["games"]:
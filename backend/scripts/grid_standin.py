@@ -0,0 +1,458 @@
+"""
+Local stand-in for the GRID APIs the ingestion stack talks to.
+
+Serves recorded end-state files (the data/raw/ layout ingest_all_series.py
+writes: series_<id>.json plus tournaments.json), or deterministic synthetic
+series, under GRID's own paths:
+
+    POST /central-data/graphql                   allSeries (paged) and series(id: ...)
+    POST /live-data-feed/series-state/graphql    seriesState(id: ...)
+    GET  /file-download/end-state/grid/series/<id>
+    GET  /_standin/stats                         responses per route and status
+
+GraphQL support is just what the ingestion queries need: the operation and
+its id / first / after arguments are read from the query text and whole
+nodes are returned, whatever fields were selected.
+
+Faults for benchmarking clients:
+    --latency-ms / --jitter-ms     added to every response
+    --rate-limit N/SECONDS         429 + Retry-After past N GraphQL requests per window
+    --download-rate-limit N/SEC    the same for file downloads
+    --failure-rate P               fail with --failure-status (default 503)
+
+Latency jitter and failures are drawn per (resource, attempt number) from
+--seed, so a client that retries sees the same failures whatever its
+concurrency. Rate limits depend on timing, as GRID's do.
+
+Usage:
+    cd backend
+    python -m scripts.grid_standin --fixtures data/raw --latency-ms 80 --rate-limit 20/60
+    python -m scripts.grid_standin --synthetic 300 --failure-rate 0.05
+    GRID_BASE_URL=http://127.0.0.1:8765 GRID_PAGE_DELAY_SECONDS=0 GRID_DOWNLOAD_DELAY_SECONDS=0 \\
+        python -m scripts.ingest_all_series --out /tmp/raw --workers 8 --retries 5
+"""
+import re
+import sys
+import json
+import math
+import time
+import base64
+import random
+import argparse
+import threading
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from draftmind.config import LOL_TITLE_ID, RAW_DIR
+from draftmind.core.champion_catalog import CATALOG
+from draftmind.core.draft_rules import DRAFT_SEQUENCE
+
+CENTRAL_DATA_PATH = "/central-data/graphql"
+SERIES_STATE_PATH = "/live-data-feed/series-state/graphql"
+END_STATE_PREFIX = "/file-download/end-state/grid/series/"
+STATS_PATH = "/_standin/stats"
+
+# GRID rejects larger pages
+MAX_PAGE_SIZE = 50
+
+_ALL_SERIES = re.compile(r"\ballSeries\s*\(([^)]*)\)")
+_BY_ID = re.compile(r'\b(seriesState|series)\s*\(\s*id\s*:\s*"([^"]*)"')
+_FIRST = re.compile(r"\bfirst\s*:\s*(\d+)")
+_AFTER = re.compile(r'\bafter\s*:\s*"([^"]*)"')
+
+
+# ─── Fixtures ─────────────────────────────────────────────────
+
+def _node(series_id: str, series_state: dict, tournament: dict | None) -> dict:
+    """Central Data series node for an end-state's seriesState."""
+    return {
+        "id": series_id,
+        "title": {"id": LOL_TITLE_ID},
+        "startTimeScheduled": series_state.get("startedAt", ""),
+        "tournament": tournament,
+        "teams": [{"baseInfo": {"id": str(t.get("id", "")), "name": t.get("name", ""),
+                                "nameShortened": t.get("name", ""), "logoUrl": ""}}
+                  for t in series_state.get("teams", [])],
+    }
+
+
+class Fixtures:
+    """Series nodes (newest first) and their end-state bodies."""
+
+    def __init__(self, nodes: list[dict], bodies: dict[str, bytes | Path]):
+        self.nodes = sorted(nodes, key=lambda n: n["startTimeScheduled"], reverse=True)
+        self.by_id = {n["id"]: n for n in self.nodes}
+        self._bodies = bodies
+
+    @classmethod
+    def from_dir(cls, directory: Path) -> "Fixtures":
+        tournaments = {}
+        if (directory / "tournaments.json").exists():
+            tournaments = json.loads((directory / "tournaments.json").read_text(encoding="utf-8"))
+        nodes, bodies = [], {}
+        for fp in sorted(directory.glob("series_*.json")):
+            if fp.name == "series_ids.json":
+                continue
+            series_id = fp.stem.replace("series_", "")
+            raw = json.loads(fp.read_text(encoding="utf-8"))
+            nodes.append(_node(series_id, raw.get("seriesState", {}), tournaments.get(series_id)))
+            bodies[series_id] = fp  # served from disk, read per request
+        return cls(nodes, bodies)
+
+    @classmethod
+    def synthetic(cls, n_series: int, seed: int) -> "Fixtures":
+        rng = random.Random(seed)
+        nodes, bodies = [], {}
+        for raw in synthetic_end_states(n_series, rng):
+            ss = raw["seriesState"]
+            nodes.append(_node(ss["id"], ss, raw.pop("tournament")))
+            bodies[ss["id"]] = json.dumps(raw).encode()
+        return cls(nodes, bodies)
+
+    def end_state(self, series_id: str) -> bytes | None:
+        body = self._bodies.get(series_id)
+        if isinstance(body, Path):
+            return body.read_bytes()
+        return body
+
+    def series_state(self, series_id: str) -> dict | None:
+        body = self.end_state(series_id)
+        return json.loads(body).get("seriesState") if body is not None else None
+
+
+def synthetic_end_states(n_series: int, rng: random.Random) -> list[dict]:
+    """Finished best-of series between 16 fixed teams, in GRID's end-state shape."""
+    champions = sorted(e.name for e in CATALOG)
+    teams = [{"id": str(9000 + t), "name": f"Team {t:02d}",
+              "players": [{"id": str(90000 + t * 10 + p), "name": f"T{t:02d}P{p}"} for p in range(5)]}
+             for t in range(16)]
+    tournaments = [{"id": str(800 + i), "name": f"Split {i + 1}"} for i in range(3)]
+    start = datetime(2024, 7, 1, tzinfo=timezone.utc)
+    out = []
+    for i in range(n_series):
+        started = start - timedelta(hours=12 * i)
+        blue, red = rng.sample(teams, 2)
+        wins = {blue["id"]: 0, red["id"]: 0}
+        games = []
+        while max(wins.values()) < 2:
+            game_start = started + timedelta(hours=len(games))
+            winner = rng.choice((blue, red))["id"]
+            wins[winner] += 1
+            # A new patch every two weeks, counting back from 14.13
+            patch = f"14.{max(1, 13 - (start - started).days // 14)}"
+            games.append(_synthetic_game(rng, champions, blue, red, winner, game_start, patch))
+        out.append({
+            "tournament": tournaments[i * len(tournaments) // max(n_series, 1)],
+            "seriesState": {
+                "id": str(2_000_000 + i),
+                "format": "best-of-3",
+                "finished": True,
+                "startedAt": started.isoformat().replace("+00:00", "Z"),
+                "teams": [{"id": t["id"], "name": t["name"], "score": wins[t["id"]],
+                           "won": wins[t["id"]] == 2} for t in (blue, red)],
+                "games": games,
+            },
+        })
+    return out
+
+
+def _synthetic_game(rng: random.Random, champions: list[str], blue: dict, red: dict,
+                    winner: str, started: datetime, patch: str) -> dict:
+    pool = rng.sample(champions, len(DRAFT_SEQUENCE))
+    side_team = {"blue": blue, "red": red}
+    actions, picked = [], {"blue": [], "red": []}
+    for (seq, action, side), champ in zip(DRAFT_SEQUENCE, pool):
+        actions.append({"sequenceNumber": str(seq), "type": action,
+                        "drafter": {"id": side_team[side]["id"]},
+                        "draftable": {"id": champ, "name": champ}})
+        if action == "pick":
+            picked[side].append(champ)
+    minutes = rng.uniform(24, 40)
+    return {
+        "finished": True,
+        "startedAt": started.isoformat().replace("+00:00", "Z"),
+        "duration": f"PT{int(minutes)}M{minutes % 1 * 60:.3f}S",
+        "titleVersion": {"name": patch},
+        "draftActions": actions,
+        "teams": [{
+            "id": team["id"], "name": team["name"], "side": side, "won": team["id"] == winner,
+            "kills": rng.randint(5, 30), "deaths": rng.randint(5, 30),
+            "players": [{
+                "id": p["id"], "name": p["name"],
+                "character": {"id": champ, "name": champ},
+                "kills": rng.randint(0, 10), "deaths": rng.randint(0, 8),
+                "killAssistsReceived": rng.randint(0, 15),
+                "damageDealt": rng.randint(5000, 40000),
+                "totalMoneyEarned": rng.randint(7000, 18000),
+                "visionScore": rng.randint(10, 90),
+                "unitKills": [{"unitName": "minion", "count": rng.randint(20, 320)}],
+            } for p, champ in zip(team["players"], picked[side])],
+        } for side, team in side_team.items()],
+    }
+
+
+# ─── Faults ───────────────────────────────────────────────────
+
+class RateLimit:
+    """At most ``limit`` requests per sliding ``window`` seconds."""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self._times: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def parse(cls, spec: str) -> "RateLimit | None":
+        if not spec:
+            return None
+        limit, _, window = spec.partition("/")
+        return cls(int(limit), float(window or 60))
+
+    def acquire(self) -> float:
+        """0 if the request is allowed, else seconds until it would be."""
+        now = time.monotonic()
+        with self._lock:
+            while self._times and now - self._times[0] >= self.window:
+                self._times.popleft()
+            if len(self._times) < self.limit:
+                self._times.append(now)
+                return 0.0
+            return self.window - (now - self._times[0])
+
+
+class Faults:
+    """Latency, failures and rate limits; random draws keyed by resource and attempt."""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 failure_rate: float = 0.0, failure_status: int = 503, seed: int = 0,
+                 rate_limits: dict[str, RateLimit | None] | None = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.seed = seed
+        self.rate_limits = rate_limits or {}
+        self._attempts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _draw(self, resource: str) -> random.Random:
+        with self._lock:
+            self._attempts[resource] += 1
+            attempt = self._attempts[resource]
+        return random.Random(f"{self.seed}:{resource}:{attempt}")
+
+    def apply(self, api: str, resource: str) -> tuple[int, dict] | None:
+        """Sleep the configured latency, then (status, headers) to fail with, or None."""
+        rng = self._draw(resource)
+        delay = self.latency_ms + rng.uniform(0, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        limit = self.rate_limits.get(api)
+        if limit is not None:
+            retry_after = limit.acquire()
+            if retry_after:
+                return 429, {"Retry-After": str(math.ceil(retry_after))}
+        if rng.random() < self.failure_rate:
+            return self.failure_status, {}
+        return None
+
+
+# ─── Server ───────────────────────────────────────────────────
+
+def _cursor(offset: int) -> str:
+    return base64.b64encode(f"offset:{offset}".encode()).decode()
+
+
+def _offset(cursor: str) -> int:
+    try:
+        return int(base64.b64decode(cursor).decode().split(":", 1)[1])
+    except (ValueError, IndexError):
+        raise ValueError(f"invalid cursor {cursor!r}")
+
+
+def _errors(message: str) -> dict:
+    return {"data": None, "errors": [{"message": message}]}
+
+
+class StandIn:
+    """Request handling shared by every server thread."""
+
+    def __init__(self, fixtures: Fixtures, faults: Faults, api_key: str = ""):
+        self.fixtures = fixtures
+        self.faults = faults
+        self.api_key = api_key
+        self.responses: Counter = Counter()  # (route, status) -> n
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def record(self, route: str, status: int):
+        with self._lock:
+            self.responses[(route, status)] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            routes: dict[str, dict] = {}
+            for (route, status), n in sorted(self.responses.items()):
+                routes.setdefault(route, {})[str(status)] = n
+        return {"uptime_s": round(time.time() - self.started, 1),
+                "series": len(self.fixtures.nodes), "responses": routes}
+
+    def central_data(self, query: str) -> dict:
+        if m := _ALL_SERIES.search(query):
+            args = m.group(1)
+            first = int(_FIRST.search(args).group(1)) if _FIRST.search(args) else MAX_PAGE_SIZE
+            if first > MAX_PAGE_SIZE:
+                return _errors(f"first must not exceed {MAX_PAGE_SIZE}")
+            after = _AFTER.search(args)
+            try:
+                start = _offset(after.group(1)) + 1 if after else 0
+            except ValueError as e:
+                return _errors(str(e))
+            nodes = self.fixtures.nodes
+            page = nodes[start:start + first]
+            end = start + len(page) - 1
+            return {"data": {"allSeries": {
+                "totalCount": len(nodes),
+                "pageInfo": {"hasNextPage": end + 1 < len(nodes),
+                             "endCursor": _cursor(end) if page else None},
+                "edges": [{"cursor": _cursor(start + i), "node": node}
+                          for i, node in enumerate(page)],
+            }}}
+        m = _BY_ID.search(query)
+        if m and m.group(1) == "series":
+            return {"data": {"series": self.fixtures.by_id.get(m.group(2))}}
+        return _errors("stand-in supports allSeries and series(id) on Central Data")
+
+    def series_state(self, query: str) -> dict:
+        m = _BY_ID.search(query)
+        if m and m.group(1) == "seriesState":
+            return {"data": {"seriesState": self.fixtures.series_state(m.group(2))}}
+        return _errors("stand-in supports seriesState(id) on Series State")
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "GridStandIn/1.0"
+    protocol_version = "HTTP/1.1"
+    standin: StandIn
+    verbose = False
+
+    def _send(self, route: str, status: int, body: bytes, headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+        self.standin.record(route, status)
+
+    def _send_json(self, route: str, status: int, payload, headers: dict | None = None):
+        self._send(route, status, json.dumps(payload).encode(), headers)
+
+    def _guard(self, route: str, api: str, resource: str) -> bool:
+        """Auth and injected faults; True if a response was already sent."""
+        if self.standin.api_key and self.headers.get("x-api-key") != self.standin.api_key:
+            self._send_json(route, 401, {"message": "invalid api key"})
+            return True
+        fault = self.standin.faults.apply(api, resource)
+        if fault is not None:
+            status, headers = fault
+            self._send_json(route, status, {"message": f"stand-in injected {status}"}, headers)
+            return True
+        return False
+
+    def do_GET(self):
+        if self.path == STATS_PATH:
+            return self._send_json("stats", 200, self.standin.stats())
+        if self.path.startswith(END_STATE_PREFIX):
+            series_id = self.path[len(END_STATE_PREFIX):].strip("/")
+            if self._guard("end-state", "file-download", f"end-state:{series_id}"):
+                return
+            body = self.standin.fixtures.end_state(series_id)
+            if body is None:
+                return self._send_json("end-state", 404, {"message": "series not found"})
+            return self._send("end-state", 200, body)
+        self._send_json("unknown", 404, {"message": "not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            query = json.loads(self.rfile.read(length) or b"{}").get("query", "")
+        except ValueError:
+            return self._send_json("unknown", 400, _errors("request body is not JSON"))
+
+        if self.path == CENTRAL_DATA_PATH:
+            route, handle = "central-data", self.standin.central_data
+        elif self.path == SERIES_STATE_PATH:
+            route, handle = "series-state", self.standin.series_state
+        else:
+            return self._send_json("unknown", 404, {"message": "not found"})
+        # Resource key: the query minus whitespace, so each page or id retries independently
+        if self._guard(route, "graphql", f"{route}:{''.join(query.split())}"):
+            return
+        self._send_json(route, 200, handle(query))
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def serve(standin: StandIn, host: str, port: int, verbose: bool = False) -> ThreadingHTTPServer:
+    handler = type("BoundHandler", (Handler,), {"standin": standin, "verbose": verbose})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local GRID API stand-in for ingestion benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", type=Path, default=RAW_DIR,
+                        help="Directory of recorded series_<id>.json end-state files")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Serve this many generated series instead of --fixtures")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit", default="", help="GraphQL limit as N/SECONDS, e.g. 20/60")
+    parser.add_argument("--download-rate-limit", default="", help="File download limit as N/SECONDS")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-status", type=int, default=503)
+    parser.add_argument("--api-key", default="", help="Require this x-api-key (default: accept any)")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.synthetic:
+        fixtures = Fixtures.synthetic(args.synthetic, args.seed)
+    else:
+        fixtures = Fixtures.from_dir(args.fixtures)
+        if not fixtures.nodes:
+            sys.exit(f"ERROR: no series_*.json fixtures in {args.fixtures} (try --synthetic 200)")
+    faults = Faults(args.latency_ms, args.jitter_ms, args.failure_rate, args.failure_status,
+                    args.seed, {"graphql": RateLimit.parse(args.rate_limit),
+                                "file-download": RateLimit.parse(args.download_rate_limit)})
+    standin = StandIn(fixtures, faults, args.api_key)
+    server = serve(standin, args.host, args.port, args.verbose)
+
+    base = f"http://{args.host}:{server.server_address[1]}"
+    print(f"GRID stand-in: {len(fixtures.nodes)} series loaded in {time.perf_counter() - start:.2f}s")
+    print(f"  GRID_BASE_URL={base}")
+    print(f"  stats: {base}{STATS_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(standin.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,19 @@
 Ingest all LoL series end-state data from GRID API.
 Downloads end-state JSON for each series into data/raw/.
 Run this first — it takes ~30 minutes.
+
+The endpoints come from config (GRID_BASE_URL etc.), so the same run can
+target the local stand-in (scripts/grid_standin.py) to benchmark
+--workers / --retries / --backoff without touching GRID:
+
+    GRID_BASE_URL=http://127.0.0.1:8765 GRID_PAGE_DELAY_SECONDS=0 GRID_DOWNLOAD_DELAY_SECONDS=0 \
+        python -m scripts.ingest_all_series --out /tmp/raw --workers 8 --retries 5
 """
 import sys
-import os
 import json
 import time
+import argparse
+import threading
 import requests
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -14,14 +22,60 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from draftmind.config import (
-    CENTRAL_DATA_URL, FILE_DOWNLOAD_URL, GRID_HEADERS, LOL_TITLE_ID, RAW_DIR
+    CENTRAL_DATA_URL, FILE_DOWNLOAD_URL, GRID_DOWNLOAD_DELAY_SECONDS, GRID_HEADERS,
+    GRID_PAGE_DELAY_SECONDS, LOL_TITLE_ID, RAW_DIR,
 )
 
-RAW_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def get_all_series_ids() -> list[str]:
-    """Fetch all LoL series IDs with pagination."""
+# Responses worth retrying: rate limited, or a transient server error
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_BACKOFF_SECONDS = 60.0
+
+
+class RetryPolicy:
+    """Retries with exponential backoff, honouring Retry-After; counts what happened."""
+
+    def __init__(self, retries: int = 0, backoff: float = 1.0):
+        self.retries = retries
+        self.backoff = backoff
+        self.counts = {"requests": 0, "retries": 0, "rate_limited": 0, "errors": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, key: str):
+        with self._lock:
+            self.counts[key] += 1
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response | None:
+        """The final response (possibly non-200), or None after a network error."""
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._count("retries")
+            self._count("requests")
+            try:
+                resp = requests.request(method, url, **kwargs)
+            except requests.RequestException:
+                self._count("errors")
+                resp = None
+            else:
+                if resp.status_code == 429:
+                    self._count("rate_limited")
+                if resp.status_code not in RETRY_STATUSES:
+                    return resp
+            if attempt == self.retries:
+                return resp
+            delay = min(self.backoff * 2 ** attempt, MAX_BACKOFF_SECONDS)
+            if resp is not None and resp.headers.get("Retry-After", "").isdigit():
+                delay = max(delay, float(resp.headers["Retry-After"]))
+            time.sleep(delay)
+        return None
+
+
+def get_all_series_ids(tournaments: dict | None = None,
+                       policy: RetryPolicy | None = None) -> list[str]:
+    """Fetch all LoL series IDs with pagination.
+
+    If ``tournaments`` is given, it is filled with series_id -> {id, name}.
+    """
+    policy = policy or RetryPolicy()
     all_ids = []
     cursor = None
     page = 0
@@ -35,13 +89,16 @@ def get_all_series_ids() -> list[str]:
             totalCount
             pageInfo {{ hasNextPage endCursor }}
             edges {{
-              node {{ id }}
+              node {{ id tournament {{ id name }} }}
             }}
           }}
         }}
         """
-        resp = requests.post(CENTRAL_DATA_URL, headers=GRID_HEADERS,
-                             json={"query": query}, timeout=30)
+        resp = policy.request("POST", CENTRAL_DATA_URL, headers=GRID_HEADERS,
+                              json={"query": query}, timeout=30)
+        if resp is None:
+            print(f"  ERROR page {page}: network error")
+            break
         if resp.status_code != 200:
             print(f"  ERROR page {page}: HTTP {resp.status_code}")
             break
@@ -51,26 +108,30 @@ def get_all_series_ids() -> list[str]:
             break
         series_data = data["data"]["allSeries"]
         for edge in series_data.get("edges", []):
-            all_ids.append(edge["node"]["id"])
+            node = edge["node"]
+            all_ids.append(node["id"])
+            if tournaments is not None and node.get("tournament"):
+                tournaments[node["id"]] = node["tournament"]
         total = series_data.get("totalCount", 0)
         has_next = series_data.get("pageInfo", {}).get("hasNextPage", False)
         print(f"  Page {page}: {len(all_ids)}/{total} series IDs collected")
         if not has_next:
             break
         cursor = series_data["pageInfo"]["endCursor"]
-        time.sleep(3)  # 20 req/min rate limit
+        time.sleep(GRID_PAGE_DELAY_SECONDS)  # 20 req/min rate limit
     return all_ids
 
 
-def download_end_state(series_id: str) -> bool:
+def download_end_state(series_id: str, out_dir: Path = RAW_DIR,
+                       policy: RetryPolicy | None = None) -> bool:
     """Download end-state JSON for a single series."""
-    out_path = RAW_DIR / f"series_{series_id}.json"
+    out_path = out_dir / f"series_{series_id}.json"
     if out_path.exists():
         return True  # Already downloaded
     url = f"{FILE_DOWNLOAD_URL}/end-state/grid/series/{series_id}"
     try:
-        resp = requests.get(url, headers=GRID_HEADERS, timeout=60)
-        if resp.status_code == 200:
+        resp = (policy or RetryPolicy()).request("GET", url, headers=GRID_HEADERS, timeout=60)
+        if resp is not None and resp.status_code == 200:
             data = resp.json()
             with open(out_path, "w", encoding="utf-8") as f:
                 json.dump(data, f)
@@ -81,26 +142,52 @@ def download_end_state(series_id: str) -> bool:
         return False
 
 
+def _paced_download(series_id: str, out_dir: Path, policy: RetryPolicy) -> bool:
+    ok = download_end_state(series_id, out_dir, policy)
+    # Rate limit: ~1 per second per worker
+    time.sleep(GRID_DOWNLOAD_DELAY_SECONDS)
+    return ok
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Download all LoL series end-states from GRID")
+    parser.add_argument("--out", type=Path, default=RAW_DIR, help="Directory for raw end-state files")
+    parser.add_argument("--workers", type=int, default=1, help="Concurrent downloads")
+    parser.add_argument("--retries", type=int, default=0,
+                        help="Retries per request on 429/5xx/network errors")
+    parser.add_argument("--backoff", type=float, default=1.0,
+                        help="First retry delay in seconds, doubled per attempt (Retry-After wins if longer)")
+    args = parser.parse_args()
+    out_dir = args.out
+    out_dir.mkdir(parents=True, exist_ok=True)
+    policy = RetryPolicy(args.retries, args.backoff)
+    started = time.perf_counter()
+
     print("=" * 60)
     print("GRID Data Ingestion — Downloading all LoL series")
     print("=" * 60)
 
     # Step 1: Get all series IDs
     print("\nStep 1: Fetching series IDs from Central Data API...")
-    series_ids = get_all_series_ids()
+    tournaments = {}
+    series_ids = get_all_series_ids(tournaments, policy)
     print(f"  Total series IDs: {len(series_ids)}")
 
     # Save series IDs for reference
-    ids_path = RAW_DIR / "series_ids.json"
+    ids_path = out_dir / "series_ids.json"
     with open(ids_path, "w") as f:
         json.dump(series_ids, f)
 
+    # Series -> tournament, attached to each series by build_draft_database
+    # (not named series_*.json, so it is never mistaken for a series file)
+    with open(out_dir / "tournaments.json", "w") as f:
+        json.dump(tournaments, f)
+
     # Step 2: Download end-state for each series
     print(f"\nStep 2: Downloading end-state data for {len(series_ids)} series...")
 
     # Check which are already downloaded
-    existing = {p.stem.replace("series_", "") for p in RAW_DIR.glob("series_*.json")
+    existing = {p.stem.replace("series_", "") for p in out_dir.glob("series_*.json")
                 if p.stem != "series_ids"}
     remaining = [sid for sid in series_ids if sid not in existing]
     print(f"  Already downloaded: {len(existing)}")
@@ -110,22 +197,26 @@ def main():
     failed = 0
     total = len(series_ids)
 
-    for i, sid in enumerate(remaining):
-        ok = download_end_state(sid)
-        if ok:
-            success += 1
-        else:
-            failed += 1
-        if (i + 1) % 10 == 0 or i == len(remaining) - 1:
-            print(f"  Progress: {success}/{total} downloaded, {failed} failed ({i+1}/{len(remaining)} this run)")
-        # Rate limit: ~1 per second
-        time.sleep(1)
-
+    with ThreadPoolExecutor(max_workers=max(args.workers, 1)) as pool:
+        futures = [pool.submit(_paced_download, sid, out_dir, policy) for sid in remaining]
+        for i, future in enumerate(as_completed(futures)):
+            if future.result():
+                success += 1
+            else:
+                failed += 1
+            if (i + 1) % 10 == 0 or i == len(remaining) - 1:
+                print(f"  Progress: {success}/{total} downloaded, {failed} failed ({i+1}/{len(remaining)} this run)")
+
+    elapsed = time.perf_counter() - started
+    counts = policy.counts
     print(f"\n{'='*60}")
     print(f"INGESTION COMPLETE")
     print(f"  Success: {success}/{total}")
     print(f"  Failed: {failed}")
-    print(f"  Saved to: {RAW_DIR}")
+    print(f"  Requests: {counts['requests']} ({counts['retries']} retries, "
+          f"{counts['rate_limited']} rate limited, {counts['errors']} network errors)")
+    print(f"  Elapsed: {elapsed:.1f}s")
+    print(f"  Saved to: {out_dir}")
     print(f"{'='*60}")
 
 
@@ -0,0 +1,269 @@
+"""
+HTTP load test: replay realistic draft traffic against the API.
+
+Each virtual user loops over sessions drawn from a traffic mix:
+    draft   — team select, champion grid, then a full 20-step draft:
+              /recommend every step, /narrate-speak after every action,
+              /simulate after every pick (mirrors the Draft Board frontend)
+    browse  — meta, champion list/detail, team list/detail, patterns, matchup
+
+By default the app runs in-process over an ASGI transport with Gemini and
+edge-tts replaced by latency-simulating stubs, so it runs fully offline.
+Pass --url to hit a running server instead (narration then uses whatever
+that server is configured with).
+
+Reports throughput, p50/p95/p99 and error rate per route as a table and JSON.
+
+Usage:
+    cd backend
+    python -m scripts.load_test --users 20 --duration 30
+    python -m scripts.load_test --url http://localhost:8000 --users 50 --draft-ratio 0.7
+"""
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from draftmind.config import DATA_DIR
+from draftmind.core.draft_rules import DRAFT_SEQUENCE
+from scripts.benchmark_engine import summarize
+
+
+# ─── Offline stubs (in-process mode only) ─────────────────────
+
+def install_offline_stubs(llm_latency_ms: float, tts_latency_ms: float):
+    """Replace Gemini and edge-tts with stubs that only simulate latency."""
+    from draftmind.engine import narrator
+    from draftmind.api.endpoints import tts
+
+    class StubGemini:
+        def generate_content(self, prompt: str):
+            time.sleep(llm_latency_ms / 1000)  # blocking, like the real client
+            return SimpleNamespace(
+                text="A decisive move in this draft. Can the opponent answer it?\nTONE:analytical")
+
+    class StubCommunicate:
+        def __init__(self, text, voice, rate="+0%", pitch="+0Hz"):
+            self.text = text
+
+        async def stream(self):
+            await asyncio.sleep(tts_latency_ms / 1000)
+            for _ in range(4):
+                yield {"type": "audio", "data": b"\x00" * 4096}
+
+    stub_model = StubGemini()
+    narrator._get_model = lambda: stub_model
+    tts.edge_tts = SimpleNamespace(Communicate=StubCommunicate)
+
+
+# ─── Metrics ──────────────────────────────────────────────────
+
+class Recorder:
+    """Collects latency and status per route template."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    async def call(self, client: httpx.AsyncClient, method: str, route: str,
+                   url: str, **kwargs) -> httpx.Response | None:
+        start = time.perf_counter()
+        try:
+            resp = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.latencies[route].append((time.perf_counter() - start) * 1000)
+            self.errors[route] += 1
+            self.statuses[route][type(e).__name__] += 1
+            return None
+        self.latencies[route].append((time.perf_counter() - start) * 1000)
+        self.statuses[route][str(resp.status_code)] += 1
+        if resp.status_code >= 400:
+            self.errors[route] += 1
+            return None
+        return resp
+
+    def report(self, elapsed_s: float) -> dict:
+        routes = {}
+        for route, lat in sorted(self.latencies.items()):
+            stats = summarize(lat)
+            stats["rps"] = round(len(lat) / elapsed_s, 2)
+            stats["error_rate"] = round(self.errors[route] / len(lat), 4)
+            stats["statuses"] = dict(self.statuses[route])
+            routes[route] = stats
+        all_lat = [x for lat in self.latencies.values() for x in lat]
+        total = summarize(all_lat)
+        total["rps"] = round(len(all_lat) / elapsed_s, 2)
+        total["error_rate"] = round(sum(self.errors.values()) / max(len(all_lat), 1), 4)
+        return {"elapsed_s": round(elapsed_s, 2), "total": total, "routes": routes}
+
+
+# ─── Sessions ─────────────────────────────────────────────────
+
+class Catalog:
+    """Team and champion lists fetched once and shared by all users."""
+
+    def __init__(self, teams: list[dict], champions: list[str]):
+        self.teams = teams
+        self.champions = champions
+
+
+async def draft_session(client, rec: Recorder, catalog: Catalog, rng: random.Random):
+    await rec.call(client, "GET", "GET /api/teams", "/api/teams", params={"limit": 100})
+    await rec.call(client, "GET", "GET /api/champions", "/api/champions", params={"limit": 200})
+
+    blue, red = rng.sample(catalog.teams, 2)
+    actions: list[dict] = []
+    used: set[str] = set()
+    picks = {"blue": [], "red": []}
+    win_prob = None
+
+    for seq, action_type, side in DRAFT_SEQUENCE:
+        resp = await rec.call(client, "POST", "POST /api/draft/recommend", "/api/draft/recommend", json={
+            "current_actions": actions,
+            "blue_team_id": blue["team_id"],
+            "red_team_id": red["team_id"],
+            "next_action_sequence": seq,
+        })
+        recs = resp.json().get("recommendations", []) if resp else []
+        # Users usually follow a top-3 suggestion, sometimes go off-script
+        options = [r["champion_name"] for r in recs[:3] if r["champion_name"] not in used]
+        if not options or rng.random() < 0.3:
+            options = [c for c in catalog.champions if c not in used]
+        champ = rng.choice(options)
+        used.add(champ)
+        actions.append({"sequence_number": seq, "action_type": action_type,
+                        "team_side": side, "champion_name": champ})
+
+        if action_type == "pick":
+            picks[side].append(champ)
+            resp = await rec.call(client, "POST", "POST /api/draft/simulate", "/api/draft/simulate", json={
+                "blue_picks": picks["blue"], "red_picks": picks["red"],
+                "blue_team_id": blue["team_id"], "red_team_id": red["team_id"],
+            })
+            if resp:
+                win_prob = resp.json().get("blue_win_probability")
+
+        await rec.call(client, "POST", "POST /api/draft/narrate-speak", "/api/draft/narrate-speak", json={
+            "current_actions": actions,
+            "blue_team_id": blue["team_id"], "red_team_id": red["team_id"],
+            "blue_team_name": blue["team_name"], "red_team_name": red["team_name"],
+            "win_probability": win_prob,
+        })
+
+
+async def browse_session(client, rec: Recorder, catalog: Catalog, rng: random.Random):
+    await rec.call(client, "GET", "GET /api/meta", "/api/meta")
+    sort = rng.choice(["presence", "win_rate", "pick_rate", "ban_rate", "games_played", "name"])
+    await rec.call(client, "GET", "GET /api/champions", "/api/champions",
+                   params={"limit": 200, "sort": sort})
+    for champ in rng.sample(catalog.champions, 3):
+        await rec.call(client, "GET", "GET /api/champions/{name}", f"/api/champions/{champ}")
+    await rec.call(client, "GET", "GET /api/teams", "/api/teams", params={"limit": 100})
+    t1, t2 = rng.sample(catalog.teams, 2)
+    await rec.call(client, "GET", "GET /api/teams/{team_id}", f"/api/teams/{t1['team_id']}")
+    await rec.call(client, "GET", "GET /api/analysis/patterns/{team_id}",
+                   f"/api/analysis/patterns/{t1['team_id']}")
+    await rec.call(client, "GET", "GET /api/analysis/matchup", "/api/analysis/matchup",
+                   params={"team1": t1["team_id"], "team2": t2["team_id"]})
+
+
+async def virtual_user(uid: int, client, rec: Recorder, catalog: Catalog,
+                       deadline: float, draft_ratio: float, seed: int):
+    rng = random.Random(seed + uid)
+    while time.perf_counter() < deadline:
+        if rng.random() < draft_ratio:
+            await draft_session(client, rec, catalog, rng)
+        else:
+            await browse_session(client, rec, catalog, rng)
+
+
+async def run(args) -> dict:
+    if args.url:
+        transport = None
+        base_url = args.url.rstrip("/")
+    else:
+        from draftmind.main import app, load_runtime
+        from draftmind.api.cpu_pool import cpu_pool
+        load_runtime()
+        cpu_pool.start()
+        install_offline_stubs(args.llm_latency_ms, args.tts_latency_ms)
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        base_url = "http://loadtest"
+
+    limits = httpx.Limits(max_connections=args.users * 2, max_keepalive_connections=args.users * 2)
+    async with httpx.AsyncClient(transport=transport, base_url=base_url,
+                                 timeout=args.timeout, limits=limits) as client:
+        teams = (await client.get("/api/teams", params={"limit": 100})).json()
+        champions = [c["name"] for c in
+                     (await client.get("/api/champions", params={"limit": 200})).json()]
+        catalog = Catalog(teams, champions)
+
+        rec = Recorder()
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*[
+            virtual_user(uid, client, rec, catalog, deadline, args.draft_ratio, args.seed)
+            for uid in range(args.users)
+        ])
+        elapsed = time.perf_counter() - start
+
+    report = rec.report(elapsed)
+    report["config"] = {
+        "target": args.url or "in-process (ASGI, stubbed Gemini/edge-tts)",
+        "users": args.users,
+        "duration_s": args.duration,
+        "draft_ratio": args.draft_ratio,
+    }
+    return report
+
+
+def print_report(report: dict):
+    print(f"\n{'route':42s} {'reqs':>7s} {'rps':>8s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'err%':>6s}")
+    for route, s in report["routes"].items():
+        print(f"{route:42s} {s['count']:7d} {s['rps']:8.1f} {s['p50_ms']:9.1f} "
+              f"{s['p95_ms']:9.1f} {s['p99_ms']:9.1f} {s['error_rate'] * 100:6.2f}")
+    t = report["total"]
+    print(f"{'TOTAL':42s} {t['count']:7d} {t['rps']:8.1f} {t['p50_ms']:9.1f} "
+          f"{t['p95_ms']:9.1f} {t['p99_ms']:9.1f} {t['error_rate'] * 100:6.2f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay realistic draft traffic against the API")
+    parser.add_argument("--url", default="", help="target server; omit to run in-process")
+    parser.add_argument("--users", type=int, default=20, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to run")
+    parser.add_argument("--draft-ratio", type=float, default=0.6,
+                        help="fraction of sessions that are full drafts (rest browse)")
+    parser.add_argument("--llm-latency-ms", type=float, default=600.0)
+    parser.add_argument("--tts-latency-ms", type=float, default=400.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=DATA_DIR / "benchmarks" / "load_test.json")
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print(f"LOAD TEST — {args.users} users for {args.duration:.0f}s")
+    print("=" * 60)
+
+    report = asyncio.run(run(args))
+    print_report(report)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
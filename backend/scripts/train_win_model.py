@@ -14,6 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from draftmind.config import PROCESSED_DIR, MODEL_DIR
+from draftmind.data.pair_store import PairStore
 from draftmind.engine.feature_extraction import extract_features, FEATURE_NAMES
 
 
@@ -30,7 +31,7 @@ def main():
     # Load data
     db = load_json(PROCESSED_DIR / "draft_database.json")
     champion_stats = load_json(PROCESSED_DIR / "champion_stats.json")
-    champion_pairs = load_json(PROCESSED_DIR / "champion_pairs.json")
+    champion_pairs = PairStore.from_json(load_json(PROCESSED_DIR / "champion_pairs.json"))
     team_profiles = load_json(PROCESSED_DIR / "team_profiles.json")
 
     print(f"Loaded {db['total_games']} games from {db['total_series']} series")
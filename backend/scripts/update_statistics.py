@@ -0,0 +1,183 @@
+"""
+Fold new series into the processed statistics without a full rebuild.
+Input: data/processed/statistics_state.json and game_log.jsonl (written by
+       compute_statistics.py), new raw end-state files in data/raw/ or a
+       draft-database-format file (--series)
+Output: every file compute_statistics.py writes, plus draft_database.json
+
+New series are appended to the game log; the saved aggregator counts
+then absorb only the log lines past their recorded offset, so the
+statistics cost O(new games) however large the corpus. draft_database.json
+is rewritten as a text copy of the log (no parsing). Reload the API
+afterwards (POST /admin/reload).
+
+--verify folds the whole log from scratch and checks the saved state and
+every output against it; exits 1 on any difference.
+"""
+import sys
+import json
+import math
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from draftmind.config import PROCESSED_DIR, RAW_DIR
+from draftmind.data.game_store import (
+    GAME_LOG_FILE, STATE_FILE, GameLog, StatisticsState, write_json, write_outputs,
+)
+from scripts.build_draft_database import parse_series
+from scripts.compute_statistics import describe_output, write_manifest
+
+# Decayed counts are rounded when saved, so repeated saves drift by ~1e-6
+FLOAT_TOLERANCE = 1e-4
+MAX_REPORTED = 10
+
+
+def load_state() -> StatisticsState | None:
+    state_path = PROCESSED_DIR / STATE_FILE
+    if not state_path.exists():
+        return None
+    with open(state_path, "r", encoding="utf-8") as f:
+        return StatisticsState.from_json(json.load(f))
+
+
+def new_raw_series(known: set[str]) -> list[dict]:
+    """Parse raw end-state files whose series is not logged yet (unfinished ones are retried later)."""
+    tournaments = {}
+    tournaments_path = RAW_DIR / "tournaments.json"
+    if tournaments_path.exists():
+        with open(tournaments_path, "r", encoding="utf-8") as f:
+            tournaments = json.load(f)
+
+    found = []
+    for fp in sorted(RAW_DIR.glob("series_*.json")):
+        series_id = fp.stem.replace("series_", "")
+        if fp.name == "series_ids.json" or series_id in known:
+            continue
+        try:
+            with open(fp, "r", encoding="utf-8") as f:
+                result = parse_series(series_id, json.load(f))
+        except Exception as e:
+            print(f"  Error parsing {fp.name}: {e}")
+            continue
+        if result:
+            result["tournament"] = tournaments.get(series_id, {})
+            found.append(result)
+    return found
+
+
+def new_database_series(path: Path, known: set[str]) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        db = json.load(f)
+    found, seen = [], set(known)
+    for series in db.get("series", []):
+        if series.get("series_id", "") not in seen:
+            seen.add(series.get("series_id", ""))
+            found.append(series)
+    return found
+
+
+def mismatches(a, b, path: str = ""):
+    """Paths where two JSON values differ (floats compared with a tolerance)."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        if list(a) != list(b):
+            if set(a) != set(b):
+                yield f"{path}: keys differ ({sorted(set(a) ^ set(b))[:5]})"
+                return
+            yield f"{path}: key order differs"
+        for key in a:
+            yield from mismatches(a[key], b[key], f"{path}/{key}")
+    elif isinstance(a, list) and isinstance(b, list):
+        if len(a) != len(b):
+            yield f"{path}: length {len(a)} != {len(b)}"
+            return
+        for i, (x, y) in enumerate(zip(a, b)):
+            yield from mismatches(x, y, f"{path}[{i}]")
+    elif isinstance(a, float) or isinstance(b, float):
+        if not (isinstance(a, (int, float)) and isinstance(b, (int, float))
+                and math.isclose(a, b, rel_tol=FLOAT_TOLERANCE, abs_tol=FLOAT_TOLERANCE)):
+            yield f"{path}: {a!r} != {b!r}"
+    elif a != b:
+        yield f"{path}: {a!r} != {b!r}"
+
+
+def verify(state: StatisticsState, log: GameLog) -> bool:
+    print("Folding the whole game log from scratch...")
+    start = time.perf_counter()
+    full = StatisticsState()
+    full.catch_up(log)
+    print(f"  {len(full.series_ids)} series in {time.perf_counter() - start:.2f}s")
+
+    # Round-trip the full fold through JSON so both sides compare as saved state
+    checks = {
+        "state": (json.loads(json.dumps(state.to_json())), json.loads(json.dumps(full.to_json()))),
+        **{name: (ours, full_out) for (name, ours), full_out
+           in zip(state.outputs().items(), full.outputs().values())},
+    }
+    ok = True
+    for name, (incremental, recomputed) in checks.items():
+        diffs = []
+        for diff in mismatches(incremental, recomputed, name):
+            diffs.append(diff)
+            if len(diffs) >= MAX_REPORTED:
+                break
+        print(f"  {name:22s} {'OK' if not diffs else 'MISMATCH'}")
+        for diff in diffs:
+            print(f"    {diff}")
+        ok = ok and not diffs
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--series", type=Path, default=None,
+                        help="Draft-database-format JSON to take new series from (default: scan data/raw)")
+    parser.add_argument("--verify", action="store_true",
+                        help="Check the saved state against a full recompute of the game log")
+    args = parser.parse_args()
+
+    log = GameLog(PROCESSED_DIR / GAME_LOG_FILE)
+    state = load_state()
+    if state is None:
+        if args.verify or not log.path.exists():
+            sys.exit(f"ERROR: {STATE_FILE} not found. Run compute_statistics.py first.")
+        print(f"No {STATE_FILE}; folding the whole game log once")
+        state = StatisticsState()
+
+    if args.verify:
+        sys.exit(0 if verify(state, log) else 1)
+
+    start = time.perf_counter()
+    rebuilt = state.rebuild_stale(log)
+    if rebuilt:
+        print(f"Settings changed since the last run; refolded {', '.join(rebuilt)} "
+              "from the game log")
+    # Lines logged but not yet counted (first run, or an interrupted update)
+    folded = state.catch_up(log)
+    if args.series:
+        new = new_database_series(args.series, state.series_ids)
+    else:
+        new = new_raw_series(state.series_ids)
+    appended = log.append(new)
+    folded += state.catch_up(log)
+    if not folded and not rebuilt:
+        print(f"No new series ({len(state.series_ids)} logged); nothing to update")
+        return
+    print(f"Appended {appended} series to the log; folded {folded} into the statistics "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    outputs = state.outputs()
+    write_outputs(PROCESSED_DIR, outputs)
+    for name, data in outputs.items():
+        print(f"  {describe_output(name, data)} -> {PROCESSED_DIR / name}")
+    log.write_database(PROCESSED_DIR / "draft_database.json", state.database_header())
+    write_json(PROCESSED_DIR / STATE_FILE, state.to_json())
+    write_manifest(state, len(outputs["player_pools.json"]))
+    print(f"\nDone in {time.perf_counter() - start:.2f}s. "
+          "Reload the API to serve it (POST /admin/reload).")
+
+
+if __name__ == "__main__":
+    main()